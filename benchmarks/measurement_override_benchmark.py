@@ -0,0 +1,68 @@
+# Copyright 2024 Google Inc. All Rights Reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmarks overriding points of a large dimensioned measurement.
+
+Simulates a retry loop that re-measures a few points of a grid, with a UI
+refresh (a call to basetype_value()) after every override.  The cost per
+override should stay flat as the number of points grows.
+
+Run with:
+  PYTHONPATH=. python benchmarks/measurement_override_benchmark.py
+"""
+
+import logging
+import timeit
+
+from openhtf.core import measurements
+
+_SIZES = (1000, 10000, 100000)
+_OVERRIDES = 200
+
+
+def _grid(num_points, columnar):
+  measurement = measurements.Measurement('grid').with_dimensions('x', 'y')
+  if columnar:
+    measurement.with_columnar_storage()
+  measured_value = measurement.measured_value
+  for point in range(num_points):
+    measured_value[point // 100, point % 100] = float(point)
+  measured_value.basetype_value()
+  return measured_value
+
+
+def _override_and_refresh(measured_value, num_points):
+  for override in range(_OVERRIDES):
+    point = (override * 7919) % num_points
+    measured_value[point // 100, point % 100] = -1.0
+    measured_value.basetype_value()
+
+
+def main():
+  # Every override logs a warning, keep it out of the timings.
+  logging.getLogger(measurements.__name__).setLevel(logging.ERROR)
+  print('%-10s %-8s %s' % ('storage', 'points', 'us per override'))
+  for columnar in (False, True):
+    for num_points in _SIZES:
+      measured_value = _grid(num_points, columnar)
+      seconds = min(
+          timeit.repeat(
+              lambda: _override_and_refresh(measured_value, num_points),  # pylint: disable=cell-var-from-loop
+              number=1,
+              repeat=5))
+      print('%-10s %-8d %.1f' % ('columnar' if columnar else 'dict',
+                                 num_points, seconds / _OVERRIDES * 1e6))
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,91 @@
+# Copyright 2024 Google Inc. All Rights Reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmarks the cost of dispatching a call to a phase or monitor function.
+
+Calls PhaseDescriptor.__call__ directly, outside of any test, on functions that
+do nothing, so the time per call is the cost of binding their arguments: the
+test API, default values, with_args() values and plugs.  The monitor case
+times _MonitorThread.get_value(), which takes one sample of a monitor.
+
+Run with:
+  PYTHONPATH=. python benchmarks/phase_call_benchmark.py
+"""
+
+import timeit
+import types
+
+import openhtf
+from openhtf import plugs
+from openhtf.core import base_plugs
+from openhtf.core import monitors
+
+_CALLS = 100000
+
+
+class _Plug(base_plugs.BasePlug):
+  pass
+
+
+def _no_args():
+  pass
+
+
+def _test_api(test):
+  del test  # Unused.
+
+
+@plugs.plug(dut=_Plug)
+def _plugs_and_defaults(test, dut, level=1, retries=3):
+  del test, dut, level, retries  # Unused.
+
+
+def _kwargs(test, **kwargs):
+  del test, kwargs  # Unused.
+
+
+def _monitor(test, dut, level=1):
+  del test, dut, level  # Unused.
+
+
+def main():
+  plug_manager = plugs.PlugManager({_Plug})
+  plug_manager.initialize_plugs()
+  test_state = types.SimpleNamespace(
+      plug_manager=plug_manager, test_api=object())
+  cases = (
+      ('no args', openhtf.PhaseDescriptor.wrap_or_copy(_no_args)),
+      ('test api', openhtf.PhaseDescriptor.wrap_or_copy(_test_api)),
+      ('plugs', _plugs_and_defaults.with_args(level=2)),
+      ('kwargs', openhtf.PhaseDescriptor.wrap_or_copy(_kwargs).with_args(a=1)),
+  )
+  print('%-10s %s' % ('call', 'us per call'))
+  for name, phase in cases:
+    seconds = min(
+        timeit.repeat(
+            lambda: phase(test_state),  # pylint: disable=cell-var-from-loop
+            number=_CALLS,
+            repeat=5))
+    print('%-10s %.2f' % (name, seconds / _CALLS * 1e6))
+
+  monitor = plugs.plug(dut=_Plug)(_monitor)
+  monitor_thread = monitors._MonitorThread(  # pylint: disable=protected-access
+      'current', monitor, {'level': 2}, test_state, 0)
+  seconds = min(
+      timeit.repeat(monitor_thread.get_value, number=_CALLS, repeat=5))
+  print('%-10s %.2f' % ('monitor', seconds / _CALLS * 1e6))
+  plug_manager.tear_down_plugs()
+
+
+if __name__ == '__main__':
+  main()
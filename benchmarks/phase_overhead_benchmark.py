@@ -0,0 +1,66 @@
+# Copyright 2024 Google Inc. All Rights Reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmarks the framework overhead of running a phase.
+
+Runs tests made of phases that do nothing, so the time per phase is the cost
+of the phase executor: handing the phase to its thread, waiting for it to
+finish, and recording the result.  The phases that sleep show the latency
+added after a phase returns, if any, on top of the sleep itself.
+
+Run with:
+  PYTHONPATH=. python benchmarks/phase_overhead_benchmark.py
+"""
+
+import logging
+import time
+
+import openhtf
+from openhtf.util import configuration
+from openhtf.util import console_output
+
+CONF = configuration.CONF
+
+_NUM_PHASES = (100, 1000)
+_SLEEP_S = 0.001
+
+
+def _noop_phase():
+  pass
+
+
+def _sleep_phase():
+  time.sleep(_SLEEP_S)
+
+
+def _seconds_per_phase(phase, num_phases):
+  test = openhtf.Test(*[phase] * num_phases)
+  start = time.perf_counter()
+  test.execute()
+  return (time.perf_counter() - start) / num_phases
+
+
+def main():
+  logging.disable(logging.CRITICAL)
+  console_output.CLI_QUIET = True
+  CONF.load(capture_source=False)
+  print('%-8s %-8s %s' % ('phase', 'phases', 'us per phase'))
+  for name, phase, offset_s in (('noop', _noop_phase, 0),
+                                ('sleep', _sleep_phase, _SLEEP_S)):
+    for num_phases in _NUM_PHASES:
+      seconds = min(_seconds_per_phase(phase, num_phases) for _ in range(5))
+      print('%-8s %-8d %.1f' % (name, num_phases, (seconds - offset_s) * 1e6))
+
+
+if __name__ == '__main__':
+  main()
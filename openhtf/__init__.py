@@ -56,6 +56,7 @@ __all__ = (  # Expliclty export certain API components.
     'measures',
     # Public Classes.
     'BasePlug',
+    'PlugScope',
     'DiagnosesStore',
     'Diagnosis',
     'DiagnosisComponent',
@@ -69,6 +70,7 @@ __all__ = (  # Expliclty export certain API components.
     'DiagnosisCheckpoint',
     'DiagnosisCondition',
     'PhaseFailureCheckpoint',
+    'ParallelSequence',
     'PhaseSequence',
     'Subtest',
     'PhaseDescriptor',
@@ -88,6 +90,7 @@ __all__ = (  # Expliclty export certain API components.
 
 plug = plugs.plug
 BasePlug = openhtf.core.base_plugs.BasePlug
+PlugScope = openhtf.core.base_plugs.PlugScope
 
 DiagnosesStore = openhtf.core.diagnoses_lib.DiagnosesStore
 Diagnosis = openhtf.core.diagnoses_lib.Diagnosis
@@ -107,6 +110,7 @@ DiagnosisCheckpoint = openhtf.core.phase_branches.DiagnosisCheckpoint
 DiagnosisCondition = openhtf.core.phase_branches.DiagnosisCondition
 PhaseFailureCheckpoint = openhtf.core.phase_branches.PhaseFailureCheckpoint
 
+ParallelSequence = openhtf.core.phase_collections.ParallelSequence
 PhaseSequence = openhtf.core.phase_collections.PhaseSequence
 Subtest = openhtf.core.phase_collections.Subtest
 
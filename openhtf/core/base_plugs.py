@@ -93,8 +93,11 @@ Note that Plug constructors shouldn't take any other arguments; the
 framework won't pass any, so you'll get a TypeError.
 """
 
+import contextlib
+import enum
 import logging
-from typing import Any, Dict, Set, Text, Type, Union
+import threading
+from typing import Any, Dict, Iterator, Optional, Set, Text, Tuple, Type, Union
 
 import attr
 
@@ -107,6 +110,47 @@ class InvalidPlugError(Exception):
   """Raised when a plug declaration or requested name is invalid."""
 
 
+class _InitLogger(threading.local):
+  """Logger of the plug being instantiated by the current thread, if any."""
+  logger = None  # type: Optional[logging.Logger]
+
+
+_INIT_LOGGER = _InitLogger()
+
+
+class _PlugLogger(object):
+  """Default value of BasePlug.logger, until an instance sets its own.
+
+  Reads as the logger given to instantiation_logger() by the current thread, so
+  that several threads can instantiate the same plug type at once, each logging
+  from __init__ into the record of its own test.
+  """
+
+  def __get__(self, instance, owner) -> logging.Logger:
+    return _INIT_LOGGER.logger or _LOG
+
+
+@contextlib.contextmanager
+def instantiation_logger(logger: logging.Logger) -> Iterator[None]:
+  """Makes BasePlug.logger read as logger in the current thread."""
+  previous_logger = _INIT_LOGGER.logger
+  _INIT_LOGGER.logger = logger
+  try:
+    yield
+  finally:
+    _INIT_LOGGER.logger = previous_logger
+
+
+@enum.unique
+class PlugScope(enum.Enum):
+  """Lifetime of the instances of a plug type."""
+  # Instantiated for each test execution, and torn down at its end.
+  TEST = 'TEST'
+  # Instantiated by the first test execution using it, then reused by the next
+  # test executions of the station process, see plugs.tear_down_station_plugs.
+  STATION = 'STATION'
+
+
 class BasePlug(object):
   """All plug types must subclass this type.
 
@@ -135,10 +179,19 @@ class BasePlug(object):
   # plug without needing to use placeholder.  This will only affect the classes
   # that explicitly define this; subclasses do not share the declaration.
   auto_placeholder = False  # type: bool
-  # Default logger to be used only in __init__ of subclasses.
-  # This is overwritten both on the class and the instance so don't store
-  # a copy of it anywhere.
-  logger = _LOG  # type: logging.Logger
+  # Plug types that this plug uses, e.g. a DMM plug sharing the connection of
+  # a GPIB bus plug.  The PlugManager instantiates them before this plug and
+  # tears them down after it; plugs that do not depend on each other are
+  # instantiated and torn down concurrently.
+  requires = ()  # type: Tuple[Type[BasePlug], ...]
+  # Set to PlugScope.STATION in subclasses to keep instances across test
+  # executions, for plugs that are slow to connect.  See reset() and
+  # is_healthy().
+  scope = PlugScope.TEST  # type: PlugScope
+  # Default logger to be used only in __init__ of subclasses.  While a plug is
+  # instantiated this reads as the logger of the test instantiating it, and the
+  # instance is then given that logger, so don't store a copy of it anywhere.
+  logger = _PlugLogger()  # type: logging.Logger
 
   @util.classproperty
   def placeholder(cls) -> 'PlugPlaceholder':  # pylint: disable=no-self-argument
@@ -165,7 +218,27 @@ class BasePlug(object):
     return {}
 
   def tearDown(self) -> None:
-    """This method is called automatically at the end of each Test execution."""
+    """This method is called automatically at the end of each Test execution.
+
+    Station-scoped plugs are only torn down when the station is done, or when
+    they are found unhealthy.
+    """
+
+  def reset(self) -> None:
+    """Called before a station-scoped plug is reused by a new test execution.
+
+    Override this to bring the plug back to a known state for the next DUT,
+    without the cost of reconnecting.  If this raises, the plug is torn down and
+    instantiated again.
+    """
+
+  def is_healthy(self) -> bool:
+    """Returns whether a station-scoped plug can be reused.
+
+    Called before reset().  If this returns False or raises, e.g. because the
+    instrument was power cycled, the plug is torn down and instantiated again.
+    """
+    return True
 
   @classmethod
   def uses_base_tear_down(cls) -> bool:
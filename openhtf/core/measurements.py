@@ -58,16 +58,23 @@ Examples:
 
 """
 
+import array
 import collections
+from collections import abc
 import enum
 import functools
 import logging
+import math
+import mmap
+import struct
+import tempfile
 import typing
-from typing import Any, Callable, Dict, Iterator, List, Optional, Text, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Text, Tuple, Union
 
 import attr
 
 from openhtf import util
+from openhtf.util import configuration
 from openhtf.util import data
 from openhtf.util import units as util_units
 from openhtf.util import validators
@@ -81,6 +88,27 @@ try:
 except ImportError:
   pandas = None
 
+try:
+  # pylint: disable=g-import-not-at-top
+  import numpy  # pytype: disable=import-error
+  # pylint: enable=g-import-not-at-top
+except ImportError:
+  numpy = None
+
+CONF = configuration.CONF
+
+CONF.declare(
+    'measurement_spill_threshold_points',
+    default_value=None,
+    description='Dimensioned measurements holding more points than this are '
+    'moved to memory-mapped files under attachments_directory. None to keep '
+    'all points in memory.')
+CONF.declare(
+    'measurement_spill_threshold_bytes',
+    default_value=None,
+    description='Like measurement_spill_threshold_points, but for the size of '
+    'the points in typed columns, 8 bytes per dimension and value.')
+
 _LOG = logging.getLogger(__name__)
 
 
@@ -130,10 +158,18 @@ class _ConditionalValidator(object):
         validator=str(self.validator),
     )
 
+  def copy(self) -> '_ConditionalValidator':
+    """Returns a copy with its own copy of the validator, if it is mutable."""
+    validator = validators.copy_validator(self.validator)
+    if validator is self.validator:
+      return self
+    return _ConditionalValidator(self.result, validator)
+
   def with_args(self, **kwargs: Any) -> '_ConditionalValidator':
     if hasattr(self.validator, 'with_args'):
-      return _ConditionalValidator(self.result,
-                                   self.validator.with_args(**kwargs))
+      validator = self.validator.with_args(**kwargs)
+      if validator is not self.validator:
+        return _ConditionalValidator(self.result, validator)
     return self
 
 
@@ -178,6 +214,10 @@ class Measurement(object):
     units: UOM code of the units for the measurement being taken.
     dimensions: Tuple of UOM codes for units of dimensions.
     transform_fn: A function to apply to measurements as they are ingested.
+    vectorized_transform: If True, transform_fn accepts a whole numpy array of
+      values and is applied once per DimensionedMeasuredValue.extend() call.
+    columnar: If True, dimensioned values are stored in typed columns rather
+      than a dict keyed by coordinates; see with_columnar_storage().
     validators: List of callable validator objects to perform pass/fail checks.
     conditional_validators: List of _ConditionalValidator instances that are
       called when certain Diagnosis Results are present at the beginning of the
@@ -202,6 +242,8 @@ class Measurement(object):
   # validated, ordered by when they are used.
   _dimensions = attr.ib(type=Optional[Tuple['Dimension', ...]], default=None)
   _transform_fn = attr.ib(type=Optional[Callable[[Any], Any]], default=None)
+  _vectorized_transform = attr.ib(type=bool, default=False)
+  _columnar = attr.ib(type=bool, default=False)
   validators = attr.ib(type=List[Callable[[Any], bool]], factory=list)
   conditional_validators = attr.ib(
       type=List[_ConditionalValidator], factory=list)
@@ -231,7 +273,10 @@ class Measurement(object):
       self._measured_value = DimensionedMeasuredValue(
           name=self.name,
           num_dimensions=len(self.dimensions),
-          transform_fn=self.transform_fn)
+          transform_fn=self.transform_fn,
+          vectorized_transform=self._vectorized_transform,
+          columnar=self._columnar,
+          spill_threshold=_spill_threshold(len(self.dimensions)))
     else:
       self._measured_value = MeasuredValue(
           name=self.name, transform_fn=self.transform_fn)
@@ -245,6 +290,14 @@ class Measurement(object):
     self._dimensions = value
     self._initialize_value()
 
+  @property
+  def vectorized_transform(self) -> bool:
+    return self._vectorized_transform
+
+  @property
+  def columnar(self) -> bool:
+    return self._columnar
+
   @property
   def transform_fn(self) -> Optional[Callable[[Any], Any]]:
     return self._transform_fn
@@ -273,11 +326,15 @@ class Measurement(object):
     # TODO(arsharma) Add unit tests for unpickling operations.
     dimensions = state.pop('_dimensions')
     transform_fn = state.pop('_transform_fn', None)
+    vectorized_transform = state.pop('_vectorized_transform', False)
+    columnar = state.pop('_columnar', False)
 
     for name, value in state.items():
       setattr(self, name, value)
     setattr(self, '_dimensions', dimensions)
     setattr(self, '_transform_fn', transform_fn)
+    setattr(self, '_vectorized_transform', vectorized_transform)
+    setattr(self, '_columnar', columnar)
 
   def set_notification_callback(
       self, notification_cb: Optional[Callable[[], None]]) -> 'Measurement':
@@ -335,6 +392,24 @@ class Measurement(object):
     self._cached = None
     return self
 
+  def with_columnar_storage(self) -> 'Measurement':
+    """Store dimensioned values in typed columns, returns self for chaining.
+
+    Numeric coordinates and values are kept in compact `array.array` buffers
+    instead of an OrderedDict of coordinate tuples, which greatly reduces the
+    memory used by large sweeps.  A coordinate index is only built when a value
+    is looked up by its coordinates or when coordinates are not set in
+    increasing order, so that overridden values can be detected.
+
+    Returns:
+      This measurement, used for chaining operations.
+    """
+    self._columnar = True
+    if self.dimensions:
+      self._initialize_value()
+    self._cached = None
+    return self
+
   def with_validator(self, validator: Callable[[Any], bool]) -> 'Measurement':
     """Add a validator callback to this Measurement, chainable."""
     if not callable(validator):
@@ -375,12 +450,25 @@ class Measurement(object):
                       type(precision))
     return self.with_transform(functools.partial(round, ndigits=precision))
 
-  def with_transform(self, transform_fn: Callable[[Any], Any]) -> 'Measurement':
-    """Set the transform function."""
+  def with_transform(self,
+                     transform_fn: Callable[[Any], Any],
+                     vectorized: bool = False) -> 'Measurement':
+    """Set the transform function.
+
+    Args:
+      transform_fn: Function applied to each value as it is set.
+      vectorized: If True, transform_fn also accepts a numpy array and
+        transforms it elementwise, so values bulk-set from a numpy array with
+        DimensionedMeasuredValue.extend() are transformed in a single call.
+
+    Returns:
+      This measurement, used for chaining operations.
+    """
     if not callable(transform_fn):
       raise TypeError('Transform function must be callable.')
     if self.transform_fn:
       raise ValueError('Transform function may only be set once.')
+    self._vectorized_transform = vectorized
     self.transform_fn = transform_fn
     return self
 
@@ -393,15 +481,49 @@ class Measurement(object):
     new_conditional_validators = [
         cv.with_args(**kwargs) for cv in self.conditional_validators
     ]
-    return data.attr_copy(
-        self,
+    return self.copy_declaration(
         name=util.format_string(self.name, kwargs),
         docstring=util.format_string(self.docstring, kwargs),
         validators=new_validators,
         conditional_validators=new_conditional_validators,
-        cached=None,
     )
 
+  def copy_declaration(self, **overrides: Any) -> 'Measurement':
+    """Copies this measurement's declaration, without any value or outcome.
+
+    Declarations are shared rather than deep-copied: units, dimensions and
+    transform function of the copy are the same objects, and so are the
+    built-in validators, which are immutable.  Other validators are deep-copied,
+    as they may keep state, see validators.copy_validator().  Parametrized
+    phases and each run of a phase thus mostly allocate a new Measurement and a
+    new, unset measured value.
+
+    Args:
+      **overrides: Fields to set on the copy instead, by attrs init name.
+
+    Returns:
+      A new Measurement.
+    """
+    kwargs = dict(
+        name=self.name,
+        docstring=self.docstring,
+        units=self.units,
+        dimensions=self._dimensions,
+        transform_fn=self._transform_fn,
+        vectorized_transform=self._vectorized_transform,
+        columnar=self._columnar,
+        validators=self.validators,
+        conditional_validators=self.conditional_validators,
+    )
+    kwargs.update(overrides)
+    kwargs['validators'] = [
+        validators.copy_validator(v) for v in kwargs['validators']
+    ]
+    kwargs['conditional_validators'] = [
+        cv.copy() for cv in kwargs['conditional_validators']
+    ]
+    return Measurement(**kwargs)
+
   def __getattr__(self, name: Text) -> Any:
     """Support our default set of validators as direct attributes."""
     # Don't provide a back door to validators.py private stuff accidentally.
@@ -416,17 +538,58 @@ class Measurement(object):
 
     return _with_validator
 
+  def _measured_value_array(self) -> Any:
+    """Returns the measured values as a numpy array if they are array-backed.
+
+    These are the value column of a columnar dimensioned measurement, or the
+    value of an undimensioned measurement that was set to a 1-D numpy array.
+    Otherwise, None is returned.
+    """
+    if numpy is None or not self._measured_value.is_value_set:
+      return None
+    if isinstance(self._measured_value, DimensionedMeasuredValue):
+      if isinstance(self._measured_value.value_dict, _ColumnarValueDict):
+        return self._measured_value.value_dict.value_column.to_array()
+      return None
+    value = self._measured_value.value
+    if isinstance(value, numpy.ndarray) and value.ndim == 1:
+      return value
+    return None
+
+  def _run_validator(self, validator: Callable[[Any], bool],
+                     get_values: Callable[[], Any]) -> bool:
+    """Runs a validator, preferring its array protocol when possible."""
+    if hasattr(validator, 'validate_array'):
+      values = get_values()
+      if values is not None:
+        result = validator.validate_array(values)
+        if result is not NotImplemented:
+          return result
+    return validator(self._measured_value.value)
+
+  def _is_marginal(self, validator: Callable[[Any], bool],
+                   get_values: Callable[[], Any]) -> bool:
+    """Checks marginality, preferring the array protocol when possible."""
+    if hasattr(validator, 'is_marginal_array'):
+      values = get_values()
+      if values is not None:
+        result = validator.is_marginal_array(values)
+        if result is not NotImplemented:
+          return result
+    return (hasattr(validator, 'is_marginal') and
+            validator.is_marginal(self._measured_value.value))
+
   def validate(self) -> 'Measurement':
     """Validate this measurement and update 'outcome' and 'marginal' fields."""
     # PASS if all our validators return True, otherwise FAIL.
     try:
-      if all(v(self._measured_value.value) for v in self.validators):
+      # Only converted once a validator supporting arrays is reached.
+      get_values = functools.lru_cache(maxsize=None)(self._measured_value_array)
+      if all(self._run_validator(v, get_values) for v in self.validators):
         self.outcome = Outcome.PASS
 
         # Only check marginality for passing measurements.
-        if any(
-            hasattr(v, 'is_marginal') and
-            v.is_marginal(self._measured_value.value) for v in self.validators):
+        if any(self._is_marginal(v, get_values) for v in self.validators):
           self.marginal = True
       else:
         self.outcome = Outcome.FAIL
@@ -440,8 +603,16 @@ class Measurement(object):
       if self._cached:
         self._cached['outcome'] = self.outcome.name  # pytype: disable=bad-return-type
 
-  def as_base_types(self) -> Dict[Text, Any]:
-    """Convert this measurement to a dict of basic types."""
+  def as_base_types(self, summary_only: bool = False) -> Dict[Text, Any]:
+    """Convert this measurement to a dict of basic types.
+
+    Args:
+      summary_only: If True, the values of a dimensioned measurement are
+        replaced by their summary statistics under 'measured_value_summary'.
+
+    Returns:
+      A dict of the measurement fields, and of the measured value if set.
+    """
     if not self._cached:
       # Create the single cache file the first time this is called.
       self._cached = {
@@ -460,8 +631,23 @@ class Measurement(object):
         self._cached['units'] = data.convert_to_base_types(self.units)
       if self.docstring:
         self._cached['docstring'] = self.docstring
-    if self._measured_value.is_value_set:
-      self._cached['measured_value'] = self._measured_value.basetype_value()
+    if not self._measured_value.is_value_set:
+      return self._cached
+    if summary_only and isinstance(self._measured_value,
+                                   DimensionedMeasuredValue):
+      summary = dict(self._cached)
+      summary.pop('measured_value', None)
+      summary['measured_value_summary'] = self._measured_value.summary
+      return summary
+    if (isinstance(self._measured_value, DimensionedMeasuredValue) and
+        self._measured_value.is_spilled):
+      # Spilled points are converted for this call only, rather than pinned in
+      # memory by the cache.
+      self._cached.pop('measured_value', None)
+      as_dict = dict(self._cached)
+      as_dict['measured_value'] = self._measured_value.basetype_value()
+      return as_dict
+    self._cached['measured_value'] = self._measured_value.basetype_value()
     return self._cached
 
   def to_dataframe(self, columns: Any = None) -> Any:
@@ -619,6 +805,653 @@ class Dimension(object):
     return self._cached_dict
 
 
+_INTEGER_TYPES = (int,) + ((numpy.integer,) if numpy else ())
+_FLOAT_TYPES = (float,) + ((numpy.floating,) if numpy else ())
+# Largest magnitude up to which every integer is exactly representable as a
+# float.
+_MAX_EXACT_FLOAT_INT = 2**53
+# Typecodes of the values that an array.array returns unchanged.
+_EXACT_TYPECODES = {int: 'q', float: 'd'}
+
+
+def _spill_threshold(num_dimensions: int) -> Optional[int]:
+  """Returns the configured number of points above which values spill."""
+  thresholds = []
+  if CONF.measurement_spill_threshold_points is not None:
+    thresholds.append(CONF.measurement_spill_threshold_points)
+  if CONF.measurement_spill_threshold_bytes is not None:
+    thresholds.append(CONF.measurement_spill_threshold_bytes //
+                      (8 * (num_dimensions + 1)))
+  return min(thresholds) if thresholds else None
+
+
+def _column_typecode(value: Any, exact: bool = False) -> Optional[Text]:
+  """Returns the array typecode that can hold value, or None if there is none.
+
+  Args:
+    value: The value to store.
+    exact: Only return a typecode for values that are read back from the array
+      with the same type, that is Python ints and floats.
+  """
+  if exact:
+    return _EXACT_TYPECODES.get(type(value))
+  if isinstance(value, bool):
+    return None
+  if isinstance(value, _INTEGER_TYPES):
+    return 'q'
+  if isinstance(value, _FLOAT_TYPES):
+    return 'd'
+  return None
+
+
+def _array_typecode(values: Any) -> Optional[Text]:
+  """Returns the array typecode a numpy array can be copied to in bulk."""
+  if numpy is None or not isinstance(values, numpy.ndarray):
+    return None
+  if values.dtype.kind == 'f' and values.dtype.itemsize <= 8:
+    return 'd'
+  if values.dtype.kind == 'i' or (
+      values.dtype.kind == 'u' and
+      (values.dtype.itemsize < 8 or not values.size or
+       values.max() <= numpy.iinfo(numpy.int64).max)):
+    return 'q'
+  return None
+
+
+class _MappedArray(object):
+  """An append-only typed array stored in a file and read through mmap.
+
+  The file is an anonymous temporary file, removed when the array is garbage
+  collected.  Appends are buffered writes to the end of the file; reads map
+  the file again when it has grown, so only the pages being read are resident.
+  Copying or pickling a _MappedArray yields an in-memory `array.array`.
+  """
+
+  __slots__ = ('_struct', '_typecode', '_file', '_len', '_view', '_view_len',
+               'directory')
+
+  def __init__(self, values: array.array, directory: Optional[Text]) -> None:
+    self._typecode = values.typecode
+    self._struct = struct.Struct(values.typecode)
+    self._file = tempfile.TemporaryFile(dir=directory)
+    self._file.write(values.tobytes())
+    self._len = len(values)
+    self._view = None  # type: Optional[memoryview]
+    self._view_len = 0
+    self.directory = directory
+
+  @property
+  def typecode(self) -> Text:
+    return self._typecode
+
+  def __len__(self) -> int:
+    return self._len
+
+  def _mapped(self) -> memoryview:
+    """Returns a memoryview of the whole file, mapping it again if needed."""
+    if self._view is None or self._view_len != self._len:
+      if not self._len:
+        return memoryview(array.array(self._typecode))
+      self._file.flush()
+      self._view = memoryview(
+          mmap.mmap(
+              self._file.fileno(),
+              self._len * self._struct.size,
+              access=mmap.ACCESS_WRITE)).cast(self._typecode)
+      self._view_len = self._len
+    return self._view
+
+  def __iter__(self) -> Iterator[Any]:
+    return iter(self._mapped())
+
+  def __getitem__(self, key: Union[int, slice]) -> Any:
+    return self._mapped()[key]
+
+  def __setitem__(self, row: int, value: Any) -> None:
+    try:
+      self._mapped()[row] = value
+    except ValueError as e:
+      raise OverflowError(str(e))
+
+  def append(self, value: Any) -> None:
+    try:
+      self._file.write(self._struct.pack(value))
+    except struct.error as e:
+      raise OverflowError(str(e))
+    self._len += 1
+
+  def frombytes(self, buffer: bytes) -> None:
+    self._file.write(buffer)
+    self._len += len(buffer) // self._struct.size
+
+  def tobytes(self) -> bytes:
+    return self._mapped().tobytes()
+
+  def tolist(self) -> List[Any]:
+    return self._mapped().tolist()
+
+  def __array__(self, dtype: Any = None, copy: Any = None) -> Any:
+    del copy  # A copy is always made, the mapping must stay writable.
+    return numpy.array(self._mapped(), dtype=dtype)
+
+  def __reduce__(self) -> Any:
+    return array.array, (self._typecode, self.tobytes())
+
+
+# Storage of a _Column with a typecode.
+_TYPED_STORAGE = (array.array, _MappedArray)
+
+
+class _Column(object):
+  """An append-only column of values used by _ColumnarValueDict.
+
+  The column is backed by a typed `array.array` as long as every value it holds
+  fits the typecode inferred from the first value.  Integers and floats may be
+  mixed, in which case the column holds floats, as numpy would.  Anything else,
+  such as a string or a value that overflows the array, demotes the column to a
+  list so that values are returned unchanged.
+
+  With exact_types, only Python ints and floats are stored in typed arrays, and
+  integers and floats are not mixed, so that every value is returned with the
+  type it was set with.
+
+  Typed columns can be spilled to a _MappedArray, which keeps the same
+  interface; demoting or promoting a spilled column loads it back in memory
+  first.
+  """
+
+  __slots__ = ('_values', '_exact_types')
+
+  def __init__(self, exact_types: bool = False) -> None:
+    self._values = None  # type: Optional[Union[array.array, List[Any]]]
+    self._exact_types = exact_types
+
+  def __len__(self) -> int:
+    return len(self._values) if self._values is not None else 0
+
+  def __iter__(self) -> Iterator[Any]:
+    return iter(self._values if self._values is not None else ())
+
+  def __getitem__(self, row: int) -> Any:
+    return self._values[row]
+
+  def __setitem__(self, row: int, value: Any) -> None:
+    if self._accepts(value):
+      try:
+        self._values[row] = value
+        return
+      except OverflowError:
+        pass
+    self._demote()
+    self._values[row] = value
+
+  def __delitem__(self, row: int) -> None:
+    if self.is_spilled:
+      self._values = array.array(self._values.typecode, self._values.tobytes())
+    del self._values[row]
+
+  @property
+  def typecode(self) -> Optional[Text]:
+    """The array typecode backing this column, or None for a list column."""
+    if isinstance(self._values, _TYPED_STORAGE):
+      return self._values.typecode
+    return None
+
+  @property
+  def is_spilled(self) -> bool:
+    return isinstance(self._values, _MappedArray)
+
+  def spill(self, directory: Optional[Text]) -> None:
+    """Moves a typed column to a file in directory, list columns stay."""
+    if isinstance(self._values, array.array):
+      self._values = _MappedArray(self._values, directory)
+
+  def _accepts(self, value: Any) -> bool:
+    """Returns whether the array can hold value, promoting ints to floats."""
+    if not isinstance(self._values, _TYPED_STORAGE):
+      return False
+    typecode = _column_typecode(value, self._exact_types)
+    if typecode == self._values.typecode:
+      return True
+    if self._exact_types:
+      return False
+    if typecode == 'q' and self._values.typecode == 'd':
+      return abs(value) <= _MAX_EXACT_FLOAT_INT
+    if typecode == 'd' and self._values.typecode == 'q':
+      if all(abs(v) <= _MAX_EXACT_FLOAT_INT for v in self._values):
+        if self.is_spilled:
+          self._values = _MappedArray(
+              array.array('d', self._values), self._values.directory)
+        else:
+          self._values = array.array('d', self._values)
+        return True
+    return False
+
+  def _demote(self) -> None:
+    if isinstance(self._values, _TYPED_STORAGE):
+      self._values = self._values.tolist()
+
+  def append(self, value: Any) -> None:
+    if self._values is None:
+      typecode = _column_typecode(value, self._exact_types)
+      self._values = array.array(typecode) if typecode else []
+    if self._accepts(value):
+      try:
+        self._values.append(value)
+        return
+      except OverflowError:
+        pass
+    self._demote()
+    self._values.append(value)
+
+  def extend(self, values: Any) -> None:
+    """Appends all values, copying numpy arrays into the buffer in bulk."""
+    typecode = _array_typecode(values)
+    if typecode is not None:
+      if self._values is None:
+        self._values = array.array(typecode)
+      if (isinstance(self._values, _TYPED_STORAGE) and
+          self._values.typecode == typecode):
+        self._values.frombytes(values.astype(typecode, copy=False).tobytes())
+        return
+    if numpy is not None and isinstance(values, numpy.ndarray):
+      values = values.tolist()
+    for value in values:
+      self.append(value)
+
+  def slice(self, start: int = 0) -> Sequence[Any]:
+    """Returns the values from row start onwards."""
+    if self._values is None:
+      return ()
+    return self._values[start:] if start else self._values
+
+  def basetype_values(self, start: int = 0) -> List[Any]:
+    """Returns the values from row start onwards converted to base types."""
+    values = self.slice(start)
+    typecode = self.typecode
+    if typecode == 'q':
+      return values.tolist()
+    if typecode == 'd':
+      return [value if math.isfinite(value) else str(value) for value in values]
+    return [data.convert_to_base_types(value) for value in values]
+
+  def basetype_value(self, row: int) -> Any:
+    """Returns the value at row converted to base types."""
+    value = self._values[row]
+    if self.typecode == 'q':
+      return value
+    if self.typecode == 'd':
+      return value if math.isfinite(value) else str(value)
+    return data.convert_to_base_types(value)
+
+  def to_array(self) -> Any:
+    """Returns the values as a numpy array if available, else as a sequence."""
+    if numpy is None:
+      return self._values if self._values is not None else []
+    if self.typecode is not None:
+      # Copy so that the array buffer is not pinned by the numpy view, which
+      # would otherwise prevent further appends.
+      return numpy.array(self._values)
+    return numpy.array(self._values, dtype=object)
+
+
+class _ColumnarItemsView(abc.ItemsView):
+  """Items view that reads straight from the columns."""
+
+  def __iter__(self) -> Iterator[Tuple[Tuple[Any, ...], Any]]:
+    return zip(iter(self._mapping), self._mapping.value_column)
+
+
+class _ColumnarValuesView(abc.ValuesView):
+  """Values view that reads straight from the value column."""
+
+  def __iter__(self) -> Iterator[Any]:
+    return iter(self._mapping.value_column)
+
+
+class _ColumnarValueDict(abc.MutableMapping):
+  """Ordered mapping of coordinate tuples to values, stored by column.
+
+  Each dimension and the measured values are held in their own _Column, so a
+  point costs a few bytes per column instead of a tuple, a dict entry and boxed
+  numbers.  A coordinate -> row index is only built when needed: lookups by
+  coordinates need one, and so does detecting overridden coordinates once they
+  stop arriving in strictly increasing order.  While coordinates keep
+  increasing, which is the common case for sweeps, every new point is known to
+  be unique without an index.
+
+  With exact_types, the columns return every coordinate and value with the
+  type it was set with, see _Column.
+  """
+
+  __slots__ = ('_num_dimensions', '_coordinate_columns', '_value_column',
+               '_index', '_last_coordinates')
+
+  def __init__(self,
+               num_dimensions: int,
+               items: Any = (),
+               exact_types: bool = False) -> None:
+    self._num_dimensions = num_dimensions
+    self._coordinate_columns = tuple(
+        _Column(exact_types) for _ in range(num_dimensions))
+    self._value_column = _Column(exact_types)
+    self._index = None  # type: Optional[Dict[Tuple[Any, ...], int]]
+    self._last_coordinates = None  # type: Optional[Tuple[Any, ...]]
+    for coordinates, value in items:
+      self[coordinates] = value
+
+  @property
+  def coordinate_columns(self) -> Tuple[_Column, ...]:
+    return self._coordinate_columns
+
+  @property
+  def is_spilled(self) -> bool:
+    return self._value_column.is_spilled or any(
+        column.is_spilled for column in self._coordinate_columns)
+
+  def spill(self, directory: Optional[Text]) -> None:
+    """Moves the typed columns to memory-mapped files in directory."""
+    for column in self._coordinate_columns + (self._value_column,):
+      column.spill(directory)
+
+  @property
+  def value_column(self) -> _Column:
+    return self._value_column
+
+  @property
+  def typecodes(self) -> Tuple[Optional[Text], ...]:
+    """The typecode of each coordinate column, then of the value column."""
+    return tuple(column.typecode for column in self._coordinate_columns +
+                 (self._value_column,))
+
+  def __len__(self) -> int:
+    return len(self._value_column)
+
+  def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+    return zip(*self._coordinate_columns)
+
+  def _build_index(self) -> Dict[Tuple[Any, ...], int]:
+    if self._index is None:
+      self._index = {
+          coordinates: row for row, coordinates in enumerate(iter(self))
+      }
+    return self._index
+
+  def row_of(self, coordinates: Tuple[Any, ...]) -> Optional[int]:
+    """Returns the row holding coordinates, or None if they are not set."""
+    hash(coordinates)  # Raise TypeError early for mutable coordinates.
+    if self._index is None:
+      try:
+        if (self._last_coordinates is None or
+            coordinates > self._last_coordinates):
+          return None
+      except TypeError:
+        pass  # Coordinates are not orderable, fall back to the index.
+    return self._build_index().get(coordinates)
+
+  def __getitem__(self, coordinates: Tuple[Any, ...]) -> Any:
+    row = self._build_index().get(coordinates)
+    if row is None:
+      raise KeyError(coordinates)
+    return self._value_column[row]
+
+  def __setitem__(self, coordinates: Tuple[Any, ...], value: Any) -> None:
+    row = self.row_of(coordinates)
+    if row is not None:
+      self._value_column[row] = value
+      return
+    if self._index is not None:
+      self._index[coordinates] = len(self)
+    else:
+      self._last_coordinates = coordinates
+    for column, coordinate in zip(self._coordinate_columns, coordinates):
+      column.append(coordinate)
+    self._value_column.append(value)
+
+  def _increases_from_last(self, coordinate_columns: Sequence[Any]) -> bool:
+    """Returns whether new coordinates strictly increase after the last row."""
+    try:
+      column = coordinate_columns[0]
+      if (self._num_dimensions == 1 and _array_typecode(column) is not None):
+        return bool(
+            (self._last_coordinates is None or
+             (column[0],) > self._last_coordinates) and
+            numpy.all(column[1:] > column[:-1]))
+      previous = self._last_coordinates
+      for coordinates in zip(*coordinate_columns):
+        if previous is not None and not coordinates > previous:
+          return False
+        previous = coordinates
+      return True
+    except TypeError:
+      return False
+
+  def extend(self,
+             coordinate_columns: Sequence[Any],
+             values: Any,
+             on_override: Optional[Callable[[Any], None]] = None) -> int:
+    """Sets a value for each row of the coordinate columns.
+
+    When the index has not been built yet and the new coordinates keep
+    increasing, the columns are extended in bulk.
+
+    Args:
+      coordinate_columns: One sequence or numpy array per dimension.
+      values: Sequence or numpy array of values, one per row.
+      on_override: Optional function called with each value being overridden.
+
+    Returns:
+      The number of rows that overrode a previously set value.
+    """
+    if not len(values):
+      return 0
+    if self._index is None and self._increases_from_last(coordinate_columns):
+      for column, new_coordinates in zip(self._coordinate_columns,
+                                         coordinate_columns):
+        column.extend(new_coordinates)
+      self._value_column.extend(values)
+      self._last_coordinates = tuple(
+          column[-1] for column in self._coordinate_columns)
+      return 0
+    if numpy is not None:
+      coordinate_columns = [
+          column.tolist() if isinstance(column, numpy.ndarray) else column
+          for column in coordinate_columns
+      ]
+      if isinstance(values, numpy.ndarray):
+        values = values.tolist()
+    overridden = 0
+    for coordinates, value in zip(zip(*coordinate_columns), values):
+      row = self.row_of(coordinates)
+      if row is not None:
+        overridden += 1
+        if on_override:
+          on_override(self._value_column[row])
+      self[coordinates] = value
+    return overridden
+
+  def __delitem__(self, coordinates: Tuple[Any, ...]) -> None:
+    row = self._build_index()[coordinates]
+    for column in self._coordinate_columns + (self._value_column,):
+      del column[row]
+    # Rows after the deleted one have moved, so renumber the index.
+    self._index = None
+    self._build_index()
+
+  def items(self) -> _ColumnarItemsView:
+    return _ColumnarItemsView(self)
+
+  def values(self) -> _ColumnarValuesView:
+    return _ColumnarValuesView(self)
+
+  def rows(self, start: int = 0) -> List[Tuple[Any, ...]]:
+    """Returns (coordinates..., value) tuples in insertion order from start."""
+    return list(
+        zip(*(column.slice(start)
+              for column in self._coordinate_columns + (self._value_column,))))
+
+  def basetype_rows(self, start: int = 0) -> List[Tuple[Any, ...]]:
+    """Returns rows() with every element converted to base types."""
+    return list(
+        zip(*(column.basetype_values(start)
+              for column in self._coordinate_columns + (self._value_column,))))
+
+  def basetype_row(self, row: int) -> Tuple[Any, ...]:
+    """Returns a single row of basetype_rows()."""
+    return tuple(
+        column.basetype_value(row)
+        for column in self._coordinate_columns + (self._value_column,))
+
+  def __repr__(self) -> Text:
+    return '%s(%r)' % (type(self).__name__, dict(self.items()))
+
+
+def _is_summarized(value: Any) -> bool:
+  """Returns whether value is a finite real number included in statistics."""
+  return (isinstance(value, _INTEGER_TYPES + _FLOAT_TYPES) and
+          not isinstance(value, bool) and math.isfinite(value))
+
+
+def _extent_of(column: Any) -> Optional[Tuple[Any, Any]]:
+  """Returns the (min, max) of a column, or None if it is not orderable."""
+  try:
+    if (numpy is not None and isinstance(column, numpy.ndarray) and
+        column.dtype.kind in 'iuf'):
+      return column.min().item(), column.max().item()
+    return min(column), max(column)
+  except (TypeError, ValueError):
+    return None
+
+
+@attr.s(slots=True)
+class _OnlineSummary(object):
+  """Statistics of dimensioned values, updated as values are set.
+
+  Mean and variance use Welford's online algorithm, and Chan's parallel
+  combination for bulk updates.  Only finite real numbers are included in the
+  statistics, but every point is counted.  Overriding a value removes the old
+  one from the mean and variance; if it was the minimum or maximum, those are
+  recomputed from the stored values the next time they are needed.
+  """
+
+  count = attr.ib(type=int, default=0)
+  numeric_count = attr.ib(type=int, default=0)
+  mean = attr.ib(type=float, default=0.0)
+  m2 = attr.ib(type=float, default=0.0)
+  minimum = attr.ib(type=Any, default=None)
+  maximum = attr.ib(type=Any, default=None)
+  last = attr.ib(type=Any, default=None)
+  # [min, max] of each dimension, None for a dimension that is not orderable.
+  extents = attr.ib(type=List[Optional[List[Any]]], factory=list)
+  extremes_stale = attr.ib(type=bool, default=False)
+
+  def _add_extent(self, dimension: int, low: Any, high: Any) -> None:
+    if len(self.extents) <= dimension:
+      self.extents.append([low, high])
+      return
+    extent = self.extents[dimension]
+    if extent is None:
+      return
+    try:
+      if low < extent[0]:
+        extent[0] = low
+      if high > extent[1]:
+        extent[1] = high
+    except TypeError:
+      self.extents[dimension] = None
+
+  def _add_moments(self, count: int, mean: float, m2: float) -> None:
+    total = self.numeric_count + count
+    delta = mean - self.mean
+    self.mean += delta * count / total
+    self.m2 += m2 + delta * delta * self.numeric_count * count / total
+    self.numeric_count = total
+
+  def _add_extremes(self, low: Any, high: Any) -> None:
+    if self.extremes_stale:
+      return
+    if self.minimum is None or low < self.minimum:
+      self.minimum = low
+    if self.maximum is None or high > self.maximum:
+      self.maximum = high
+
+  def add(self, coordinates: Tuple[Any, ...], value: Any) -> None:
+    """Adds a point."""
+    self.count += 1
+    self.last = value
+    for dimension, coordinate in enumerate(coordinates):
+      self._add_extent(dimension, coordinate, coordinate)
+    if _is_summarized(value):
+      self.numeric_count += 1
+      delta = float(value) - self.mean
+      self.mean += delta / self.numeric_count
+      self.m2 += delta * (float(value) - self.mean)
+      self._add_extremes(value, value)
+
+  def add_many(self, coordinate_columns: Sequence[Any], values: Any) -> None:
+    """Adds a point per row, with vectorized statistics for numpy arrays."""
+    if not (numpy is not None and isinstance(values, numpy.ndarray) and
+            values.dtype.kind in 'iuf'):
+      for coordinates, value in zip(zip(*coordinate_columns), values):
+        self.add(coordinates, value)
+      return
+    self.count += len(values)
+    self.last = values[-1].item()
+    for dimension, column in enumerate(coordinate_columns):
+      extent = _extent_of(column)
+      if extent is None:
+        if len(self.extents) <= dimension:
+          self.extents.append(None)
+        else:
+          self.extents[dimension] = None
+      else:
+        self._add_extent(dimension, *extent)
+    if values.dtype.kind == 'f':
+      values = values[numpy.isfinite(values)]
+    if values.size:
+      mean = float(values.mean())
+      self._add_moments(values.size, mean,
+                        float(numpy.square(values - mean).sum()))
+      self._add_extremes(values.min().item(), values.max().item())
+
+  def discard(self, value: Any) -> None:
+    """Removes a value that is being overridden."""
+    self.count -= 1
+    if not _is_summarized(value):
+      return
+    if self.numeric_count == 1:
+      self.numeric_count, self.mean, self.m2 = 0, 0.0, 0.0
+    else:
+      self.numeric_count -= 1
+      delta = float(value) - self.mean
+      self.mean -= delta / self.numeric_count
+      self.m2 = max(0.0, self.m2 - delta * (float(value) - self.mean))
+    if value == self.minimum or value == self.maximum:
+      self.extremes_stale = True
+
+  def recompute_extremes(self, values: Iterator[Any]) -> None:
+    self.minimum = self.maximum = None
+    self.extremes_stale = False
+    for value in values:
+      if _is_summarized(value):
+        self._add_extremes(value, value)
+
+  def as_base_types(self) -> Dict[Text, Any]:
+    summary = {
+        'count': self.count,
+        'last': data.convert_to_base_types(self.last),
+        'dimension_extents': data.convert_to_base_types(self.extents),
+    }
+    if self.numeric_count:
+      summary.update(
+          mean=self.mean,
+          variance=self.m2 / self.numeric_count,
+          min=data.convert_to_base_types(self.minimum),
+          max=data.convert_to_base_types(self.maximum),
+      )
+    return summary
+
+
 @attr.s(slots=True)
 class DimensionedMeasuredValue(object):
   """Class encapsulating actual values measured.
@@ -630,9 +1463,32 @@ class DimensionedMeasuredValue(object):
 
   The _cached_basetype_values is a cached list of the dimensioned entries in
   order of being set.  Each list entry is a tuple that is composed of the key,
-  then the value.  This is set to None if a previous measurement is overridden;
-  in such a case, the list is fully reconstructed on the next call to
-  basetype_value.
+  then the value.  When a previous measurement is overridden, only its entry is
+  replaced, found through _cached_basetype_positions, a coordinates -> position
+  index that is built the first time a measurement is overridden.  Columnar
+  storage uses the row index of the value_dict instead.  If the cache is None,
+  it is fully reconstructed on the next call to basetype_value.
+
+  Values are set by one thread at a time, usually the phase thread, which is
+  the only one updating the cache and takes no lock.  Other threads reading
+  basetype_value() while the cache is None build their own list of rows; each
+  update increments _version, and a list built without any update running is
+  kept in _built_cache, for other readers and for the next update to take over
+  as its cache.
+
+  If columnar is True, value_dict is a _ColumnarValueDict that stores each
+  dimension and the values in typed columns; value, basetype_value() and
+  to_dataframe() then read straight from those columns, and the base type
+  cache is only built once basetype_value() is first called.
+
+  Once more than spill_threshold points are set, the values are converted to
+  columnar storage if needed, keeping the type of every value, and the typed
+  columns are moved to memory-mapped files under CONF.attachments_directory.
+  Reads stay transparent, but the base type cache is dropped and
+  basetype_value() converts the points on each call.
+
+  Count, mean, variance, min, max, last value and per-dimension extents are
+  kept up to date as values are set, see the summary property.
   """
 
   name = attr.ib(type=Text)
@@ -642,6 +1498,29 @@ class DimensionedMeasuredValue(object):
   notify_value_set = attr.ib(type=Optional[Callable[[], None]], default=None)
   value_dict = attr.ib(type=Dict[Any, Any], factory=collections.OrderedDict)
   _cached_basetype_values = attr.ib(type=List[Any], factory=list)
+  columnar = attr.ib(type=bool, default=False)
+  vectorized_transform = attr.ib(type=bool, default=False)
+  _cached_basetype_positions = attr.ib(
+      type=Optional[Dict[Any, int]], default=None)
+  spill_threshold = attr.ib(type=Optional[int], default=None)
+  _summary = attr.ib(type=_OnlineSummary, factory=_OnlineSummary)
+  _version = attr.ib(type=int, default=0, init=False, repr=False, eq=False)
+  _built_cache = attr.ib(
+      type=Optional[Tuple[int, List[Any]]],
+      default=None,
+      init=False,
+      repr=False,
+      eq=False)
+
+  def __attrs_post_init__(self) -> None:
+    if self.columnar and not isinstance(self.value_dict, _ColumnarValueDict):
+      self.value_dict = _ColumnarValueDict(self.num_dimensions,
+                                           self.value_dict.items())
+      self._cached_basetype_values = None
+    if self._summary.count != len(self.value_dict):
+      self._summary = _OnlineSummary()
+      for coordinates, value in self.value_dict.items():
+        self._summary.add(coordinates, value)
 
   def __str__(self) -> Text:
     return str(self.value) if self.is_value_set else 'UNSET'
@@ -672,14 +1551,11 @@ class DimensionedMeasuredValue(object):
       coordinates = (coordinates,)
 
     try:
-      if coordinates in self.value_dict:
+      position = self._position_of(coordinates)
+      if position is not None:
         _LOG.warning(
             'Overriding previous measurement %s[%s] value of %s with %s',
             self.name, coordinates, self.value_dict[coordinates], value)
-        self._cached_basetype_values = None
-      elif self._cached_basetype_values is not None:
-        self._cached_basetype_values.append(
-            data.convert_to_base_types(coordinates + (value,)))
     except TypeError as e:
       raise InvalidDimensionsError(
           'Mutable objects cannot be used as measurement dimensions: ' + str(e))
@@ -688,11 +1564,262 @@ class DimensionedMeasuredValue(object):
     if self.transform_fn:
       value = self.transform_fn(value)
 
-    self.value_dict[coordinates] = value
+    self._adopt_built_cache()
+    try:
+      self._set_value(coordinates, value, position)
+      if position is None:
+        self._maybe_spill()
+    finally:
+      self._version += 1
+
+    if self.notify_value_set:
+      self.notify_value_set()
+
+  def _coordinate_columns_of(self, coordinates: Any) -> List[Any]:
+    """Splits bulk coordinates into one sequence per dimension.
+
+    Args:
+      coordinates: Sequence of coordinates as accepted by __setitem__, or a
+        numpy array of shape (points, num_dimensions), or (points,) when there
+        is a single dimension.
+
+    Raises:
+      InvalidDimensionsError: if the coordinates do not match the dimensions.
+
+    Returns:
+      A list of num_dimensions sequences or numpy arrays.
+    """
+    if numpy is not None and isinstance(coordinates, numpy.ndarray):
+      if coordinates.ndim == 1 and self.num_dimensions == 1:
+        return [coordinates]
+      if coordinates.ndim == 2 and coordinates.shape[1] == self.num_dimensions:
+        return list(coordinates.T)
+      raise InvalidDimensionsError(
+          'Expected coordinates array of shape (points, %s), got %s' %
+          (self.num_dimensions, coordinates.shape))
+
+    if self.num_dimensions == 1:
+      coordinates = [(coordinate,) for coordinate in coordinates]
+    else:
+      coordinates = [tuple(coordinate) for coordinate in coordinates]
+    for coordinate in coordinates:
+      if len(coordinate) != self.num_dimensions or (
+          self.num_dimensions == 1 and _coordinates_len(coordinate[0]) != 1):
+        raise InvalidDimensionsError(
+            'Expected %s-dimensional coordinates, got %s' %
+            (self.num_dimensions, coordinate))
+      try:
+        hash(coordinate)
+      except TypeError as e:
+        raise InvalidDimensionsError(
+            'Mutable objects cannot be used as measurement dimensions: ' +
+            str(e))
+    if not coordinates:
+      return [[] for _ in range(self.num_dimensions)]
+    return [list(column) for column in zip(*coordinates)]
+
+  def _transform_all(self, values: Any) -> Any:
+    """Applies transform_fn to every value, in one call if vectorized."""
+    if (self.vectorized_transform and numpy is not None and
+        isinstance(values, numpy.ndarray)):
+      transformed = numpy.asarray(self.transform_fn(values))
+      if transformed.shape != values.shape:
+        raise ValueError(
+            'Vectorized transform of measurement %s changed the shape of the '
+            'values from %s to %s' %
+            (self.name, values.shape, transformed.shape))
+      return transformed
+    return [self.transform_fn(value) for value in values]
+
+  def extend(self, coordinates: Any, values: Any) -> None:
+    """Sets many values at once.
+
+    This is equivalent to setting each value with __setitem__, but dimensions
+    are checked once, numpy arrays are copied in bulk into columnar storage,
+    a vectorized transform_fn is applied once, and the notification callback
+    is only called once.
+
+    Args:
+      coordinates: Sequence with the coordinates of each point as accepted by
+        __setitem__, or a numpy array of shape (points, num_dimensions), or of
+        shape (points,) for a single dimension.
+      values: Sequence or numpy array with the value of each point.
+
+    Raises:
+      InvalidDimensionsError: if the coordinates do not match the dimensions
+        or the number of values.
+    """
+    coordinate_columns = self._coordinate_columns_of(coordinates)
+    if len(coordinate_columns[0]) != len(values):
+      raise InvalidDimensionsError(
+          'Got %s coordinates but %s values' %
+          (len(coordinate_columns[0]), len(values)))
+    if not len(values):
+      return
+
+    if self.transform_fn:
+      values = self._transform_all(values)
+
+    self._adopt_built_cache()
+    try:
+      if isinstance(self.value_dict, _ColumnarValueDict):
+        overridden = self._extend_columns(coordinate_columns, values)
+      else:
+        if numpy is not None:
+          coordinate_columns = [
+              column.tolist() if isinstance(column, numpy.ndarray) else column
+              for column in coordinate_columns
+          ]
+          if isinstance(values, numpy.ndarray):
+            values = values.tolist()
+        overridden = 0
+        for coordinates, value in zip(zip(*coordinate_columns), values):
+          position = self._position_of(coordinates)
+          if position is not None:
+            overridden += 1
+          self._set_value(coordinates, value, position)
+      self._maybe_spill()
+    finally:
+      self._version += 1
+
+    if overridden:
+      _LOG.warning(
+          'Overriding %s previously set values of measurement %s with '
+          'extend()', overridden, self.name)
 
     if self.notify_value_set:
       self.notify_value_set()
 
+  @property
+  def summary(self) -> Dict[Text, Any]:
+    """Statistics of the values set so far, as base types.
+
+    Returns:
+      A dict with the number of points set as 'count', the last value set as
+      'last', and a [min, max] list per dimension (None if the coordinates are
+      not orderable) as 'dimension_extents'.  If any value is a finite real
+      number, 'mean', 'variance' (population), 'min' and 'max' of those values
+      are included as well.
+    """
+    if self._summary.extremes_stale:
+      self._summary.recompute_extremes(iter(self.value_dict.values()))
+    return self._summary.as_base_types()
+
+  @property
+  def is_spilled(self) -> bool:
+    """Whether the values are stored in memory-mapped files."""
+    return (isinstance(self.value_dict, _ColumnarValueDict) and
+            self.value_dict.is_spilled)
+
+  def _maybe_spill(self) -> None:
+    """Spills the values to disk once they exceed spill_threshold points."""
+    if (self.spill_threshold is None or
+        len(self.value_dict) <= self.spill_threshold or self.is_spilled):
+      return
+    if not isinstance(self.value_dict, _ColumnarValueDict):
+      # Only Python ints and floats go to typed columns, so that values read
+      # back exactly as they were set, like from the dict.
+      self.value_dict = _ColumnarValueDict(
+          self.num_dimensions, self.value_dict.items(), exact_types=True)
+    _LOG.debug('Spilling %s points of measurement %s to disk.',
+               len(self.value_dict), self.name)
+    self.value_dict.spill(CONF.attachments_directory)
+    self._cached_basetype_values = None
+    self._cached_basetype_positions = None
+
+  def _extend_columns(self, coordinate_columns: Sequence[Any],
+                      values: Any) -> int:
+    """Extends columnar storage and the base type cache, see extend()."""
+    num_points = len(self.value_dict)
+    typecodes = self.value_dict.typecodes
+    self._summary.add_many(coordinate_columns, values)
+    overridden = self.value_dict.extend(
+        coordinate_columns, values, on_override=self._summary.discard)
+    cache = self._cached_basetype_values
+    if cache is None:
+      return overridden
+    if num_points and typecodes != self.value_dict.typecodes:
+      # A column changed type, so every cached entry may be stale.
+      self._cached_basetype_values = None
+      return overridden
+    if overridden:
+      if numpy is not None:
+        coordinate_columns = [
+            column.tolist() if isinstance(column, numpy.ndarray) else column
+            for column in coordinate_columns
+        ]
+      for coordinates in zip(*coordinate_columns):
+        row = self.value_dict.row_of(coordinates)
+        if row < num_points:
+          cache[row] = self.value_dict.basetype_row(row)
+    cache.extend(self.value_dict.basetype_rows(start=len(cache)))
+    return overridden
+
+  def _position_of(self, coordinates: Tuple[Any, ...]) -> Optional[int]:
+    """Returns the position of coordinates in order of being set, or None.
+
+    Args:
+      coordinates: Coordinates tuple.
+
+    Raises:
+      TypeError: if the coordinates are not hashable.
+
+    Returns:
+      The position of the coordinates in value and basetype_value(), or None
+      if no value has been set for them yet.
+    """
+    if isinstance(self.value_dict, _ColumnarValueDict):
+      return self.value_dict.row_of(coordinates)
+    if coordinates not in self.value_dict:
+      return None
+    if self._cached_basetype_positions is None:
+      self._cached_basetype_positions = {
+          key: position for position, key in enumerate(self.value_dict)
+      }
+    return self._cached_basetype_positions[coordinates]
+
+  def _set_value(self, coordinates: Tuple[Any, ...], value: Any,
+                 position: Optional[int]) -> None:
+    """Stores a value and patches or extends the base type cache to match.
+
+    Args:
+      coordinates: Coordinates tuple.
+      value: The already transformed value.
+      position: The result of _position_of(coordinates).
+    """
+    if position is not None:
+      self._summary.discard(self.value_dict[coordinates])
+    self._summary.add(coordinates, value)
+
+    if isinstance(self.value_dict, _ColumnarValueDict):
+      typecodes = self.value_dict.typecodes
+      self.value_dict[coordinates] = value
+      if self._cached_basetype_values is None:
+        return
+      if len(self.value_dict) > 1 and typecodes != self.value_dict.typecodes:
+        # A column changed type, so every cached entry may be stale.
+        self._cached_basetype_values = None
+        return
+      if position is None:
+        position = len(self.value_dict) - 1
+        self._cached_basetype_values.append(
+            self.value_dict.basetype_row(position))
+      else:
+        self._cached_basetype_values[position] = (
+            self.value_dict.basetype_row(position))
+      return
+
+    if position is None and self._cached_basetype_positions is not None:
+      self._cached_basetype_positions[coordinates] = len(self.value_dict)
+    self.value_dict[coordinates] = value
+    if self._cached_basetype_values is None:
+      return
+    entry = data.convert_to_base_types(coordinates + (value,))
+    if position is None:
+      self._cached_basetype_values.append(entry)
+    else:
+      self._cached_basetype_values[position] = entry
+
   def __getitem__(self, coordinates: Any) -> Any:
     # Wrap single dimensions in a tuple so we can assume value_dict keys are
     # always tuples later.
@@ -714,17 +1841,46 @@ class DimensionedMeasuredValue(object):
     """
     if not self.is_value_set:
       raise MeasurementNotSetError('Measurement not yet set', self.name)
+    if isinstance(self.value_dict, _ColumnarValueDict):
+      return self.value_dict.rows()
     return [
         dimensions + (value,)
         for dimensions, value in self.value_dict.items()
     ]
 
+  def _adopt_built_cache(self) -> None:
+    """Takes over the rows built by basetype_value() as the cache, if current.
+
+    Called before each update, by the thread setting values.
+    """
+    built_cache = self._built_cache
+    if built_cache is None:
+      return
+    self._built_cache = None
+    if (self._cached_basetype_values is None and
+        built_cache[0] == self._version):
+      self._cached_basetype_values = built_cache[1]
+
   def basetype_value(self) -> List[Any]:
-    if self._cached_basetype_values is None:
-      self._cached_basetype_values = list(
+    cache = self._cached_basetype_values
+    if cache is not None:
+      return cache
+    # Read the version first, the rows are only kept if no update ran while
+    # they were built.
+    version = self._version
+    built_cache = self._built_cache
+    if built_cache is not None and built_cache[0] == version:
+      return built_cache[1]
+    if isinstance(self.value_dict, _ColumnarValueDict):
+      rows = self.value_dict.basetype_rows()
+    else:
+      rows = list(
           data.convert_to_base_types(coordinates + (value,))
           for coordinates, value in self.value_dict.items())
-    return self._cached_basetype_values
+    # Spilled values are not cached, and are never moved back to memory.
+    if not self.is_spilled and self._version == version:
+      self._built_cache = (version, rows)
+    return rows
 
   def to_dataframe(self, columns: Any = None) -> Any:
     """Converts to a `pandas.DataFrame`."""
@@ -732,6 +1888,15 @@ class DimensionedMeasuredValue(object):
       raise ValueError('Value must be set before converting to a DataFrame.')
     if not pandas:
       raise RuntimeError('Install pandas to convert to pandas.DataFrame')
+    if isinstance(self.value_dict, _ColumnarValueDict):
+      arrays = [
+          column.to_array() for column in
+          self.value_dict.coordinate_columns + (self.value_dict.value_column,)
+      ]
+      dataframe = pandas.DataFrame(dict(enumerate(arrays)))
+      if columns is not None:
+        dataframe.columns = columns
+      return dataframe
     return pandas.DataFrame.from_records(self.value, columns=columns)
 
 
@@ -773,6 +1938,8 @@ class Collection(object):
     self.measurements.widget_freq_response[6] = 11
     print dict(self.measurements.widget_freq_response)
     # {5: 10, 6: 11}
+    # Many values can be set at once, with a single notification.
+    self.measurements.widget_freq_response.extend([7, 8], [12, 13])
 
     # Not recommended, but you can also do this.  This is intended only for
     # framework internal use when generating the output test record.
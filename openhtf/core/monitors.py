@@ -44,7 +44,6 @@ def MyPhase(test):
 """
 
 import functools
-import inspect
 import time
 from typing import Any, Callable, Dict, Optional, Text
 
@@ -74,20 +73,18 @@ class _MonitorThread(threads.KillableThread):
     self.test_state = test_state
     self.interval_ms = interval_ms
     self.extra_kwargs = extra_kwargs
+    # Only pass in args that the monitor phase takes.  Bound once rather than
+    # for every sample.
+    call_plan = phase_descriptor.CallPlan.for_function(monitor_desc.func)
+    self._bound_monitor_desc = monitor_desc.with_args(
+        **{
+            arg: val
+            for arg, val in extra_kwargs.items()
+            if call_plan.accepts(arg)
+        })
 
   def get_value(self) -> Any:
-    argspec = inspect.getfullargspec(self.monitor_desc.func)
-    argspec_args = argspec.args
-    argspec_keywords = argspec.varkw
-    if argspec_keywords:
-      # Monitor phase takes **kwargs, so just pass everything in.
-      kwargs = self.extra_kwargs
-    else:
-      # Only pass in args that the monitor phase takes.
-      kwargs = {
-          arg: val for arg, val in self.extra_kwargs if arg in argspec_args
-      }
-    return self.monitor_desc.with_args(**kwargs)(self.test_state)
+    return self._bound_monitor_desc(self.test_state)
 
   def _thread_proc(self):
     measurement = getattr(self.test_state.test_api.measurements,
@@ -0,0 +1,214 @@
+# Copyright 2024 Google Inc. All Rights Reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Concurrent execution of a test on several DUT slots of one station.
+
+A station whose fixture holds several DUTs can run one Test per DUT slot in a
+single process.  Each slot gets its own Test, created by a factory, and so its
+own TestExecutor, test record and plug instances.  Plugs wrapping equipment
+that all slots use, like a power supply feeding the whole fixture, can instead
+be shared: they are instantiated once by the runner and handed to every slot,
+which then have to be safe to call from concurrent phases.
+
+  def make_test(slot):
+    test = htf.Test(power_on, measure_current, slot=slot)
+    test.add_output_callbacks(server.publish_final_state)
+    return test
+
+  with station_server.StationServer() as server:
+    with multi_slot.MultiSlotRunner(
+        make_test, num_slots=4, shared_plug_types=[PowerSupply]) as runner:
+      while True:
+        runner.execute(test_start=[scan_slot_0, scan_slot_1, ...])
+
+Every executing slot is published by the station server.  The slot index is
+recorded in the 'slot' metadata of each test record.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Type
+
+from openhtf import plugs
+from openhtf.core import base_plugs
+from openhtf.core import test_descriptor
+
+_LOG = logging.getLogger(__name__)
+
+# Metadata key of the test records holding the index of their slot.
+SLOT_METADATA_KEY = 'slot'
+
+# Interval at which the main thread checks on the slots, so it can still handle
+# a KeyboardInterrupt while they run.
+_JOIN_INTERVAL_S = 1
+
+
+class MultiSlotRunner(object):
+  """Executes one Test per DUT slot concurrently.
+
+  Attributes:
+    tests: The Tests of the slots, indexed by slot.
+  """
+
+  def __init__(self,
+               test_factory: Callable[[int], test_descriptor.Test],
+               num_slots: int,
+               shared_plug_types: Iterable[Type[base_plugs.BasePlug]] = ()):
+    """Creates the Tests of the slots.
+
+    Args:
+      test_factory: Function taking a slot index and returning the Test to run
+        on that slot.  The Tests must be distinct instances.
+      num_slots: Number of slots of the station.
+      shared_plug_types: Plug types to instantiate once and share between all
+        the slots, instead of once per slot.
+
+    Raises:
+      ValueError: if num_slots is not positive or the factory returns the same
+        Test for several slots.
+    """
+    if num_slots < 1:
+      raise ValueError('A station needs at least one slot, got %s' % num_slots)
+    self.tests = []  # type: List[test_descriptor.Test]
+    for slot in range(num_slots):
+      test = test_factory(slot)
+      if any(test is other for other in self.tests):
+        raise ValueError('Test factory returned the same Test for slot %s' %
+                         slot)
+      test.descriptor.metadata[SLOT_METADATA_KEY] = slot
+      self.tests.append(test)
+    self._shared_plug_types = set(shared_plug_types)
+    self._shared_plug_manager = None  # type: Optional[plugs.PlugManager]
+    self._lock = threading.Lock()
+
+  def __enter__(self) -> 'MultiSlotRunner':
+    return self
+
+  def __exit__(self, *unused_exc_info: Any) -> None:
+    self.close()
+
+  @property
+  def num_slots(self) -> int:
+    return len(self.tests)
+
+  def add_output_callbacks(self, *callbacks: Callable[..., None]) -> None:
+    """Adds the given output callbacks to the Test of every slot."""
+    for test in self.tests:
+      test.add_output_callbacks(*callbacks)
+
+  def configure(self, **kwargs: Any) -> None:
+    """Updates the options of the Test of every slot, see TestOptions."""
+    for test in self.tests:
+      test.configure(**kwargs)
+
+  def _get_shared_plugs(
+      self) -> Dict[Type[base_plugs.BasePlug], base_plugs.BasePlug]:
+    """Instantiates the shared plugs on first use, and returns them by type."""
+    with self._lock:
+      if self._shared_plug_manager is None:
+        plug_manager = plugs.PlugManager(self._shared_plug_types)
+        plug_manager.initialize_plugs()
+        self._shared_plug_manager = plug_manager
+      plug_manager = self._shared_plug_manager
+      return {
+          plug_type: plug_manager.get_plug_by_class_path(
+              plug_manager.get_plug_name(plug_type))
+          for plug_type in self._shared_plug_types
+      }
+
+  def execute(self,
+              test_start: Optional[Any] = None,
+              profile_filename: Optional[Sequence[str]] = None) -> List[bool]:
+    """Executes the Tests of all the slots concurrently.
+
+    Blocks until every slot has finished.  Slots start and finish
+    independently, e.g. a slot waiting for its DUT to be scanned does not hold
+    up the others.
+
+    Args:
+      test_start: test_start argument of Test.execute(), either a single one
+        used for every slot, or a sequence with one per slot.
+      profile_filename: Optional sequence with one profile file name per slot,
+        see Test.execute().
+
+    Returns:
+      For each slot, whether its test passed.
+
+    Raises:
+      ValueError: if there is not one test_start or profile_filename per slot.
+      Any exception raised by Test.execute() on a slot, after all the slots
+        have finished.
+    """
+    if isinstance(test_start, Sequence):
+      test_starts = list(test_start)
+    else:
+      test_starts = [test_start] * self.num_slots
+    profile_filenames = (
+        list(profile_filename) if profile_filename is not None else [None] *
+        self.num_slots)
+    if (len(test_starts) != self.num_slots or
+        len(profile_filenames) != self.num_slots):
+      raise ValueError('Expected one test_start and profile_filename per slot.')
+
+    shared_plugs = self._get_shared_plugs()
+    for test in self.tests:
+      test.configure(shared_plugs=shared_plugs)
+
+    results = [False] * self.num_slots
+    exc_infos = [None] * self.num_slots
+
+    def execute_slot(slot):
+      try:
+        results[slot] = self.tests[slot].execute(
+            test_start=test_starts[slot],
+            profile_filename=profile_filenames[slot])
+      except BaseException as e:  # pylint: disable=broad-except
+        exc_infos[slot] = e
+
+    slot_threads = [
+        threading.Thread(
+            target=execute_slot,
+            args=(slot,),
+            name='<MultiSlotRunner slot %s>' % slot,
+            daemon=True) for slot in range(self.num_slots)
+    ]
+    for slot_thread in slot_threads:
+      slot_thread.start()
+    try:
+      self._join(slot_threads)
+    except KeyboardInterrupt:
+      # The SIGINT handler aborts every executing test, wait for the slots to
+      # finish tearing down like Test.execute() does.
+      self._join(slot_threads)
+      raise
+
+    for slot, error in enumerate(exc_infos):
+      if error is not None:
+        _LOG.error('Slot %s raised %r', slot, error)
+    for error in exc_infos:
+      if error is not None:
+        raise error
+    return results
+
+  @staticmethod
+  def _join(slot_threads: List[threading.Thread]) -> None:
+    for slot_thread in slot_threads:
+      while slot_thread.is_alive():
+        slot_thread.join(_JOIN_INTERVAL_S)
+
+  def close(self) -> None:
+    """Tears down the shared plugs, if they were instantiated."""
+    with self._lock:
+      if self._shared_plug_manager is not None:
+        self._shared_plug_manager.tear_down_plugs()
+        self._shared_plug_manager = None
@@ -198,6 +198,41 @@ class PhaseSequence(PhaseCollectionNode):
           yield n
 
 
+@attr.s(slots=True, frozen=True, init=False)
+class ParallelSequence(PhaseSequence):
+  """A node whose nodes run concurrently.
+
+  Each node runs on its own thread, as long as no plug is used by more than one
+  of them; otherwise, the nodes run one after another like in a PhaseSequence.
+  The records of each node are added to the test record once all the nodes
+  finished, in the order of the nodes, regardless of which finished first.
+
+  A terminal outcome in one node stops the other nodes before their next phase,
+  but does not interrupt phases that are already running.  In a teardown
+  sequence, the nodes always run one after another.
+
+  This object is immutable.
+  """
+
+  def has_disjoint_plugs(self) -> bool:
+    """Returns whether no plug type is used by more than one node."""
+    seen = set()
+    for node in self.nodes:
+      if isinstance(node, phase_descriptor.PhaseDescriptor):
+        phases = [node]  # type: Iterable[phase_descriptor.PhaseDescriptor]
+      elif isinstance(node, PhaseCollectionNode):
+        phases = node.all_phases()
+      else:
+        continue
+      node_plugs = {
+          phase_plug.cls for phase in phases for phase_plug in phase.plugs
+      }
+      if node_plugs & seen:
+        return False
+      seen |= node_plugs
+    return True
+
+
 @attr.s(slots=True, frozen=True, init=False)
 class Subtest(PhaseSequence):
   """A node for a subtest.
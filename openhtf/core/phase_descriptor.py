@@ -22,7 +22,8 @@ import collections
 import enum
 import inspect
 import pdb
-from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Text, TYPE_CHECKING, Type, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Text, Tuple, TYPE_CHECKING, Type, Union
+import weakref
 
 import attr
 import inflection
@@ -132,7 +133,8 @@ class PhaseOptions(object):
 
   def format_strings(self, **kwargs: Any) -> 'PhaseOptions':
     """String substitution of name."""
-    return data.attr_copy(self, name=util.format_string(self.name, kwargs))
+    # All other options are immutable values, a shallow copy is enough.
+    return attr.evolve(self, name=util.format_string(self.name, kwargs))
 
   def update(self, **kwargs: Any) -> None:
     for key, value in kwargs.items():
@@ -169,6 +171,66 @@ class PhaseOptions(object):
 TestPhase = PhaseOptions
 
 
+@attr.s(slots=True, frozen=True)
+class CallPlan(object):
+  """How to bind the arguments of a phase function, from its signature.
+
+  Inspecting the signature of a function is slow compared to calling it, so the
+  plan is built once per function, see for_function(), and used by every call.
+
+  Attributes:
+    arg_names: Names of the positional-or-keyword arguments.
+    defaults: Dict mapping argument names to their default value.
+    has_varkw: Whether the function takes **kwargs.
+    always_pass_test: Whether the test API, or state, is always passed as the
+      first positional argument: when the function takes *args, or **kwargs
+      with at least one positional argument.  Otherwise it is only passed when
+      there are more arguments than keyword arguments to bind.
+  """
+
+  arg_names = attr.ib(type=Tuple[Text, ...])
+  defaults = attr.ib(type=Dict[Text, Any])
+  has_varkw = attr.ib(type=bool)
+  always_pass_test = attr.ib(type=bool)
+
+  @classmethod
+  def for_function(cls, func: Callable[..., Any]) -> 'CallPlan':
+    """Returns the plan for func, built on the first call for that function."""
+    try:
+      return _CALL_PLANS[func]
+    except KeyError:
+      pass
+    except TypeError:
+      # Not hashable or weakly referenceable, so it cannot be cached.
+      return cls._build(func)
+    plan = cls._build(func)
+    _CALL_PLANS[func] = plan
+    return plan
+
+  @classmethod
+  def _build(cls, func: Callable[..., Any]) -> 'CallPlan':
+    arg_info = inspect.getfullargspec(func)
+    defaults = {}
+    if arg_info.defaults is not None:
+      defaults = dict(
+          zip(arg_info.args[-len(arg_info.defaults):], arg_info.defaults))
+    return cls(
+        arg_names=tuple(arg_info.args),
+        defaults=defaults,
+        has_varkw=bool(arg_info.varkw),
+        always_pass_test=bool(arg_info.varargs or
+                              (arg_info.varkw and arg_info.args)))
+
+  def accepts(self, arg_name: Text) -> bool:
+    """Returns whether arg_name can be passed as a keyword argument."""
+    return self.has_varkw or arg_name in self.arg_names
+
+
+# Call plans by function, dropped along with the functions.
+_CALL_PLANS = weakref.WeakKeyDictionary(
+)  # type: weakref.WeakKeyDictionary[Callable[..., Any], CallPlan]
+
+
 @attr.s(slots=True)
 class PhaseDescriptor(phase_nodes.PhaseNode):
   """Phase function and related information.
@@ -250,18 +312,17 @@ class PhaseDescriptor(phase_nodes.PhaseNode):
     Returns:
       Updated PhaseDescriptor.
     """
-    argspec = inspect.getfullargspec(self.func)
-    argspec_keywords = argspec.varkw
-    known_arguments = {}
-    for key, arg in kwargs.items():
-      if key in argspec.args or argspec_keywords:
-        known_arguments[key] = arg
-
-    new_info = data.attr_copy(self)
-    new_info.options = new_info.options.format_strings(**kwargs)
-    new_info.extra_kwargs.update(known_arguments)
-    new_info.measurements = [m.with_args(**kwargs) for m in self.measurements]
-    return new_info
+    call_plan = CallPlan.for_function(self.func)
+    known_arguments = {
+        key: arg for key, arg in kwargs.items() if call_plan.accepts(key)
+    }
+
+    # Fields replaced here are not copied by attr_copy first.
+    return data.attr_copy(
+        self,
+        options=self.options.format_strings(**kwargs),
+        extra_kwargs=dict(self.extra_kwargs, **known_arguments),
+        measurements=[m.with_args(**kwargs) for m in self.measurements])
 
   def with_plugs(self,
                  **subplugs: Type[base_plugs.BasePlug]) -> 'PhaseDescriptor':
@@ -341,22 +402,20 @@ class PhaseDescriptor(phase_nodes.PhaseNode):
     Returns:
       The return value from calling the underlying function.
     """
-    kwargs = {}
-    arg_info = inspect.getfullargspec(self.func)
-    keywords = arg_info.varkw
-    if arg_info.defaults is not None:
-      for arg_name, arg_value in zip(arg_info.args[-len(arg_info.defaults):],
-                                     arg_info.defaults):
-        kwargs[arg_name] = arg_value
+    call_plan = CallPlan.for_function(self.func)
+    kwargs = dict(call_plan.defaults)
     kwargs.update(self.extra_kwargs)
-    kwargs.update(
-        running_test_state.plug_manager.provide_plugs(
-            (plug.name, plug.cls) for plug in self.plugs if plug.update_kwargs))
+    if self.plugs:
+      kwargs.update(
+          running_test_state.plug_manager.provide_plugs(
+              (plug.name, plug.cls)
+              for plug in self.plugs
+              if plug.update_kwargs))
 
     # Pass in test_api if the phase takes *args, or **kwargs with at least 1
     # positional, or more positional args than we have keyword args.
-    if arg_info.varargs or (keywords and len(arg_info.args) >= 1) or (len(
-        arg_info.args) > len(kwargs)):
+    if (call_plan.always_pass_test or
+        len(call_plan.arg_names) > len(kwargs)):
       args = []
       if self.options.requires_state:
         args.append(running_test_state)
@@ -30,6 +30,7 @@ time. A phase should not return TIMEOUT or ABORT, those are handled by the
 framework.
 """
 
+import cProfile
 import pstats
 import sys
 import threading
@@ -52,7 +53,10 @@ if TYPE_CHECKING:
 
 DEFAULT_PHASE_TIMEOUT_S = 3 * 60
 DEFAULT_RETRIES = 3
-_JOIN_TRY_INTERVAL_SECONDS = 3
+# How long to wait for a killed phase to exit before leaving it behind.
+_KILLED_PHASE_EXIT_S = 3
+# How often an idle phase thread checks whether the main thread is done.
+_IDLE_POLL_INTERVAL_S = 0.5
 
 ARG_PARSER = argv.module_parser()
 ARG_PARSER.add_argument(
@@ -153,13 +157,21 @@ class PhaseExecutionOutcome(object):
 
 
 class PhaseExecutorThread(threads.KillableThread):
-  """Handles the execution and result of a single test phase.
+  """Handles the execution and result of test phases, one at a time.
+
+  The thread starts with the phase it was created for and then waits for more
+  phases handed over with run_phase(), so that successive phases do not pay for
+  creating and starting a new thread.  Once killed, whether by a timeout or by
+  PhaseExecutor.stop(), the thread exits and is not reused.
 
   The phase outcome will be stored in the _phase_execution_outcome attribute
   once it is known (_phase_execution_outcome is None until then), and it will be
   a PhaseExecutionOutcome instance.
+
+  Phase threads are never daemon threads, so that a phase still running at
+  interpreter exit is allowed to finish instead of being killed midway.  Idle
+  threads exit on PhaseExecutor.close(), or once the main thread is done.
   """
-  daemon = True
 
   def __init__(self, phase_desc: phase_descriptor.PhaseDescriptor,
                test_state: 'htf_test_state.TestState', run_with_profiling: bool,
@@ -167,11 +179,81 @@ class PhaseExecutorThread(threads.KillableThread):
     super(PhaseExecutorThread, self).__init__(
         name='<PhaseExecutorThread: (phase_desc.name)>',
         run_with_profiling=run_with_profiling,
-        logger=test_state.state_logger.getChild('phase_executor_thread'))
-    self._phase_desc = phase_desc
+        logger=test_state.state_logger.getChild('phase_executor_thread'),
+        daemon=False)
     self._test_state = test_state
+    # Guards handing over phases and waiting for them to finish; notified when
+    # a phase is handed over or finishes, and on close() and kill().
+    self._phase_cond = threading.Condition()
+    self._phase_done = threading.Event()
+    self._phase_pending = False
+    self._closed = False
+    self._set_phase(phase_desc, run_with_profiling, subtest_rec)
+
+  def _set_phase(self, phase_desc: phase_descriptor.PhaseDescriptor,
+                 run_with_profiling: bool,
+                 subtest_rec: Optional[test_record.SubtestRecord]) -> None:
+    self._phase_desc = phase_desc
     self._subtest_rec = subtest_rec
     self._phase_execution_outcome = None  # type: Optional[PhaseExecutionOutcome]
+    self._profiler = cProfile.Profile() if run_with_profiling else None
+    self._profile_stats = None  # type: Optional[pstats.Stats]
+    self._phase_done.clear()
+    self._phase_pending = True
+
+  @property
+  def is_reusable(self) -> bool:
+    """True if the thread is idle and can run another phase."""
+    return (self.is_alive() and self._phase_done.is_set() and
+            not self._killed.is_set() and not self._closed)
+
+  def run_phase(self, phase_desc: phase_descriptor.PhaseDescriptor,
+                run_with_profiling: bool,
+                subtest_rec: Optional[test_record.SubtestRecord]) -> None:
+    """Runs another phase on this thread; wait for it with join_or_die()."""
+    with self._phase_cond:
+      if not self.is_reusable:
+        raise threads.InvalidUsageError(
+            'Cannot run phase %s on %s.' % (phase_desc.name, self))
+      self._set_phase(phase_desc, run_with_profiling, subtest_rec)
+      self._phase_cond.notify_all()
+
+  def close(self) -> None:
+    """Lets the thread exit once its current phase, if any, is done."""
+    with self._phase_cond:
+      self._closed = True
+      self._phase_cond.notify_all()
+
+  def kill(self) -> None:
+    super(PhaseExecutorThread, self).kill()
+    # Wake up join_or_die(), and the thread itself if it is idle so it exits.
+    with self._phase_cond:
+      self._phase_cond.notify_all()
+
+  def _next_phase(self) -> bool:
+    """Waits for the next phase, returning False if the thread should exit."""
+    with self._phase_cond:
+      while not (self._phase_pending or self._closed or self._killed.is_set()):
+        # An idle thread has nothing left to finish, so it also exits once the
+        # main thread is done instead of holding up interpreter exit.
+        if not threading.main_thread().is_alive():
+          return False
+        self._phase_cond.wait(_IDLE_POLL_INTERVAL_S)
+      # A pending phase is run even when killed, so that it records the kill.
+      pending, self._phase_pending = self._phase_pending, False
+      return pending
+
+  def run(self) -> None:
+    try:
+      while self._next_phase():
+        try:
+          # Runs the phase with the kill, exception and profiling handling of
+          # KillableThread, which disables the profiler before returning.
+          super(PhaseExecutorThread, self).run()
+        finally:
+          self._finish_phase()
+    except threads.ThreadTerminationError:
+      self._logger.debug('Thread killed: %s', self.name)
 
   def _thread_proc(self) -> None:
     """Execute the encompassed phase and save the result."""
@@ -188,6 +270,32 @@ class PhaseExecutorThread(threads.KillableThread):
           'Phase returned FAIL_SUBTEST but a subtest is not running.')
     self._phase_execution_outcome = PhaseExecutionOutcome(phase_return)
 
+  def _finish_phase(self) -> None:
+    """Collects the profile of the phase, then signals that it is done.
+
+    This runs once the profiler is disabled, so that join_or_die() never sees a
+    profiler still running, and run_phase() never replaces one.
+    """
+    if self._profiler is not None:
+      try:
+        self._profile_stats = pstats.Stats(self._profiler)
+      except TypeError:
+        # Nothing was profiled, the thread was killed before the phase started.
+        self._profile_stats = None
+    with self._phase_cond:
+      self._phase_done.set()
+      self._phase_cond.notify_all()
+
+  def get_profile_stats(self) -> Optional[pstats.Stats]:
+    """Returns the profile of the phase, None if it did not finish.
+
+    Raises:
+      InvalidUsageError: if the phase is not run with profiling.
+    """
+    if self._profiler is None:
+      raise threads.InvalidUsageError('Profiling not enabled for this phase.')
+    return self._profile_stats
+
   def _log_exception(self, *args: Any) -> Any:
     """Log exception, while allowing unit testing to override."""
     self._test_state.state_logger.critical(*args)
@@ -198,16 +306,21 @@ class PhaseExecutorThread(threads.KillableThread):
     return True  # Never propagate exceptions upward.
 
   def join_or_die(self) -> PhaseExecutionOutcome:
-    """Wait for thread to finish, returning a PhaseExecutionOutcome instance."""
+    """Wait for the phase to finish, returning a PhaseExecutionOutcome."""
     deadline = time.monotonic() + DEFAULT_PHASE_TIMEOUT_S
     if self._phase_desc.options.timeout_s is not None:
       deadline = time.monotonic() + self._phase_desc.options.timeout_s
-    while time.monotonic() < deadline:
-      # Using exception to kill thread is not honored when thread is busy,
-      # so we leave the thread behind, and move on teardown.
-      self.join(_JOIN_TRY_INTERVAL_SECONDS)
-      if not self.is_alive() or self._killed.is_set():
-        break
+    # Woken up as soon as the phase finishes or the thread is killed.
+    with self._phase_cond:
+      self._phase_cond.wait_for(
+          lambda: self._phase_done.is_set() or self._killed.is_set(),
+          timeout=deadline - time.monotonic())
+      if self._killed.is_set():
+        # Using exception to kill thread is not honored when thread is busy,
+        # so we leave the thread behind, and move on teardown.
+        self._phase_cond.wait_for(
+            self._phase_done.is_set,
+            timeout=min(_KILLED_PHASE_EXIT_S, deadline - time.monotonic()))
 
     # We got a return value or an exception and handled it.
     if self._phase_execution_outcome:
@@ -215,7 +328,7 @@ class PhaseExecutorThread(threads.KillableThread):
 
     # Check for timeout, indicated by None for
     # PhaseExecutionOutcome.phase_result.
-    if self.is_alive():
+    if not self._phase_done.is_set():
       self.kill()
       return PhaseExecutionOutcome(None)
 
@@ -240,6 +353,8 @@ class PhaseExecutor(object):
     # _execute_phase_once is setting up the next phase thread.
     self._current_phase_thread_lock = threading.Lock()
     self._current_phase_thread = None  # type: Optional[PhaseExecutorThread]
+    # Long-lived thread running successive phases, replaced once killed.
+    self._phase_worker = None  # type: Optional[PhaseExecutorThread]
     self._stopping = threading.Event()
 
   def _should_repeat(self, phase: phase_descriptor.PhaseDescriptor,
@@ -327,9 +442,14 @@ class PhaseExecutor(object):
           result = PhaseExecutionOutcome(threads.ThreadTerminationError())
           phase_state.result = result
           return result, None
-        phase_thread = PhaseExecutorThread(phase_desc, self.test_state,
-                                           run_with_profiling, subtest_rec)
-        phase_thread.start()
+        phase_thread = self._phase_worker
+        if phase_thread is not None and phase_thread.is_reusable:
+          phase_thread.run_phase(phase_desc, run_with_profiling, subtest_rec)
+        else:
+          phase_thread = PhaseExecutorThread(phase_desc, self.test_state,
+                                             run_with_profiling, subtest_rec)
+          phase_thread.start()
+          self._phase_worker = phase_thread
         self._current_phase_thread = phase_thread
 
       phase_state.result = phase_thread.join_or_die()
@@ -403,6 +523,13 @@ class PhaseExecutor(object):
   def reset_stop(self) -> None:
     self._stopping.clear()
 
+  def close(self) -> None:
+    """Lets the idle phase thread exit; it is recreated if needed again."""
+    with self._current_phase_thread_lock:
+      phase_worker, self._phase_worker = self._phase_worker, None
+    if phase_worker is not None:
+      phase_worker.close()
+
   def stop(
       self,
       timeout_s: Union[None, int, float,
@@ -426,8 +553,7 @@ class PhaseExecutor(object):
 
       self.logger.debug('Waiting for cancelled phase to exit: %s', phase_thread)
       timeout = timeouts.PolledTimeout.from_seconds(timeout_s)
-      while phase_thread.is_alive() and not timeout.has_expired():
-        time.sleep(0.1)
+      phase_thread.join(timeout.remaining)
       self.logger.debug('Cancelled phase %s exit',
                         "didn't" if phase_thread.is_alive() else 'did')
     # Clear the currently running phase, whether it finished or timed out.
@@ -407,6 +407,9 @@ class TestOptions(object):
   stop_on_first_failure: Stop Test on first failed measurement.
   diagnosers: list of BaseTestDiagnoser subclasses to run after all the
       phases.
+  shared_plugs: Plug instances by plug type, used instead of creating those
+      plugs and not torn down by the test, e.g. plugs shared by the slots of
+      a multi_slot.MultiSlotRunner.
   """
 
   name = attr.ib(type=Text, default='openhtf_test')
@@ -416,6 +419,8 @@ class TestOptions(object):
   default_dut_id = attr.ib(type=Text, default='UNKNOWN_DUT')
   stop_on_first_failure = attr.ib(type=bool, default=False)
   diagnosers = attr.ib(type=List[diagnoses_lib.BaseTestDiagnoser], factory=list)
+  shared_plugs = attr.ib(
+      type=Dict[Type[base_plugs.BasePlug], base_plugs.BasePlug], factory=dict)
 
 
 @attr.s(slots=True)
@@ -546,9 +551,13 @@ class TestApi(object):
       self,
       filename: Text,
       name: Optional[Text] = None,
-      mimetype: test_state.MimetypeT = test_state.INFER_MIMETYPE) -> None:
+      mimetype: test_state.MimetypeT = test_state.INFER_MIMETYPE,
+      move: bool = False) -> None:
     """Store the contents of the given filename as an attachment.
 
+    The file is streamed into the attachments directory, never read into
+    memory as a whole.
+
     Args:
       filename: The file to read data from to attach.
       name: If provided, override the attachment name, otherwise it will default
@@ -558,6 +567,8 @@ class TestApi(object):
             and second (i.e. as a fallback), from the attachment name.
           * None: The type will be left unspecified.
           * A string: The type will be set to the specified value.
+      move: If True, the attachment takes ownership of the file, which is
+        moved rather than copied when possible and no longer exists afterwards.
 
     Raises:
       DuplicateAttachmentError: Raised if there is already an attachment with
@@ -565,7 +576,7 @@ class TestApi(object):
       IOError: Raised if the given filename couldn't be opened.
     """
     self._running_phase_state.attach_from_file(
-        filename, name=name, mimetype=mimetype)
+        filename, name=name, mimetype=mimetype, move=move)
 
   def get_measurement(
       self,
@@ -606,29 +617,32 @@ class TestApi(object):
     return measurement
 
   def get_attachment(
-      self, attachment_name: Text) -> Optional[htf_test_record.Attachment]:
-    """Get a copy of an attachment from current or previous phases.
+      self, attachment_name: Text) -> Optional[htf_test_record.AttachmentView]:
+    """Get a read-only view of an attachment from current or previous phases.
 
     This method will return None when test attachment is not found. Please use
     get_attachment_strict method if exception is expected to be raised.
 
+    The view reads the attachment's data in place; call its copy() method for
+    an independent Attachment.
+
     Args:
       attachment_name:  str of the attachment name
 
     Returns:
-      A copy of the attachment or None if the attachment cannot be found.
+      An AttachmentView or None if the attachment cannot be found.
     """
     return self._running_test_state.get_attachment(attachment_name)
 
   def get_attachment_strict(
-      self, attachment_name: Text) -> htf_test_record.Attachment:
-    """Gets a copy of an attachment or dies when attachment not found.
+      self, attachment_name: Text) -> htf_test_record.AttachmentView:
+    """Gets a view of an attachment or dies when attachment not found.
 
     Args:
       attachment_name: An attachment name.
 
     Returns:
-      A copy of the attachment.
+      An AttachmentView of the attachment.
 
     Raises:
       AttachmentNotFoundError: Raised when attachment is not found.
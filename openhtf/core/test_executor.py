@@ -21,8 +21,9 @@ import sys
 import tempfile
 import threading
 import traceback
-from typing import Iterator, List, Optional, Text, Type, TYPE_CHECKING
+from typing import Any, Iterator, List, Optional, Text, Tuple, Type, TYPE_CHECKING
 
+import attr
 from openhtf import util
 from openhtf.core import base_plugs
 from openhtf.core import diagnoses_lib
@@ -36,6 +37,7 @@ from openhtf.core import test_record
 from openhtf.core import test_state
 from openhtf.util import configuration
 from openhtf.util import threads
+from openhtf.util import timeouts
 
 CONF = configuration.CONF
 
@@ -74,6 +76,61 @@ def _more_critical(e1: _ExecutorReturn, e2: _ExecutorReturn) -> _ExecutorReturn:
   return _ExecutorReturn(max(e1.value, e2.value))
 
 
+@attr.s(slots=True)
+class _Branch(object):
+  """A node of a ParallelSequence running on its own thread.
+
+  Attributes:
+    test_state: View of the test state for this node.
+    phase_exec: PhaseExecutor running the phases of this node.
+    stop_events: Events set when a node of this or an enclosing
+      ParallelSequence reached a terminal outcome.
+    last_outcome: Terminal outcome of this node, if any.
+    last_execution_unit: Name of what produced last_outcome.
+    result: _ExecutorReturn of this node once it finished.
+    exc_info: sys.exc_info() if executing this node raised.
+  """
+
+  test_state = attr.ib(type=test_state.BranchTestState)
+  phase_exec = attr.ib(type=phase_executor.PhaseExecutor)
+  stop_events = attr.ib(type=Tuple[threading.Event, ...])
+  last_outcome = attr.ib(
+      type=Optional[phase_executor.PhaseExecutionOutcome], default=None)
+  last_execution_unit = attr.ib(type=Optional[Text], default=None)
+  result = attr.ib(type=Optional[_ExecutorReturn], default=None)
+  exc_info = attr.ib(type=Optional[Tuple[Any, ...]], default=None)
+
+
+class _PerBranch(object):
+  """TestExecutor attribute that each running _Branch has its own value of.
+
+  Outside of a ParallelSequence node, this is a plain instance attribute.
+  """
+
+  def __init__(self, branch_attr: Text):
+    self._branch_attr = branch_attr
+    self._name = None  # type: Optional[Text]
+
+  def __set_name__(self, owner: Type[Any], name: Text) -> None:
+    self._name = name
+
+  def __get__(self, executor: Optional['TestExecutor'],
+              owner: Type[Any]) -> Any:
+    if executor is None:
+      return self
+    branch = executor._branch.current  # pylint: disable=protected-access
+    if branch:
+      return getattr(branch, self._branch_attr)
+    return executor.__dict__[self._name]
+
+  def __set__(self, executor: 'TestExecutor', value: Any) -> None:
+    branch = executor._branch.current  # pylint: disable=protected-access
+    if branch:
+      setattr(branch, self._branch_attr, value)
+    else:
+      executor.__dict__[self._name] = value
+
+
 def combine_profile_stats(profile_stats_iter: List[pstats.Stats],
                           output_filename: Text) -> None:
   """Given an iterable of pstats.Stats, combine them into a single Stats."""
@@ -99,6 +156,8 @@ class TestExecutor(threads.KillableThread):
                run_with_profiling: bool):
     super(TestExecutor, self).__init__(
         name='TestExecutorThread', run_with_profiling=run_with_profiling)
+    # The _Branch run by the current thread, if any, as `current`.
+    self._branch = threads.NoneByDefaultThreadLocal()
     self.test_state = None  # type: Optional[test_state.TestState]
 
     self._test_descriptor = test_descriptor
@@ -106,6 +165,8 @@ class TestExecutor(threads.KillableThread):
     self._test_options = test_options
     self._lock = threading.Lock()
     self._phase_exec = None  # type: Optional[phase_executor.PhaseExecutor]
+    # PhaseExecutors of the running ParallelSequence nodes.
+    self._branch_phase_execs = []  # type: List[phase_executor.PhaseExecutor]
     self.uid = execution_uid
     self._last_outcome = None  # type: Optional[phase_executor.PhaseExecutionOutcome]
     self._last_execution_unit: str = None
@@ -210,6 +271,7 @@ class TestExecutor(threads.KillableThread):
       # Everything is set, set status and begin test execution.
       self.test_state.set_status_running()
       self._execute_node(self._test_descriptor.phase_sequence, None, False)
+      self._settle_phase_outcomes()
       self._execute_test_diagnosers()
     except:  # pylint: disable=bare-except
       stacktrace = traceback.format_exc()
@@ -279,20 +341,29 @@ class TestExecutor(threads.KillableThread):
       if not phase_exec:
         # The test executor has not started yet, so no stopping is required.
         return
+      phase_execs = [phase_exec] + self._branch_phase_execs
     if not force and not self._teardown_phases_lock.acquire(False):
       # If locked, teardown phases are running, so do not cancel those.
       return
     try:
-      phase_exec.stop(timeout_s=CONF.cancel_timeout_s)
+      timeout = timeouts.PolledTimeout.from_seconds(CONF.cancel_timeout_s)
+      for phase_exec in phase_execs:
+        phase_exec.stop(timeout_s=timeout)
       # Resetting so phase_exec can run teardown phases.
-      phase_exec.reset_stop()
+      for phase_exec in phase_execs:
+        phase_exec.reset_stop()
     finally:
       if not force:
         self._teardown_phases_lock.release()
 
   def _execute_test_teardown(self) -> None:
+    with self._lock:
+      phase_exec = self._phase_exec
+    if phase_exec:
+      phase_exec.close()
     # Plug teardown does not affect the test outcome.
     self.test_state.plug_manager.tear_down_plugs()
+    self._settle_phase_outcomes()
 
     # Now finalize the test state.
     if self._abort.is_set():
@@ -305,6 +376,16 @@ class TestExecutor(threads.KillableThread):
     else:
       self.test_state.finalize_normally()
 
+  def _settle_phase_outcomes(self) -> _ExecutorReturn:
+    """Settles phases whose measurements are validated in the background."""
+    self.test_state.settle_phase_outcomes()
+    error = self.test_state.deferred_validation_error
+    if error is None:
+      return _ExecutorReturn.CONTINUE
+    if not self._last_outcome:
+      self._last_outcome, self._last_execution_unit = error
+    return _ExecutorReturn.TERMINAL
+
   def _execute_phase(self, phase: phase_descriptor.PhaseDescriptor,
                      subtest_rec: Optional[test_record.SubtestRecord],
                      in_teardown: bool) -> _ExecutorReturn:
@@ -356,6 +437,9 @@ class TestExecutor(threads.KillableThread):
       self._phase_exec.skip_checkpoint(checkpoint, subtest_rec)
       return _ExecutorReturn.CONTINUE
 
+    # Checkpoints read the outcomes of the phases before them.
+    if self._settle_phase_outcomes() == _ExecutorReturn.TERMINAL:
+      return _ExecutorReturn.TERMINAL
     outcome = self._phase_exec.evaluate_checkpoint(checkpoint, subtest_rec)
     if outcome.is_terminal:
       if not self._last_outcome:
@@ -415,7 +499,7 @@ class TestExecutor(threads.KillableThread):
       _ExecutorReturn for how to proceed.
     """
     for node in phase_sequence.nodes:
-      if self._abort.is_set():
+      if self._abort.is_set() or self._is_branch_stopped():
         return _ExecutorReturn.TERMINAL
       exe_ret = self._execute_node(node, subtest_rec, False)
       if exe_ret != _ExecutorReturn.CONTINUE:
@@ -443,6 +527,92 @@ class TestExecutor(threads.KillableThread):
 
     return ret
 
+  def _is_branch_stopped(self) -> bool:
+    """Returns whether another node of a ParallelSequence stopped the test."""
+    branch = self._branch.current
+    return bool(branch) and any(event.is_set() for event in branch.stop_events)
+
+  def _execute_parallel_sequence(
+      self, parallel: phase_collections.ParallelSequence,
+      subtest_rec: Optional[test_record.SubtestRecord],
+      in_teardown: bool) -> _ExecutorReturn:
+    """Execute the nodes of a parallel sequence concurrently.
+
+    Args:
+      parallel: Sequence of phase nodes to run concurrently.
+      subtest_rec: Current subtest record, if any.
+      in_teardown: Indicates if currently processing a teardown sequence.
+
+    Returns:
+      _ExecutorReturn for how to proceed.
+    """
+    if in_teardown or not parallel.has_disjoint_plugs():
+      if not in_teardown:
+        self.logger.warning(
+            'Nodes of %s share plugs; running them one after another.',
+            parallel.name or 'parallel sequence')
+      return self._execute_sequence(parallel, subtest_rec, in_teardown)
+    self._log_sequence(parallel, None)
+
+    outer_branch = self._branch.current
+    stop_events = (outer_branch.stop_events if outer_branch else ()) + (
+        threading.Event(),)
+    branches = []
+    for _ in parallel.nodes:
+      branch_state = self.test_state.branch()
+      branches.append(
+          _Branch(
+              test_state=branch_state,
+              phase_exec=phase_executor.PhaseExecutor(branch_state),
+              stop_events=stop_events))
+    with self._lock:
+      self._branch_phase_execs.extend(branch.phase_exec for branch in branches)
+    branch_threads = [
+        threading.Thread(
+            target=self._execute_branch,
+            args=(branch, node, subtest_rec),
+            name='<ParallelSequence node: %s>' % node.name,
+            daemon=True) for branch, node in zip(branches, parallel.nodes)
+    ]
+    for branch_thread in branch_threads:
+      branch_thread.start()
+    for branch_thread in branch_threads:
+      branch_thread.join()
+    with self._lock:
+      for branch in branches:
+        self._branch_phase_execs.remove(branch.phase_exec)
+
+    # Merge in the order of the nodes, so the record is deterministic.
+    ret = _ExecutorReturn.CONTINUE
+    for branch in branches:
+      if branch.exc_info:
+        raise branch.exc_info[1].with_traceback(branch.exc_info[2])
+      self.test_state.merge_branch(branch.test_state)
+      ret = _more_critical(ret, branch.result)
+      if branch.last_outcome and not self._last_outcome:
+        self._last_outcome = branch.last_outcome
+        self._last_execution_unit = branch.last_execution_unit
+    return ret
+
+  def _execute_branch(self, branch: _Branch, node: phase_nodes.PhaseNode,
+                      subtest_rec: Optional[test_record.SubtestRecord]) -> None:
+    """Thread target running one node of a ParallelSequence."""
+    self._branch.current = branch
+    try:
+      if self._abort.is_set():
+        branch.result = _ExecutorReturn.TERMINAL
+      else:
+        branch.result = self._execute_node(node, subtest_rec, False)
+    except:  # pylint: disable=bare-except
+      branch.exc_info = sys.exc_info()
+      branch.result = _ExecutorReturn.TERMINAL
+    finally:
+      if branch.result == _ExecutorReturn.TERMINAL:
+        # Stop the other nodes before their next phase.
+        branch.stop_events[-1].set()
+      branch.phase_exec.close()
+      self._branch.current = None
+
   @contextlib.contextmanager
   def _subtest_context(
       self, subtest: phase_collections.Subtest
@@ -581,6 +751,8 @@ class TestExecutor(threads.KillableThread):
       return self._execute_subtest(node, subtest_rec, in_teardown)
     if isinstance(node, phase_branches.BranchSequence):
       return self._execute_phase_branch(node, subtest_rec, in_teardown)
+    if isinstance(node, phase_collections.ParallelSequence):
+      return self._execute_parallel_sequence(node, subtest_rec, in_teardown)
     if isinstance(node, phase_collections.PhaseSequence):
       return self._execute_sequence(node, subtest_rec, in_teardown)
     if isinstance(node, phase_group.PhaseGroup):
@@ -612,3 +784,10 @@ class TestExecutor(threads.KillableThread):
   def _execute_test_diagnosers(self) -> None:
     for diagnoser in self._test_options.diagnosers:
       self._execute_test_diagnoser(diagnoser)
+
+  # Nodes of a ParallelSequence see their own state through these.  Defined
+  # last so that the test_state module stays visible in the class body.
+  test_state = _PerBranch('test_state')
+  _phase_exec = _PerBranch('phase_exec')
+  _last_outcome = _PerBranch('last_outcome')
+  _last_execution_unit = _PerBranch('last_execution_unit')
@@ -13,16 +13,29 @@
 # limitations under the License.
 """OpenHTF module responsible for managing records of tests."""
 
+import contextlib
+import copy
 import enum
+import gzip
 import hashlib
 import inspect
+import io
+import json
 import logging
+import mmap
 import os
+import sys
 import tempfile
-from typing import Any, Dict, List, Optional, Text, TYPE_CHECKING, Union
+import threading
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Text, Tuple, TYPE_CHECKING, Union
 
 import attr
 
+try:
+  import fcntl  # pylint: disable=g-import-not-at-top
+except ImportError:
+  fcntl = None
+
 from openhtf import util
 from openhtf.util import configuration
 from openhtf.util import data
@@ -41,9 +54,58 @@ CONF.declare(
     'attachments_directory',
     default_value=None,
     description='Directory where temprorary files can be safely stored.')
+CONF.declare(
+    'log_records_memory_limit',
+    default_value=None,
+    description='Number of recent log records of a test kept in memory, e.g. '
+    'for live viewing.  Older records are appended to a compressed file in '
+    'the attachments directory and read back when iterating over the log '
+    'records; None keeps every log record in memory.')
 
 _LOG = logging.getLogger(__name__)
 
+# Default number of bytes read at a time when iterating over attachment data.
+ATTACHMENT_CHUNK_SIZE = 1 << 20
+
+# Linux ioctl cloning the extents of one file into another (a reflink).
+_FICLONE = 0x40049409
+
+
+def _reflink(source: Text, target: Text) -> bool:
+  """Makes target a copy-on-write clone of source, if the filesystem can."""
+  if fcntl is None:
+    return False
+  try:
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+      fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+  except OSError:
+    return False
+  return True
+
+
+def _hash_file(filename: Text, copy_to: Optional[BinaryIO] = None
+              ) -> Tuple[Text, int]:
+  """Hashes a file chunk by chunk, optionally copying it at the same time.
+
+  Args:
+    filename: The file to read.
+    copy_to: If given, a file object the chunks are also written to.
+
+  Returns:
+    The SHA-1 hex digest and the size of the file.
+  """
+  sha1 = hashlib.sha1()
+  size = 0
+  with open(filename, 'rb') as f:
+    chunk = f.read(ATTACHMENT_CHUNK_SIZE)
+    while chunk:
+      sha1.update(chunk)
+      size += len(chunk)
+      if copy_to is not None:
+        copy_to.write(chunk)
+      chunk = f.read(ATTACHMENT_CHUNK_SIZE)
+  return sha1.hexdigest(), size
+
 
 @attr.s(slots=True, frozen=True)
 class OutcomeDetails(object):
@@ -59,18 +121,126 @@ class Outcome(enum.Enum):
   ABORTED = 'ABORTED'
 
 
+class _AttachmentStore(object):
+  """Reference-counted files holding attachment data, keyed by SHA-1.
+
+  Attachments with identical contents share one file in the attachments
+  directory, which is removed once the last of them is closed.
+  """
+
+  def __init__(self):
+    self._lock = threading.Lock()
+    # (directory, sha1) -> filename, and filename -> reference count.
+    self._filenames = {}  # type: Dict[Tuple[Optional[Text], Text], Text]
+    self._refcounts = {}  # type: Dict[Text, int]
+    self._keys = {}  # type: Dict[Text, Tuple[Optional[Text], Text]]
+
+  def add(self, contents: bytes, sha1: Text) -> Text:
+    """Returns a file holding contents, writing it if not already stored."""
+    key = (CONF.attachments_directory, sha1)
+    with self._lock:
+      filename = self._filenames.get(key)
+      if filename is not None:
+        self._refcounts[filename] += 1
+        return filename
+      with tempfile.NamedTemporaryFile(
+          'w+b', dir=key[0], delete=False) as tf:
+        tf.write(contents)
+      self._filenames[key] = tf.name
+      self._refcounts[tf.name] = 1
+      self._keys[tf.name] = key
+      return tf.name
+
+  def add_file(self, source: Text,
+               move: bool = False) -> Tuple[Text, Text, int]:
+    """Stores the contents of a file without reading it all into memory.
+
+    The file is renamed into the store when move is True, reflinked when the
+    filesystem supports it, and otherwise copied while it is hashed.
+
+    Args:
+      source: The file to store.
+      move: If True, take ownership of source; it no longer exists afterwards.
+
+    Raises:
+      IOError: Raised if source couldn't be read.
+
+    Returns:
+      The stored filename, the SHA-1 hex digest and the size of the data.
+    """
+    directory = CONF.attachments_directory
+    with tempfile.NamedTemporaryFile('w+b', dir=directory, delete=False) as tf:
+      target = tf.name
+    try:
+      stored = False
+      if move:
+        try:
+          os.replace(source, target)
+          stored = True
+        except OSError:  # Most likely a different filesystem.
+          pass
+      else:
+        stored = _reflink(source, target)
+      if stored:
+        sha1, size = _hash_file(target)
+      else:
+        with open(target, 'wb') as copy_to:
+          sha1, size = _hash_file(source, copy_to)
+        if move:
+          os.remove(source)
+    except:  # pylint: disable=bare-except
+      os.remove(target)
+      raise
+
+    key = (directory, sha1)
+    with self._lock:
+      filename = self._filenames.get(key)
+      if filename is None:
+        self._filenames[key] = target
+        self._refcounts[target] = 1
+        self._keys[target] = key
+        return target, sha1, size
+      self._refcounts[filename] += 1
+    os.remove(target)
+    return filename, sha1, size
+
+  def acquire(self, filename: Text) -> Text:
+    """Adds a reference to a stored file."""
+    with self._lock:
+      self._refcounts[filename] += 1
+    return filename
+
+  def release(self, filename: Text) -> None:
+    """Drops a reference to a stored file, removing it after the last one."""
+    with self._lock:
+      self._refcounts[filename] -= 1
+      if self._refcounts[filename]:
+        return
+      del self._refcounts[filename]
+      del self._filenames[self._keys.pop(filename)]
+    os.remove(filename)
+
+  def refcount(self, filename: Text) -> int:
+    with self._lock:
+      return self._refcounts.get(filename, 0)
+
+
+_ATTACHMENT_STORE = _AttachmentStore()
+
+
 @attr.s(slots=True, init=False)
 class Attachment(object):
   """Encapsulate attachment data and guessed MIME type.
 
   Attachment avoids loading data into memory by saving it to temporary file and
   exposes data property method to dynamically read and serve the data upon
-  request.
+  request.  Attachments with the same data share a single file, which is
+  removed when the last of them is closed.
 
   Attributes:
     mimetype: str, MIME type of the data.
     sha1: str, SHA-1 hash of the data.
-    _file: Temporary File containing the data.
+    _filename: Temporary file containing the data, shared by content.
     data: property that reads the data from the temporary file.
     size: Number of bytes of data in the file
   """
@@ -86,26 +256,57 @@ class Attachment(object):
     self.mimetype = mimetype
     self.sha1 = hashlib.sha1(contents).hexdigest()
     self.size = len(contents)
-    self._filename = self._create_temp_file(contents)
+    self._filename = _ATTACHMENT_STORE.add(contents, self.sha1)
+
+  @classmethod
+  def _from_store(cls, filename: Text, mimetype: Text, sha1: Text,
+                  size: int) -> 'Attachment':
+    """Creates an Attachment owning a reference to a stored file."""
+    attachment = object.__new__(cls)
+    attachment.mimetype = mimetype
+    attachment.sha1 = sha1
+    attachment.size = size
+    attachment._filename = filename  # pylint: disable=protected-access
+    return attachment
+
+  @classmethod
+  def from_file(cls,
+                filename: Text,
+                mimetype: Text,
+                move: bool = False) -> 'Attachment':
+    """Creates an Attachment from a file without loading it into memory.
+
+    Args:
+      filename: The file holding the data.
+      mimetype: MIME type of the data.
+      move: If True, the file is moved into the attachments directory instead
+        of being copied; it must not be used by the caller afterwards.
+
+    Raises:
+      IOError: Raised if the given filename couldn't be read.
+
+    Returns:
+      The new Attachment.
+    """
+    stored, sha1, size = _ATTACHMENT_STORE.add_file(filename, move=move)
+    return cls._from_store(stored, mimetype, sha1, size)
 
   def __del__(self):
     self.close()
 
-  def _create_temp_file(self, contents: bytes) -> Text:
-    with tempfile.NamedTemporaryFile(
-        'w+b', dir=CONF.attachments_directory, delete=False) as tf:
-      tf.write(contents)
-      return tf.name
-
   @property
   def data(self) -> bytes:
-    with open(self._filename, 'rb') as contents:
+    with self.open() as contents:
       return contents.read()
 
+  def open(self) -> BinaryIO:
+    """Opens the file holding the data for reading."""
+    return open(self._filename, 'rb')
+
   def close(self):
     if not self._filename:
       return
-    os.remove(self._filename)
+    _ATTACHMENT_STORE.release(self._filename)
     self._filename = None
 
   def _asdict(self) -> Dict[Text, Any]:
@@ -116,13 +317,92 @@ class Attachment(object):
     }
 
   def __copy__(self) -> 'Attachment':
-    return Attachment(self.data, self.mimetype)
+    # Copies share the stored file, there is no data to duplicate.
+    return Attachment._from_store(
+        _ATTACHMENT_STORE.acquire(self._filename), self.mimetype, self.sha1,
+        self.size)
 
   def __deepcopy__(self, memo) -> 'Attachment':
     del memo  # Unused.
     return self.__copy__()
 
 
+@attr.s(slots=True, frozen=True)
+class AttachmentView(object):
+  """Read-only handle on the data of an Attachment.
+
+  Returned by TestApi.get_attachment so that attachments of earlier phases can
+  be read without duplicating their data; use copy() for an independent
+  Attachment.
+
+  Attributes:
+    mimetype: str, MIME type of the data.
+    sha1: str, SHA-1 hash of the data.
+    size: Number of bytes of data.
+    data: property that reads all of the data into memory.
+  """
+
+  _attachment = attr.ib(type=Attachment)
+
+  @property
+  def mimetype(self) -> Text:
+    return self._attachment.mimetype
+
+  @property
+  def sha1(self) -> Text:
+    return self._attachment.sha1
+
+  @property
+  def size(self) -> int:
+    return self._attachment.size
+
+  @property
+  def data(self) -> bytes:
+    return self._attachment.data
+
+  def open(self) -> BinaryIO:
+    """Opens the data for reading as a binary file object."""
+    return self._attachment.open()
+
+  @contextlib.contextmanager
+  def as_memoryview(self) -> Iterator[memoryview]:
+    """Memory-maps the data, yielding a read-only memoryview of it.
+
+    The memoryview, and any slice of it, must not be used after the context
+    exits.
+
+    Yields:
+      A read-only memoryview of the data.
+    """
+    if not self.size:
+      yield memoryview(b'')
+      return
+    with self.open() as f:
+      mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    try:
+      yield view
+    finally:
+      view.release()
+      mapped.close()
+
+  def iter_chunks(self,
+                  chunk_size: int = ATTACHMENT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Iterates over the data, chunk_size bytes at a time."""
+    with self.open() as f:
+      chunk = f.read(chunk_size)
+      while chunk:
+        yield chunk
+        chunk = f.read(chunk_size)
+
+  def copy(self) -> Attachment:
+    """Returns an independent copy of the attachment."""
+    return copy.copy(self._attachment)
+
+  def _asdict(self) -> Dict[Text, Any]:
+    return self._attachment._asdict()
+
+
 def _get_source_safely(obj: Any) -> Text:
   try:
     return inspect.getsource(obj)
@@ -162,6 +442,143 @@ class CodeInfo(object):
     return cls('', None, '')
 
 
+class _BoundedReader(object):
+  """File object reading at most size bytes of another file object."""
+
+  def __init__(self, fileobj: BinaryIO, size: int):
+    self._fileobj = fileobj
+    self._remaining = size
+
+  def read(self, size: int = -1) -> bytes:
+    if size < 0 or size > self._remaining:
+      size = self._remaining
+    chunk = self._fileobj.read(size)
+    self._remaining -= len(chunk)
+    return chunk
+
+
+class LogRecordStore(object):
+  """The log records of a test, spilling older ones to a compressed file.
+
+  Iterating yields every log record in order.  When memory_limit is set, at
+  most twice that many recent records are kept in memory; once they are
+  reached, the oldest memory_limit records are appended to the spill file as
+  one gzip member of JSON lines.
+  """
+
+  def __init__(self,
+               log_records: Iterable[logs.LogRecord] = (),
+               memory_limit: Optional[int] = None):
+    self.memory_limit = (
+        memory_limit if memory_limit is not None
+        else CONF.log_records_memory_limit)
+    self._lock = threading.Lock()
+    self._recent = []  # type: List[logs.LogRecord]
+    self._num_spilled = 0
+    self._spill_filename = None  # type: Optional[Text]
+    self._spill_size = 0
+    for log_record in log_records:
+      self.append(log_record)
+
+  def __del__(self):
+    self.close()
+
+  def __reduce__(self):
+    return type(self), (list(self), self.memory_limit)
+
+  def __len__(self) -> int:
+    with self._lock:
+      return self._num_spilled + len(self._recent)
+
+  def __eq__(self, other: Any) -> bool:
+    if isinstance(other, LogRecordStore):
+      other = list(other)
+    return list(self) == other
+
+  def __repr__(self) -> Text:
+    return '<%s: %d log records, %d spilled>' % (
+        type(self).__name__, len(self), self._num_spilled)
+
+  @property
+  def is_spilled(self) -> bool:
+    return self._spill_filename is not None
+
+  @property
+  def num_spilled(self) -> int:
+    """Number of log records in the spill file."""
+    return self._num_spilled
+
+  @property
+  def spill_size(self) -> int:
+    """Size in bytes of the spill file."""
+    return self._spill_size
+
+  @property
+  def num_recent(self) -> int:
+    """Number of log records kept in memory."""
+    return len(self._recent)
+
+  def recent(self) -> List[logs.LogRecord]:
+    """Returns the log records kept in memory, the most recent ones."""
+    with self._lock:
+      return list(self._recent)
+
+  def append(self, log_record: logs.LogRecord) -> None:
+    with self._lock:
+      self._recent.append(log_record)
+      if self.memory_limit and len(self._recent) >= 2 * self.memory_limit:
+        self._spill(self._recent[:self.memory_limit])
+        del self._recent[:self.memory_limit]
+
+  def _spill(self, log_records: List[logs.LogRecord]) -> None:
+    """Appends log records to the spill file; must hold the lock."""
+    if self._spill_filename is None:
+      with tempfile.NamedTemporaryFile(
+          'wb', dir=CONF.attachments_directory, suffix='.log.gz',
+          delete=False) as tf:
+        self._spill_filename = tf.name
+    lines = ''.join(json.dumps(log_record) + '\n' for log_record in log_records)
+    member = gzip.compress(lines.encode('utf-8'))
+    with open(self._spill_filename, 'ab') as f:
+      f.write(member)
+    self._spill_size += len(member)
+    self._num_spilled += len(log_records)
+
+  def __iter__(self) -> Iterator[logs.LogRecord]:
+    with self._lock:
+      recent = list(self._recent)
+      filename = self._spill_filename
+      spill_size = self._spill_size
+    if filename is not None:
+      # Only read the members written so far, more may be appended meanwhile.
+      with open(filename, 'rb') as f:
+        with gzip.GzipFile(fileobj=_BoundedReader(f, spill_size)) as gz:
+          for line in io.TextIOWrapper(gz, encoding='utf-8'):
+            level, logger_name, source, lineno, timestamp_millis, message = (
+                json.loads(line))
+            yield logs.LogRecord(level, sys.intern(logger_name),
+                                 sys.intern(source), lineno, timestamp_millis,
+                                 message)
+    for log_record in recent:
+      yield log_record
+
+  def close(self) -> None:
+    """Removes the spill file; only the recent log records remain."""
+    if getattr(self, '_spill_filename', None) is None:
+      return
+    os.remove(self._spill_filename)
+    self._spill_filename = None
+    self._spill_size = 0
+    self._num_spilled = 0
+
+
+def _as_log_record_store(
+    log_records: Iterable[logs.LogRecord]) -> LogRecordStore:
+  if isinstance(log_records, LogRecordStore):
+    return log_records
+  return LogRecordStore(log_records)
+
+
 @attr.s(slots=True)
 class TestRecord(object):
   """The record of a single run of a test."""
@@ -181,7 +598,9 @@ class TestRecord(object):
   diagnosers = attr.ib(
       type=List['diagnoses_lib.BaseTestDiagnoser'], factory=list)
   diagnoses = attr.ib(type=List['diagnoses_lib.Diagnosis'], factory=list)
-  log_records = attr.ib(type=List[logs.LogRecord], factory=list)
+  log_records = attr.ib(
+      type=LogRecordStore, factory=LogRecordStore,
+      converter=_as_log_record_store)
   marginal = attr.ib(type=Optional[bool], default=None)
 
   # Cache fields to reduce repeated base type conversions.
@@ -194,6 +613,8 @@ class TestRecord(object):
   _cached_diagnoses = attr.ib(type=List[Dict[Text, Any]], factory=list)
   _cached_log_records = attr.ib(type=List[Dict[Text, Any]], factory=list)
   _cached_config_from_metadata = attr.ib(type=Dict[Text, Any], factory=dict)
+  # Maps metadata keys to their immutable value and its base type conversion.
+  _cached_metadata = attr.ib(type=Dict[Text, Tuple[Any, Any]], factory=dict)
 
   def __attrs_post_init__(self) -> None:
     # Cache data that does not change during execution.
@@ -221,6 +642,13 @@ class TestRecord(object):
     self.phases.append(phase_record)
     self._cached_phases.append(phase_record.as_base_types())
 
+  def refresh_phase_record(self, phase_record: 'PhaseRecord') -> None:
+    """Updates the cached base types of a phase record changed after adding."""
+    for index in range(len(self.phases) - 1, -1, -1):
+      if self.phases[index] is phase_record:
+        self._cached_phases[index] = phase_record.as_base_types()
+        return
+
   def add_subtest_record(self, subtest_record: 'SubtestRecord') -> None:
     self.subtests.append(subtest_record)
     self._cached_subtests.append(data.convert_to_base_types(subtest_record))
@@ -242,11 +670,21 @@ class TestRecord(object):
   def add_log_record(self, log_record: logs.LogRecord) -> None:
     self.log_records.append(log_record)
     self._cached_log_records.append(log_record._asdict())
+    # Only the log records kept in memory are cached, for live viewing.
+    excess = len(self._cached_log_records) - self.log_records.num_recent
+    if excess > 0:
+      del self._cached_log_records[:excess]
 
   def as_base_types(self) -> Dict[Text, Any]:
-    """Convert to a dict representation composed exclusively of base types."""
-    metadata = data.convert_to_base_types(
-        self.metadata, ignore_keys=('config',))
+    """Convert to a dict representation composed exclusively of base types.
+
+    Only the log records kept in memory are included, see
+    all_log_records_as_base_types().
+
+    Returns:
+      The dict representation of the record.
+    """
+    metadata = self._metadata_as_base_types()
     metadata['config'] = self._cached_config_from_metadata
     ret = {
         'dut_id': data.convert_to_base_types(self.dut_id),
@@ -266,6 +704,58 @@ class TestRecord(object):
     ret.update(self._cached_record)
     return ret
 
+  def _metadata_as_base_types(self) -> Dict[Text, Any]:
+    """Converts the metadata but its config, see as_base_types().
+
+    Immutable values are only converted again once another value is set for
+    their key, so that polling a running test does not convert them each time.
+    """
+    ignore_keys = ('config',)
+    metadata = {}
+    cached_metadata = {}
+    # Copy the items at once, the test may set metadata while they are read.
+    for key, value in list(self.metadata.items()):
+      if key in ignore_keys:
+        continue
+      cached = self._cached_metadata.get(key)
+      if cached is not None and cached[0] is value:
+        converted = cached[1]
+      else:
+        converted = data.convert_to_base_types(value, ignore_keys)
+      if _is_immutable(value):
+        cached_metadata[key] = (value, converted)
+      metadata[data.convert_to_base_types(key, ignore_keys)] = converted
+    self._cached_metadata = cached_metadata
+    return metadata
+
+  def snapshot(self) -> Dict[Text, Any]:
+    """Like as_base_types(), but unaffected by later updates to the record.
+
+    The cached lists are copied; the items in them are never modified once
+    added, so they are shared with the cache.
+
+    Returns:
+      The dict representation of the record.
+    """
+    ret = self.as_base_types()
+    for key in ('phases', 'subtests', 'branches', 'diagnoses', 'log_records'):
+      ret[key] = list(ret[key])
+    return ret
+
+  def all_log_records_as_base_types(self) -> List[Dict[Text, Any]]:
+    """Returns every log record, including spilled ones, as base types."""
+    if not self.log_records.is_spilled:
+      return self._cached_log_records
+    return [log_record._asdict() for log_record in self.log_records]
+
+
+def _is_immutable(value: Any) -> bool:
+  """Returns whether value is of a type that cannot be modified in place."""
+  if isinstance(value, tuple):
+    return all(_is_immutable(item) for item in value)
+  return value is None or isinstance(
+      value, (str, bytes, int, float, complex, enum.Enum))
+
 
 @attr.s(slots=True, frozen=True)
 class BranchRecord(object):
@@ -23,6 +23,7 @@ invocation of an openhtf.Test instance.
 """
 
 import collections
+from concurrent import futures
 import contextlib
 import copy
 import enum
@@ -33,6 +34,7 @@ import mimetypes
 import os
 import socket
 import sys
+import threading
 from typing import Any, Dict, Iterator, List, Optional, Set, Text, Tuple, TYPE_CHECKING, Union
 
 import attr
@@ -70,6 +72,45 @@ CONF.declare(
     'station_id',
     'The name of this test station',
     default_value=socket.gethostname())
+CONF.declare(
+    'state_notify_min_interval_s',
+    default_value=0,
+    description='Minimum number of seconds between wake-ups of watchers of a '
+    'running test state, such as the station server.  Updates within the '
+    'interval are coalesced into a single trailing notification; 0 notifies '
+    'watchers on every update.')
+CONF.declare(
+    'measurement_validation_workers',
+    default_value=0,
+    description='Number of worker threads validating multi-dimensional '
+    'measurements after their phase finishes, overlapping validation with the '
+    'next phase.  Outcomes are settled before anything reads them, such as '
+    'checkpoints, diagnosers and test finalization; 0 validates synchronously '
+    'at the end of each phase.')
+CONF.declare(
+    'record_memory_usage',
+    default_value=False,
+    description='If True, the memory usage of a test, as reported by '
+    'TestState.memory_usage(), is saved under the "memory_usage" key of the '
+    'test record metadata when the test finishes.')
+
+_VALIDATION_POOL = None  # type: Optional[futures.ThreadPoolExecutor]
+_VALIDATION_POOL_WORKERS = 0
+_VALIDATION_POOL_LOCK = threading.Lock()
+
+
+def _validation_pool() -> futures.ThreadPoolExecutor:
+  """Returns the worker pool for measurement validation, sized from CONF."""
+  global _VALIDATION_POOL, _VALIDATION_POOL_WORKERS
+  with _VALIDATION_POOL_LOCK:
+    workers = CONF.measurement_validation_workers
+    if _VALIDATION_POOL is None or _VALIDATION_POOL_WORKERS != workers:
+      if _VALIDATION_POOL is not None:
+        _VALIDATION_POOL.shutdown(wait=False)
+      _VALIDATION_POOL = futures.ThreadPoolExecutor(
+          max_workers=workers, thread_name_prefix='MeasurementValidation')
+      _VALIDATION_POOL_WORKERS = workers
+    return _VALIDATION_POOL
 
 
 class _Infer(enum.Enum):
@@ -169,7 +210,8 @@ class TestState(util.SubscribableStateMixin):
       execution_uid: a unique uuid use to identify a test being run.
       test_options: test_options passed through from Test.
     """
-    super(TestState, self).__init__()
+    super(TestState, self).__init__(
+        min_notify_interval_s=CONF.state_notify_min_interval_s)
     self._status = self.Status.WAITING_FOR_TEST_START  # type: TestState.Status
 
     self.test_record = test_record.TestRecord(
@@ -183,8 +225,10 @@ class TestState(util.SubscribableStateMixin):
     logs.initialize_record_handler(execution_uid, self.test_record,
                                    self.notify_update)
     self.state_logger = logs.get_record_logger_for(execution_uid)
-    self.plug_manager = plugs.PlugManager(test_desc.plug_types,
-                                          self.state_logger)
+    self.plug_manager = plugs.PlugManager(
+        test_desc.plug_types,
+        self.state_logger,
+        shared_plugs=test_options.shared_plugs)
     self.diagnoses_manager = diagnoses_lib.DiagnosesManager(
         self.state_logger.getChild('diagnoses'))
     self.running_phase_state = None  # type: Optional['PhaseState']
@@ -193,6 +237,13 @@ class TestState(util.SubscribableStateMixin):
     self.user_defined_state = {}  # type: Any
     self.execution_uid = execution_uid
     self.test_options = test_options
+    # Phases whose measurement validation is still running on the pool.
+    self._deferred_phase_states = []  # type: List['PhaseState']
+    self._deferred_lock = threading.RLock()
+    # (outcome, phase name) of the first deferred validation that raised.
+    self.deferred_validation_error = None  # type: Optional[Tuple[phase_executor.PhaseExecutionOutcome, Text]]
+    # Most recent measurement of each name from finished, non-skipped phases.
+    self._measurement_index = {}  # type: Dict[Text, measurements.Measurement]
 
   def close(self) -> None:
     """Close and remove any global registrations.
@@ -238,27 +289,28 @@ class TestState(util.SubscribableStateMixin):
       )
     return self._running_test_api
 
-  def get_attachment(self,
-                     attachment_name: Text) -> Optional[test_record.Attachment]:
-    """Get a copy of an attachment from current or previous phases.
+  def get_attachment(
+      self,
+      attachment_name: Text) -> Optional[test_record.AttachmentView]:
+    """Get a read-only view of an attachment from current or previous phases.
 
     Args:
       attachment_name:  str of the attachment name
 
     Returns:
-      A copy of the attachment or None if the attachment cannot be found.
+      An AttachmentView or None if the attachment cannot be found.
     """
     # Check current running phase state for the attachment name first.
     if self.running_phase_state:
       if attachment_name in self.running_phase_state.phase_record.attachments:
         attachment = self.running_phase_state.phase_record.attachments.get(
             attachment_name)
-        return copy.deepcopy(attachment)
+        return test_record.AttachmentView(attachment)
 
     for phase_record in self.test_record.phases:
       if attachment_name in phase_record.attachments:
         attachment = phase_record.attachments[attachment_name]
-        return copy.deepcopy(attachment)
+        return test_record.AttachmentView(attachment)
 
     self.state_logger.warning('Could not find attachment: %s', attachment_name)
     return None
@@ -276,22 +328,17 @@ class TestState(util.SubscribableStateMixin):
     Returns:
       an ImmutableMeasurement or None if the measurement cannot be found.
     """
-    # The framework ignores measurements from SKIP and REPEAT phases
-    ignore_outcomes = {test_record.PhaseOutcome.SKIP}
-
     # Check current running phase state
     if self.running_phase_state:
       if measurement_name in self.running_phase_state.measurements:
         return ImmutableMeasurement.from_measurement(
             self.running_phase_state.measurements[measurement_name])
 
-    # Iterate through phases in reversed order to return most recent (necessary
-    # because measurement and phase names are not necessarily unique)
-    for phase_record in reversed(self.test_record.phases):
-      if (phase_record.result not in ignore_outcomes and
-          measurement_name in phase_record.measurements):
-        measurement = phase_record.measurements[measurement_name]
-        return ImmutableMeasurement.from_measurement(measurement)
+    self.settle_phase_outcomes()
+
+    measurement = self._measurement_index.get(measurement_name)
+    if measurement is not None:
+      return ImmutableMeasurement.from_measurement(measurement)
 
     self.state_logger.warning('Could not find measurement: %s',
                               measurement_name)
@@ -326,10 +373,58 @@ class TestState(util.SubscribableStateMixin):
     finally:
       phase_state.finalize()
       self.test_record.add_phase_record(phase_state.phase_record)
+      self._index_measurements(phase_state)
       self.running_phase_state = None
       self._running_test_api = None
       self.notify_update()  # Phase finished.
 
+  def _index_measurements(self, phase_state: 'PhaseState') -> None:
+    """Makes a finished phase's measurements the most recent ones by name.
+
+    The framework ignores measurements from SKIP and REPEAT phases.  Later
+    phases win since measurement and phase names are not necessarily unique.
+
+    Args:
+      phase_state: PhaseState of the phase that just finished.
+    """
+    if not phase_state.is_skip:
+      self._measurement_index.update(phase_state.measurements)
+
+  def defer_phase_outcome(self, phase_state: 'PhaseState') -> None:
+    """Registers a phase whose measurements are validated in the background."""
+    with self._deferred_lock:
+      self._deferred_phase_states.append(phase_state)
+
+  def settle_phase_outcomes(self) -> None:
+    """Waits for deferred measurement validation and sets the phase outcomes.
+
+    Must be called before reading phase or measurement outcomes of finished
+    phases; the first validation that raised is kept in
+    deferred_validation_error.
+    """
+    with self._deferred_lock:
+      if not self._deferred_phase_states:
+        return
+      for phase_state in self._deferred_phase_states:
+        if (phase_state.settle_outcome() and
+            self.deferred_validation_error is None):
+          self.deferred_validation_error = (phase_state.result,
+                                            phase_state.name)
+        self.test_record.refresh_phase_record(phase_state.phase_record)
+      self._deferred_phase_states = []
+    self.notify_update()  # Phase outcomes changed.
+
+  def branch(self) -> 'BranchTestState':
+    """Returns a view of this state for one node of a ParallelSequence."""
+    return BranchTestState(self)
+
+  def merge_branch(self, branch: 'BranchTestState') -> None:
+    """Adds the records of a finished branch to the test record."""
+    for add_record, record in branch.test_record.added_records:
+      getattr(self.test_record, add_record)(record)
+    self._measurement_index.update(branch.measurement_index)
+    self.notify_update()
+
   def as_base_types(self) -> Dict[Text, Any]:
     """Convert to a dict representation composed exclusively of base types."""
     running_phase_state = None
@@ -342,9 +437,96 @@ class TestState(util.SubscribableStateMixin):
         'running_phase_state': running_phase_state,
     }
 
+  def snapshot(self) -> Dict[Text, Any]:
+    """Returns a consistent view of the test state for concurrent readers.
+
+    Unlike as_base_types(), whose cached dicts are updated in place, the
+    returned dict is not modified by later updates, so it can be serialized
+    while phases keep running, without locking them.  Measurements that did
+    not change since the previous snapshot are not copied again.
+
+    Returns:
+      Dict representation of the test's state, composed of base types.
+    """
+    running_phase_state = self.running_phase_state
+    return {
+        'status': data.convert_to_base_types(self._status),
+        'test_record': self.test_record.snapshot(),
+        'plugs': self.plug_manager.as_base_types(),
+        'running_phase_state': (running_phase_state.snapshot()
+                                if running_phase_state else None),
+    }
+
   def _asdict(self) -> Dict[Text, Any]:
-    """Return a dict representation of the test's state."""
-    return self.as_base_types()
+    """Return a consistent dict representation of the test's state."""
+    return self.snapshot()
+
+  def memory_usage(self) -> Dict[Text, Any]:
+    """Estimates the memory held by each part of the test.
+
+    Sizes are estimated with data.total_size(), which samples large
+    containers.
+
+    Returns:
+      A dict of base types with:
+        phases: list with the name, descriptor_id and measurement_bytes of each
+          finished phase, followed by the running phase if any.
+        attachments: count of attachments, bytes_on_disk of their distinct
+          stored files and bytes_in_memory of the Attachment objects.
+        log_records: count of log records, how many were spilled, the
+          spill_bytes on disk and bytes_in_memory of the in-memory records.
+        plugs: dict of plug name to the bytes of its reported state.
+        total_bytes_in_memory: sum of the in-memory estimates above.
+    """
+    # Measurements are only added to the record when their phase finishes.
+    phase_records = [(phase_record, phase_record.measurements)
+                     for phase_record in list(self.test_record.phases)]
+    running_phase_state = self.running_phase_state
+    if running_phase_state:
+      phase_records.append((running_phase_state.phase_record,
+                            running_phase_state.measurements))
+    phases = []
+    attachments = []
+    for phase_record, phase_measurements in phase_records:
+      phases.append({
+          'name': phase_record.name,
+          'descriptor_id': phase_record.descriptor_id,
+          'measurement_bytes': data.total_size([
+              measurement.measured_value
+              for measurement in dict(phase_measurements).values()
+          ]),
+      })
+      attachments.extend(dict(phase_record.attachments).values())
+
+    log_records = self.test_record.log_records
+    log_records_in_memory = data.total_size(
+        (log_records.recent(), self.test_record.as_base_types()['log_records']))
+    plugs = {
+        name: data.total_size(plug_state) for name, plug_state in
+        self.plug_manager.as_base_types()['plug_states'].items()
+    }
+    attachments_in_memory = data.total_size(attachments)
+    return {
+        'phases': phases,
+        'attachments': {
+            'count': len(attachments),
+            'bytes_on_disk': sum(
+                {attachment.sha1: attachment.size
+                 for attachment in attachments}.values()),
+            'bytes_in_memory': attachments_in_memory,
+        },
+        'log_records': {
+            'count': len(log_records),
+            'spilled': log_records.num_spilled,
+            'spill_bytes': log_records.spill_size,
+            'bytes_in_memory': log_records_in_memory,
+        },
+        'plugs': plugs,
+        'total_bytes_in_memory': (
+            sum(phase['measurement_bytes'] for phase in phases) +
+            attachments_in_memory + log_records_in_memory +
+            sum(plugs.values())),
+    }
 
   @property
   def is_finalized(self) -> bool:
@@ -499,6 +681,7 @@ class TestState(util.SubscribableStateMixin):
     if self._is_aborted():
       return
 
+    self.settle_phase_outcomes()
     phases = self.test_record.phases
     if not phases:
       # Vacuously PASS a TestRecord with no phases.
@@ -551,6 +734,9 @@ class TestState(util.SubscribableStateMixin):
     assert not self.is_finalized or aborting, (
         'Test already completed with status %s!' % self._status.name)
 
+    if CONF.record_memory_usage and not self.is_finalized:
+      self.test_record.metadata['memory_usage'] = self.memory_usage()
+
     self.test_record.outcome = test_outcome
 
     # If we've reached here without 'starting' the test, then we 'start' it just
@@ -585,6 +771,81 @@ class TestState(util.SubscribableStateMixin):
     )
 
 
+class _BranchTestRecord(object):
+  """View of a TestRecord that holds back the records added to it.
+
+  Phase, subtest, branch and checkpoint records are kept in added_records
+  instead of being added to the underlying record; everything else reads and
+  writes the underlying record.
+  """
+
+  def __init__(self, record: test_record.TestRecord):
+    object.__setattr__(self, '_record', record)
+    object.__setattr__(self, '_phases', [])
+    # (name of the TestRecord method adding the record, record) tuples.
+    object.__setattr__(self, 'added_records', [])
+
+  @property
+  def phases(self) -> List[test_record.PhaseRecord]:
+    return self._record.phases + self._phases
+
+  def add_phase_record(self, phase_record: test_record.PhaseRecord) -> None:
+    self._phases.append(phase_record)
+    self.added_records.append(('add_phase_record', phase_record))
+
+  def add_subtest_record(self,
+                         subtest_record: test_record.SubtestRecord) -> None:
+    self.added_records.append(('add_subtest_record', subtest_record))
+
+  def add_branch_record(self, branch_record: test_record.BranchRecord) -> None:
+    self.added_records.append(('add_branch_record', branch_record))
+
+  def add_checkpoint_record(
+      self, checkpoint_record: test_record.CheckpointRecord) -> None:
+    self.added_records.append(('add_checkpoint_record', checkpoint_record))
+
+  def __getattr__(self, name: Text) -> Any:
+    return getattr(self._record, name)
+
+  def __setattr__(self, name: Text, value: Any) -> None:
+    setattr(self._record, name, value)
+
+
+class BranchTestState(object):
+  """View of a TestState for one node of a ParallelSequence.
+
+  Each node running concurrently gets its own view, which tracks the phase it
+  is running and holds back the records it adds until TestState.merge_branch()
+  adds them to the test record, so that the test record does not depend on the
+  order in which the nodes finish.  Everything else is shared with the
+  underlying TestState.
+  """
+
+  def __init__(self, state: TestState):
+    self._state = state
+    self.test_record = _BranchTestRecord(state.test_record)
+    self.running_phase_state = None  # type: Optional['PhaseState']
+    self._running_test_api = None  # type: Optional['test_descriptor.TestApi']
+    # Measurements of this branch, on top of the ones of the whole test.
+    self.measurement_index = {}  # type: Dict[Text, measurements.Measurement]
+    self._measurement_index = collections.ChainMap(
+        self.measurement_index, state._measurement_index)  # pylint: disable=protected-access
+
+  branch = TestState.branch
+  merge_branch = TestState.merge_branch
+  logger = TestState.logger
+  test_api = TestState.test_api
+  get_attachment = TestState.get_attachment
+  get_measurement = TestState.get_measurement
+  running_phase_context = TestState.running_phase_context
+  _index_measurements = TestState._index_measurements  # pylint: disable=protected-access
+  stop_running_phase = TestState.stop_running_phase
+  last_run_phase_name = TestState.last_run_phase_name
+
+  def __getattr__(self, name: Text) -> Any:
+    return getattr(self._state, name)
+
+
 @attr.s
 class PhaseState(object):
   """Data type encapsulating interesting information about a running phase.
@@ -618,6 +879,12 @@ class PhaseState(object):
   hit_repeat_limit = attr.ib(type=bool, default=False)
   _cached = attr.ib(type=Dict[Text, Any], factory=dict)
   _update_measurements = attr.ib(type=Set[Text], factory=set)
+  _pending_validation = attr.ib(type=Optional[futures.Future], default=None)
+  # Per measurement, the number of updates and the latest snapshot with the
+  # number of updates it reflects.
+  _versions = attr.ib(type=Dict[Text, int], factory=dict)
+  _snapshots = attr.ib(type=Dict[Text, Tuple[int, Dict[Text, Any]]],
+                       factory=dict)
 
   def __attrs_post_init__(self):
     for m in self.measurements.values():
@@ -648,9 +915,10 @@ class PhaseState(object):
                       logger: logging.Logger) -> 'PhaseState':
     """Create a PhaseState from a phase descriptor."""
     # Measurements are copied because their state is modified during the phase
-    # execution.
+    # execution.  Only the per-run state is new, declarations are shared.
     measurements_copy = [
-        copy.deepcopy(measurement) for measurement in phase_desc.measurements
+        measurement.copy_declaration()
+        for measurement in phase_desc.measurements
     ]
     diag_store = test_state.diagnoses_manager.store
     for m in measurements_copy:
@@ -672,6 +940,8 @@ class PhaseState(object):
     )
 
   def _notify(self, measurement_name: Text) -> None:
+    self._versions[measurement_name] = self._versions.get(measurement_name,
+                                                          0) + 1
     self._update_measurements.add(measurement_name)
     self.test_state.notify_update()
 
@@ -685,6 +955,27 @@ class PhaseState(object):
       self.measurements[m].as_base_types()
     return self._cached
 
+  def snapshot(self) -> Dict[Text, Any]:
+    """Like as_base_types(), but unaffected by later updates to the phase."""
+    measurements_snapshot = {}
+    for name, measurement in self.measurements.items():
+      # Read the version first, an update racing with the copy below then
+      # leaves it stale and it is copied again next time.
+      version = self._versions.get(name, 0)
+      snapshot = self._snapshots.get(name)
+      if snapshot is None or snapshot[0] != version:
+        measurement_dict = dict(measurement.as_base_types())
+        measured_value = measurement_dict.get('measured_value')
+        if isinstance(measured_value, list):
+          # The rows of dimensioned measurements are patched in place.
+          measurement_dict['measured_value'] = list(measured_value)
+        snapshot = self._snapshots[name] = (version, measurement_dict)
+      measurements_snapshot[name] = snapshot[1]
+    ret = dict(self._cached)
+    ret['measurements'] = measurements_snapshot
+    ret['attachments'] = dict(self._cached['attachments'])
+    return ret
+
   @property
   def result(self) -> Optional[phase_executor.PhaseExecutionOutcome]:
     return self.phase_record.result
@@ -693,6 +984,14 @@ class PhaseState(object):
   def result(self, result: phase_executor.PhaseExecutionOutcome):
     self.phase_record.result = result
 
+  @property
+  def is_skip(self) -> bool:
+    """Whether the phase outcome is, or will be settled as, SKIP."""
+    result = self.result
+    if result is None or result.is_terminal or self.hit_repeat_limit:
+      return False
+    return result.is_repeat or result.is_skip
+
   def set_subtest_name(self, subtest_name: Text) -> None:
     self.phase_record.subtest_name = subtest_name
     self._cached['subtest_name'] = subtest_name
@@ -726,25 +1025,19 @@ class PhaseState(object):
       DuplicateAttachmentError: Raised if there is already an attachment with
         the given name.
     """
-    if name in self.phase_record.attachments:
-      raise DuplicateAttachmentError('Duplicate attachment for %s' % name)
-
-    if mimetype is INFER_MIMETYPE:
-      mimetype = mimetypes.guess_type(name)[0]
-    elif mimetype is not None and not mimetypes.guess_extension(mimetype):
-      self.logger.warning('Unrecognized MIME type: "%s" for attachment "%s"',
-                          mimetype, name)
-
-    attach_record = test_record.Attachment(binary_data, mimetype)
-    self.phase_record.attachments[name] = attach_record
-    self._cached['attachments'][name] = attach_record._asdict()
+    mimetype = self._check_attachment(name, mimetype)
+    self._add_attachment(name, test_record.Attachment(binary_data, mimetype))
 
   def attach_from_file(self,
                        filename: Text,
                        name: Optional[Text] = None,
-                       mimetype: MimetypeT = INFER_MIMETYPE) -> None:
+                       mimetype: MimetypeT = INFER_MIMETYPE,
+                       move: bool = False) -> None:
     """Store the contents of the given filename as an attachment.
 
+    The file is streamed into the attachments directory, never read into
+    memory as a whole.
+
     Args:
       filename: The file to read data from to attach.
       name: If provided, override the attachment name, otherwise it will default
@@ -754,19 +1047,39 @@ class PhaseState(object):
             and second (i.e. as a fallback), from the attachment name.
           * None: The type will be left unspecified.
           * A string: The type will be set to the specified value.
+      move: If True, the attachment takes ownership of the file, which is
+        moved rather than copied when possible and no longer exists afterwards.
 
     Raises:
       DuplicateAttachmentError: Raised if there is already an attachment with
         the given name.
       IOError: Raised if the given filename couldn't be opened.
     """
+    if name is None:
+      name = os.path.basename(filename)
     if mimetype is INFER_MIMETYPE:
       mimetype = mimetypes.guess_type(filename)[0] or mimetype
-    with open(filename, 'rb') as f:
-      self.attach(
-          name if name is not None else os.path.basename(filename),
-          f.read(),
-          mimetype=mimetype)
+    mimetype = self._check_attachment(name, mimetype)
+    self._add_attachment(
+        name, test_record.Attachment.from_file(filename, mimetype, move=move))
+
+  def _check_attachment(self, name: Text,
+                        mimetype: MimetypeT) -> Optional[Text]:
+    """Checks the name of a new attachment and returns its MIME type."""
+    if name in self.phase_record.attachments:
+      raise DuplicateAttachmentError('Duplicate attachment for %s' % name)
+
+    if mimetype is INFER_MIMETYPE:
+      mimetype = mimetypes.guess_type(name)[0]
+    elif mimetype is not None and not mimetypes.guess_extension(mimetype):
+      self.logger.warning('Unrecognized MIME type: "%s" for attachment "%s"',
+                          mimetype, name)
+    return mimetype
+
+  def _add_attachment(self, name: Text,
+                      attach_record: test_record.Attachment) -> None:
+    self.phase_record.attachments[name] = attach_record
+    self._cached['attachments'][name] = attach_record._asdict()
 
   def add_diagnosis(self, diagnosis: diagnoses_lib.Diagnosis) -> None:
     if diagnosis.is_failure:
@@ -783,7 +1096,18 @@ class PhaseState(object):
     for measurement in self.measurements.values():
       # Clear notification callbacks for later serialization.
       measurement.set_notification_callback(None)
-      # Validate multi-dimensional measurements now that we have all values.
+
+    # Set final values on the PhaseRecord.
+    self.phase_record.measurements = self.measurements
+
+  def _validate_measurements(self) -> bool:
+    """Validate multi-dimensional measurements now that we have all values.
+
+    Returns:
+      True if a validator raised and the exception became the phase result.
+    """
+    raised = False
+    for measurement in self.measurements.values():
       if measurement.outcome is measurements.Outcome.PARTIALLY_SET:
         try:
           measurement.validate()
@@ -796,9 +1120,36 @@ class PhaseState(object):
           else:
             self.phase_record.result = phase_executor.PhaseExecutionOutcome(
                 phase_executor.ExceptionInfo(*sys.exc_info()))
+            raised = True
+    return raised
 
-    # Set final values on the PhaseRecord.
-    self.phase_record.measurements = self.measurements
+  def _can_defer_validation(self) -> bool:
+    """Whether the phase outcome can be settled after the phase returns.
+
+    Only when nothing needs the outcome right away: phase diagnosers, repeats
+    on measurement failure and stopping on the first failure all read it as
+    soon as the phase finishes.
+    """
+    if not CONF.measurement_validation_workers or self.diagnosers:
+      return False
+    if (self.options.repeat_on_measurement_fail or
+        self.test_state.test_options.stop_on_first_failure or
+        CONF.stop_on_first_failure):
+      return False
+    return any(measurement.outcome is measurements.Outcome.PARTIALLY_SET
+               for measurement in self.measurements.values())
+
+  def settle_outcome(self) -> bool:
+    """Waits for deferred measurement validation and sets the phase outcome.
+
+    Returns:
+      True if a validator raised and the exception became the phase result.
+    """
+    raised = self._pending_validation.result()
+    self._pending_validation = None
+    self._set_prediagnosis_phase_outcome()
+    self._set_postdiagnosis_phase_outcome()
+    return raised
 
   def _measurements_pass(self) -> bool:
     allowed_outcomes = {measurements.Outcome.PASS}
@@ -888,6 +1239,17 @@ class PhaseState(object):
 
   def finalize(self) -> None:
     self._finalize_measurements()
+    if self._can_defer_validation():
+      # The outcome is set by TestState.settle_phase_outcomes().
+      self._pending_validation = _validation_pool().submit(
+          self._validate_measurements)
+      self.test_state.defer_phase_outcome(self)
+      self.phase_record.finalize_phase(self.options)
+      return
+    if self.diagnosers:
+      # Diagnosers may read the outcomes of earlier phases.
+      self.test_state.settle_phase_outcomes()
+    self._validate_measurements()
     self._set_prediagnosis_phase_outcome()
     self._execute_phase_diagnosers()
     self._set_postdiagnosis_phase_outcome()
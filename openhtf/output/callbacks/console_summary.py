@@ -16,20 +16,31 @@
 
 import os
 import sys
-from typing import TextIO
+from typing import Any, Optional, TextIO
 
 from openhtf.core import measurements
 from openhtf.core import test_record
 
+# Same as the default point budget of the station server frontend.
+_DEFAULT_SUMMARY_THRESHOLD_POINTS = 1000
+
 
 class ConsoleSummary():
-  """Print test results with failure info on console."""
+  """Print test results with failure info on console.
+
+  Failed dimensioned measurements holding more points than
+  summary_threshold_points are printed as summary statistics instead of their
+  values.  By default, the threshold is the spill threshold of the measurement,
+  or 1000 points if it does not spill.
+  """
 
   # pylint: disable=invalid-name
   def __init__(self,
                indent: int = 2,
-               output_stream: TextIO = sys.stdout) -> None:
+               output_stream: TextIO = sys.stdout,
+               summary_threshold_points: Optional[int] = None) -> None:
     self.indent = ' ' * indent
+    self.summary_threshold_points = summary_threshold_points
     if os.name == 'posix':  # Linux and Mac.
       self.RED = '\033[91m'
       self.GREEN = '\033[92m'
@@ -54,6 +65,16 @@ class ConsoleSummary():
 
   # pylint: enable=invalid-name
 
+  def _should_summarize(self, measured_value: Any) -> bool:
+    if not isinstance(measured_value, measurements.DimensionedMeasuredValue):
+      return False
+    threshold = self.summary_threshold_points
+    if threshold is None:
+      threshold = measured_value.spill_threshold
+    if threshold is None:
+      threshold = _DEFAULT_SUMMARY_THRESHOLD_POINTS
+    return len(measured_value.value_dict) > threshold
+
   def __call__(self, record: test_record.TestRecord) -> None:
     output_lines = [
         ''.join((self.color_table[record.outcome], self.BOLD,
@@ -73,8 +94,14 @@ class ConsoleSummary():
 
             output_lines.append('%sfailed_item: %s (%s)' %
                                 (self.indent, name, measurement.outcome))
-            output_lines.append('%smeasured_value: %s' %
-                                (self.indent * 2, measurement.measured_value))
+            if self._should_summarize(measurement.measured_value):
+              # Large sweeps would flood the console, print statistics only.
+              output_lines.append(
+                  '%smeasured_value_summary: %s' %
+                  (self.indent * 2, measurement.measured_value.summary))
+            else:
+              output_lines.append('%smeasured_value: %s' %
+                                  (self.indent * 2, measurement.measured_value))
             output_lines.append('%svalidators:' % (self.indent * 2))
             for validator in measurement.validators:
               output_lines.append('%svalidator: %s' %
@@ -16,6 +16,7 @@
 
 import base64
 import json
+import uuid
 from typing import Any, BinaryIO, Callable, Dict, Iterator, Text, Union
 
 from openhtf.core import test_record
@@ -23,15 +24,47 @@ from openhtf.output import callbacks
 from openhtf.util import data
 
 
+_BASE64_CHUNK_SIZE = 3 << 18
+
+
 class TestRecordEncoder(json.JSONEncoder):
+  """JSON encoder writing the data of attachments in base64.
+
+  iterencode() yields the encoded data of each attachment chunk by chunk, as it
+  is read from the attachment file, so that neither the data nor its encoding
+  is ever held in memory as a whole.
+  """
+
+  def __init__(self, *args: Any, **kwargs: Any):
+    super(TestRecordEncoder, self).__init__(*args, **kwargs)
+    # Attachments met by default(), by the encoded placeholder of their data.
+    self._attachments = {}  # type: Dict[Text, test_record.Attachment]
 
   def default(self, obj: Any) -> Any:
     if isinstance(obj, test_record.Attachment):
       dct = obj._asdict()
-      dct['data'] = base64.standard_b64encode(obj.data).decode('utf-8')
+      placeholder = 'openhtf-attachment-%s' % uuid.uuid4().hex
+      self._attachments[json.dumps(placeholder)] = obj
+      dct['data'] = placeholder
       return dct
     return super(TestRecordEncoder, self).default(obj)
 
+  def iterencode(self, o: Any, _one_shot: bool = False) -> Iterator[Text]:
+    # The one-shot C encoder would return whole strings, always use the
+    # incremental one, which yields string values as separate chunks.
+    del _one_shot  # Unused.
+    for chunk in super(TestRecordEncoder, self).iterencode(o):
+      attachment = self._attachments.pop(chunk, None)
+      if attachment is None:
+        yield chunk
+        continue
+      yield '"'
+      # Chunks are a multiple of 3 bytes so they encode without padding.
+      for data_chunk in test_record.AttachmentView(attachment).iter_chunks(
+          _BASE64_CHUNK_SIZE):
+        yield base64.standard_b64encode(data_chunk).decode('utf-8')
+      yield '"'
+
 
 def convert_test_record_to_json(
     test_rec: test_record.TestRecord,
@@ -51,6 +84,7 @@ def convert_test_record_to_json(
     The test record encoded as JSON objects.
   """
   as_dict = data.convert_to_base_types(test_rec, json_safe=(not allow_nan))
+  as_dict['log_records'] = test_rec.all_log_records_as_base_types()
   if inline_attachments:
     for phase, original_phase in zip(as_dict['phases'], test_rec.phases):
       for name, attachment in original_phase.attachments.items():
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: openhtf/output/proto/assembly_event.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'openhtf/output/proto/assembly_event.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n)openhtf/output/proto/assembly_event.proto\x12\x07openhtf\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1cgoogle/protobuf/struct.proto\"\xb9\x04\n\rAssemblyEvent\x12\x30\n\x06target\x18\x01 \x01(\x0b\x32 .openhtf.AssemblyEvent.Component\x12/\n\x05\x63hild\x18\x03 \x01(\x0b\x32 .openhtf.AssemblyEvent.Component\x12,\n\x02op\x18\x04 \x01(\x0e\x32 .openhtf.AssemblyEvent.Operation\x12(\n\x04time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a\x96\x02\n\tComponent\x12\x13\n\x0bpart_number\x18\x01 \x01(\t\x12\x10\n\x06serial\x18\x02 \x01(\tH\x00\x12\x35\n\x03lot\x18\x03 \x01(\x0b\x32&.openhtf.AssemblyEvent.Component.ByLotH\x00\x12\x19\n\x11\x65lectronic_serial\x18\x04 \x01(\t\x12\x15\n\rinstance_name\x18\x05 \x01(\t\x12+\n\nextra_data\x18\x06 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x16\n\x0e\x64\x65viation_code\x18\x07 \x03(\t\x1a.\n\x05\x42yLot\x12\x12\n\nlot_number\x18\x01 \x01(\t\x12\x11\n\tlot_index\x18\x02 \x01(\tB\x04\n\x02id\"T\n\tOperation\x12\n\n\x06\x41TTACH\x10\x00\x12\n\n\x06\x44\x45TACH\x10\x01\x12\n\n\x06\x43REATE\x10\x02\x12\n\n\x06UPDATE\x10\x03\x12\x17\n\x13\x44\x45TACH_ALL_CHILDREN\x10\x04\"\x89\x02\n\x13StaticComponentInfo\x12\x1f\n\x17\x65xtraction_timestamp_ms\x18\x01 \x01(\x03\x12!\n\x19modification_timestamp_ms\x18\x02 \x01(\x03\x12\x0e\n\x06serial\x18\x03 \x01(\t\x12\x13\n\x0bpart_number\x18\x04 \x01(\t\x12\x15\n\rinstance_name\x18\x05 \x01(\t\x12\x12\n\ndeviations\x18\x06 \x03(\t\x12\x14\n\x0cupdate_count\x18\x07 \x01(\x03\x12\x33\n\tcomponent\x18\x08 \x01(\x0b\x32 .openhtf.AssemblyEvent.Component\x12\x13\n\x0b\x64\x65scription\x18\t \x01(\tb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'openhtf.output.proto.assembly_event_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_ASSEMBLYEVENT']._serialized_start=118
+  _globals['_ASSEMBLYEVENT']._serialized_end=687
+  _globals['_ASSEMBLYEVENT_COMPONENT']._serialized_start=323
+  _globals['_ASSEMBLYEVENT_COMPONENT']._serialized_end=601
+  _globals['_ASSEMBLYEVENT_COMPONENT_BYLOT']._serialized_start=549
+  _globals['_ASSEMBLYEVENT_COMPONENT_BYLOT']._serialized_end=595
+  _globals['_ASSEMBLYEVENT_OPERATION']._serialized_start=603
+  _globals['_ASSEMBLYEVENT_OPERATION']._serialized_end=687
+  _globals['_STATICCOMPONENTINFO']._serialized_start=690
+  _globals['_STATICCOMPONENTINFO']._serialized_end=955
+# @@protoc_insertion_point(module_scope)
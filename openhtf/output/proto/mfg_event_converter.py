@@ -215,6 +215,7 @@ def _attach_record_as_json(mfg_event, record):
   attachment = mfg_event.attachment.add()
   attachment.name = TEST_RECORD_ATTACHMENT_NAME
   test_record_dict = htf_data.convert_to_base_types(record)
+  test_record_dict['log_records'] = record.all_log_records_as_base_types()
   attachment.value_binary = _convert_object_to_json(test_record_dict)
   attachment.type = test_runs_pb2.TEXT_UTF8
 
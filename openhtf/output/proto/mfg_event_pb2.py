@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: openhtf/output/proto/mfg_event.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'openhtf/output/proto/mfg_event.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from openhtf.output.proto import assembly_event_pb2 as openhtf_dot_output_dot_proto_dot_assembly__event__pb2
+from openhtf.output.proto import test_runs_pb2 as openhtf_dot_output_dot_proto_dot_test__runs__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n$openhtf/output/proto/mfg_event.proto\x12\x07openhtf\x1a)openhtf/output/proto/assembly_event.proto\x1a$openhtf/output/proto/test_runs.proto\"\xb4\x05\n\x08MfgEvent\x12\x14\n\ndut_serial\x18\x01 \x01(\tH\x00\x12&\n\x03lot\x18\x02 \x01(\x0b\x32\x17.openhtf.MfgEvent.ByLotH\x00\x12\x15\n\rstart_time_ms\x18\x03 \x02(\x03\x12\x13\n\x0b\x65nd_time_ms\x18\x04 \x01(\x03\x12\x13\n\x0btester_name\x18\x05 \x02(\t\x12\x11\n\ttest_name\x18\x06 \x02(\t\x12\x14\n\x0ctest_version\x18\x14 \x01(\t\x12\x18\n\x10test_description\x18\x15 \x01(\t\x12\x15\n\rtest_run_name\x18\x16 \x01(\t\x12-\n\x0btest_status\x18\x08 \x02(\x0e\x32\x0f.openhtf.Status:\x07\x43REATED\x12/\n\x0f\x61ssembly_events\x18\n \x03(\x0b\x32\x16.openhtf.AssemblyEvent\x12 \n\x07timings\x18\x0b \x03(\x0b\x32\x0f.openhtf.Timing\x12\x1e\n\x06phases\x18\x0c \x03(\x0b\x32\x0e.openhtf.Phase\x12\x17\n\x0f\x66ramework_build\x18\r \x01(\t\x12)\n\x0bmeasurement\x18\x0e \x03(\x0b\x32\x14.openhtf.Measurement\x12,\n\nattachment\x18\x0f \x03(\x0b\x32\x18.openhtf.EventAttachment\x12-\n\ttest_logs\x18\x10 \x03(\x0b\x32\x1a.openhtf.TestRunLogMessage\x12+\n\rfailure_codes\x18\x11 \x03(\x0b\x32\x14.openhtf.FailureCode\x12\x15\n\roperator_name\x18\x12 \x01(\t\x12\x11\n\tpart_tags\x18\x13 \x03(\t\x1a.\n\x05\x42yLot\x12\x12\n\nlot_number\x18\x01 \x02(\t\x12\x11\n\tlot_index\x18\x02 \x01(\tB\x05\n\x03\x64ut\"\xf0\x03\n\x0bMeasurement\x12\x0c\n\x04name\x18\x01 \x02(\t\x12\x1f\n\x06status\x18\x02 \x01(\x0e\x32\x0f.openhtf.Status\x12\x13\n\x0b\x64\x65scription\x18\x06 \x01(\t\x12\x11\n\timportant\x18\x12 \x01(\x08\x12\x15\n\rparameter_tag\x18\x10 \x03(\t\x12\x15\n\rnumeric_value\x18\x0b \x01(\x01\x12\x17\n\x0fnumeric_minimum\x18\x0c \x01(\x01\x12\x17\n\x0fnumeric_maximum\x18\r \x01(\x01\x12 \n\x18numeric_marginal_minimum\x18\x19 \x01(\x01\x12 \n\x18numeric_marginal_maximum\x18\x1a \x01(\x01\x12\x12\n\ntext_value\x18\x0e \x01(\t\x12\x15\n\rexpected_text\x18\x0f \x01(\t\x12\x13\n\x0bis_optional\x18\x11 \x01(\x08\x12\x17\n\x0fset_time_millis\x18\x13 \x01(\x03\x12*\n\tunit_code\x18\x14 \x01(\x0e\x32\x17.openhtf.Units.UnitCode\x12\x18\n\x10\x63ustom_unit_code\x18\x16 \x01(\t\x12\x1a\n\x12\x63ustom_unit_suffix\x18\x17 \x01(\t\x12\x1d\n\x15\x61ssociated_attachment\x18\x15 \x01(\t*\x06\x08\x88\'\x10\xd0(J\x04\x08\x18\x10\x19\"\xc7\x02\n\x0f\x45ventAttachment\x12\x0c\n\x04name\x18\x01 \x02(\t\x12\x16\n\x0cvalue_binary\x18\x02 \x01(\x0cH\x00\x12\x44\n\x10\x65xisting_blobref\x18\t \x01(\x0b\x32(.openhtf.EventAttachment.ExistingBlobRefH\x00\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x17\n\x0fset_time_millis\x18\x04 \x01(\x03\x12\x15\n\rparameter_tag\x18\x05 \x03(\t\x12\'\n\x04type\x18\x06 \x01(\x0e\x32\x17.openhtf.InformationTagH\x01\x12\x13\n\tmime_type\x18\x07 \x01(\tH\x01\x1a\x30\n\x0f\x45xistingBlobRef\x12\x0f\n\x07\x62lob_id\x18\x01 \x01(\x0c\x12\x0c\n\x04size\x18\x02 \x01(\x03\x42\x07\n\x05valueB\n\n\x08\x64\x61tatype')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'openhtf.output.proto.mfg_event_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_MFGEVENT']._serialized_start=131
+  _globals['_MFGEVENT']._serialized_end=823
+  _globals['_MFGEVENT_BYLOT']._serialized_start=770
+  _globals['_MFGEVENT_BYLOT']._serialized_end=816
+  _globals['_MEASUREMENT']._serialized_start=826
+  _globals['_MEASUREMENT']._serialized_end=1322
+  _globals['_EVENTATTACHMENT']._serialized_start=1325
+  _globals['_EVENTATTACHMENT']._serialized_end=1652
+  _globals['_EVENTATTACHMENT_EXISTINGBLOBREF']._serialized_start=1583
+  _globals['_EVENTATTACHMENT_EXISTINGBLOBREF']._serialized_end=1631
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: openhtf/output/proto/test_runs.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'openhtf/output/proto/test_runs.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import descriptor_pb2 as google_dot_protobuf_dot_descriptor__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n$openhtf/output/proto/test_runs.proto\x12\x07openhtf\x1a google/protobuf/descriptor.proto\",\n\x0b\x46\x61ilureCode\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x0f\n\x07\x64\x65tails\x18\x02 \x01(\t\">\n\x08TimeInfo\x12\x19\n\x11start_time_millis\x18\x01 \x01(\x03\x12\x17\n\x0f\x65nd_time_millis\x18\x02 \x01(\x03\"Q\n\x06Timing\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12$\n\ttime_info\x18\x03 \x01(\x0b\x32\x11.openhtf.TimeInfo\"c\n\x05Phase\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x14\n\x0c\x63\x61pabilities\x18\x03 \x03(\t\x12!\n\x06timing\x18\x04 \x01(\x0b\x32\x11.openhtf.TimeInfo\"\xbc\x03\n\rTestParameter\x12\x0c\n\x04name\x18\x01 \x02(\t\x12\x1f\n\x06status\x18\x02 \x01(\x0e\x32\x0f.openhtf.Status\x12\x13\n\x0b\x64\x65scription\x18\x06 \x01(\t\x12\x11\n\timportant\x18\x12 \x01(\x08\x12\x15\n\rparameter_tag\x18\x10 \x01(\t\x12\x15\n\rnumeric_value\x18\x0b \x01(\x01\x12\x17\n\x0fnumeric_minimum\x18\x0c \x01(\x01\x12\x17\n\x0fnumeric_maximum\x18\r \x01(\x01\x12 \n\x18numeric_marginal_minimum\x18\x1a \x01(\x01\x12 \n\x18numeric_marginal_maximum\x18\x1b \x01(\x01\x12\x12\n\ntext_value\x18\x0e \x01(\t\x12\x15\n\rexpected_text\x18\x0f \x01(\t\x12\x13\n\x0bis_optional\x18\x11 \x01(\x08\x12\x17\n\x0fset_time_millis\x18\x13 \x01(\x03\x12*\n\tunit_code\x18\x14 \x01(\x0e\x32\x17.openhtf.Units.UnitCode\x12\x1d\n\x15\x61ssociated_attachment\x18\x15 \x01(\t*\x06\x08\x88\'\x10\xd0(J\x04\x08\x19\x10\x1a\"\x81\x02\n\x11TestRunLogMessage\x12\x18\n\x10timestamp_millis\x18\x01 \x01(\x03\x12\x13\n\x0blog_message\x18\x02 \x01(\t\x12\x13\n\x0blogger_name\x18\x03 \x01(\t\x12\x0f\n\x07levelno\x18\x04 \x01(\x05\x12/\n\x05level\x18\x07 \x01(\x0e\x32 .openhtf.TestRunLogMessage.Level\x12\x12\n\nlog_source\x18\x05 \x01(\t\x12\x0e\n\x06lineno\x18\x06 \x01(\x05\"B\n\x05Level\x12\t\n\x05\x44\x45\x42UG\x10\n\x12\x08\n\x04INFO\x10\x14\x12\x0b\n\x07WARNING\x10\x1e\x12\t\n\x05\x45RROR\x10(\x12\x0c\n\x08\x43RITICAL\x10\x32\"\xc0\x04\n\x07TestRun\x12\x12\n\ndut_serial\x18\x01 \x02(\t\x12\x13\n\x0btester_name\x18\x02 \x02(\t\x12$\n\ttest_info\x18\x03 \x02(\x0b\x32\x11.openhtf.TestInfo\x12-\n\x0btest_status\x18\x04 \x02(\x0e\x32\x0f.openhtf.Status:\x07\x43REATED\x12\x19\n\x11start_time_millis\x18\x08 \x01(\x03\x12\x17\n\x0f\x65nd_time_millis\x18\t \x01(\x03\x12\x10\n\x08run_name\x18\n \x01(\t\x12/\n\x0ftest_parameters\x18\x05 \x03(\x0b\x32\x16.openhtf.TestParameter\x12\x36\n\x0finfo_parameters\x18\x06 \x03(\x0b\x32\x1d.openhtf.InformationParameter\x12-\n\ttest_logs\x18\x0b \x03(\x0b\x32\x1a.openhtf.TestRunLogMessage\x12+\n\rfailure_codes\x18\x13 \x03(\x0b\x32\x14.openhtf.FailureCode\x12\x15\n\roperator_name\x18\x16 \x01(\t\x12\x12\n\nlot_number\x18\x17 \x01(\t\x12\x0f\n\x07part_id\x18\x18 \x01(\t\x12\x15\n\rsynthetic_dut\x18\x19 \x01(\x08\x12 \n\x07timings\x18\x1b \x03(\x0b\x32\x0f.openhtf.Timing\x12\x1e\n\x06phases\x18\x1c \x03(\x0b\x32\x0e.openhtf.Phase\x12\x17\n\x0f\x66ramework_build\x18\x11 \x01(\t\"E\n\x08TestInfo\x12\x0c\n\x04name\x18\x01 \x02(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x16\n\x0eversion_string\x18\x05 \x01(\t\"\xb1\x01\n\x14InformationParameter\x12\x0c\n\x04name\x18\x01 \x02(\t\x12\x14\n\x0cvalue_binary\x18\x07 \x01(\x0c\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x17\n\x0fset_time_millis\x18\x08 \x01(\x03\x12\x15\n\rparameter_tag\x18\x05 \x01(\t\x12\x30\n\x04type\x18\x04 \x01(\x0e\x32\x17.openhtf.InformationTag:\tTEXT_UTF8\"\xa4\t\n\x05Units\"\x9a\t\n\x08UnitCode\x12\x08\n\x04NONE\x10\x01\x12\x1c\n\x07PERCENT\x10\x02\x1a\x0f\xd2\xb0\xd6\xc0\x01\x02P1\x9a\xd0\x86\xfd\x01\x01%\x12\x1b\n\x0cNO_DIMENSION\x10\x03\x1a\t\xd2\xb0\xd6\xc0\x01\x03NDL\x12\x1b\n\x05PIXEL\x10\x04\x1a\x10\xd2\xb0\xd6\xc0\x01\x02PX\x9a\xd0\x86\xfd\x01\x02px\x12\x1a\n\x0bPIXEL_LEVEL\x10\x05\x1a\t\xd2\xb0\xd6\xc0\x01\x03PXL\x12,\n\x14ROTATIONS_PER_MINUTE\x10\x07\x1a\x12\xd2\xb0\xd6\xc0\x01\x03RPM\x9a\xd0\x86\xfd\x01\x03rpm\x12\x1c\n\x06SECOND\x10\n\x1a\x10\xd2\xb0\xd6\xc0\x01\x03SEC\x9a\xd0\x86\xfd\x01\x01s\x12\x1b\n\x03MHZ\x10\x0b\x1a\x12\xd2\xb0\xd6\xc0\x01\x03MHZ\x9a\xd0\x86\xfd\x01\x03MHz\x12\x1c\n\x05HERTZ\x10\x0c\x1a\x11\xd2\xb0\xd6\xc0\x01\x03HTZ\x9a\xd0\x86\xfd\x01\x02Hz\x12#\n\x0bMICROSECOND\x10\r\x1a\x12\xd2\xb0\xd6\xc0\x01\x03\x42\x39\x38\x9a\xd0\x86\xfd\x01\x03\xc2\xb5s\x12!\n\nMILLIMETER\x10\x15\x1a\x11\xd2\xb0\xd6\xc0\x01\x03MMT\x9a\xd0\x86\xfd\x01\x02mm\x12 \n\nCENTIMETER\x10\x16\x1a\x10\xd2\xb0\xd6\xc0\x01\x02LC\x9a\xd0\x86\xfd\x01\x02\x63m\x12\x1b\n\x05METER\x10\x17\x1a\x10\xd2\xb0\xd6\xc0\x01\x03MTR\x9a\xd0\x86\xfd\x01\x01m\x12$\n\tPER_METER\x10\x18\x1a\x15\xd2\xb0\xd6\xc0\x01\x03M0R\x9a\xd0\x86\xfd\x01\x06m\xe2\x81\xbb\xc2\xb9\x12!\n\nMILLILITER\x10\x19\x1a\x11\xd2\xb0\xd6\xc0\x01\x03MLT\x9a\xd0\x86\xfd\x01\x02mL\x12#\n\nCUBIC_FOOT\x10\x1a\x1a\x13\xd2\xb0\xd6\xc0\x01\x03MTQ\x9a\xd0\x86\xfd\x01\x04\x46t\xc2\xb3\x12\x1d\n\x07\x44\x45\x43IBEL\x10\x1e\x1a\x10\xd2\xb0\xd6\xc0\x01\x02\x32N\x9a\xd0\x86\xfd\x01\x02\x64\x42\x12\"\n\nDECIBEL_MW\x10\x1f\x1a\x12\xd2\xb0\xd6\xc0\x01\x02\x32N\x9a\xd0\x86\xfd\x01\x04\x64\x42mW\x12 \n\x08MICROAMP\x10 \x1a\x12\xd2\xb0\xd6\xc0\x01\x03\x42\x38\x34\x9a\xd0\x86\xfd\x01\x03\xc2\xb5\x41\x12\x1e\n\x08MILLIAMP\x10!\x1a\x10\xd2\xb0\xd6\xc0\x01\x02\x34K\x9a\xd0\x86\xfd\x01\x02mA\x12!\n\tMICROVOLT\x10\"\x1a\x12\xd2\xb0\xd6\xc0\x01\x03\x44\x38\x32\x9a\xd0\x86\xfd\x01\x03\xc2\xb5V\x12\x1a\n\x04VOLT\x10#\x1a\x10\xd2\xb0\xd6\xc0\x01\x03VLT\x9a\xd0\x86\xfd\x01\x01V\x12\x1f\n\tPICOFARAD\x10$\x1a\x10\xd2\xb0\xd6\xc0\x01\x02\x34T\x9a\xd0\x86\xfd\x01\x02pF\x12\x16\n\x07\x43OULOMB\x10%\x1a\t\xd2\xb0\xd6\xc0\x01\x03\x43OU\x12\x1f\n\tMILLIVOLT\x10&\x1a\x10\xd2\xb0\xd6\xc0\x01\x02\x32Z\x9a\xd0\x86\xfd\x01\x02mV\x12\x1a\n\x04WATT\x10\'\x1a\x10\xd2\xb0\xd6\xc0\x01\x03WTT\x9a\xd0\x86\xfd\x01\x01W\x12\x1c\n\x06\x41MPERE\x10\x1d\x1a\x10\xd2\xb0\xd6\xc0\x01\x03\x41MP\x9a\xd0\x86\xfd\x01\x01\x41\x12&\n\x0e\x44\x45GREE_CELSIUS\x10(\x1a\x12\xd2\xb0\xd6\xc0\x01\x03\x43\x45L\x9a\xd0\x86\xfd\x01\x03\xc2\xb0\x43\x12\x1c\n\x06KELVIN\x10)\x1a\x10\xd2\xb0\xd6\xc0\x01\x03KEL\x9a\xd0\x86\xfd\x01\x01K\x12\x12\n\x04\x42YTE\x10\x32\x1a\x08\xd2\xb0\xd6\xc0\x01\x02\x41\x44\x12/\n\x15MEGA_BYTES_PER_SECOND\x10\x33\x1a\x14\xd2\xb0\xd6\xc0\x01\x04MBPS\x9a\xd0\x86\xfd\x01\x04MB/s\x12\x1c\n\x06\x44\x45GREE\x10<\x1a\x10\xd2\xb0\xd6\xc0\x01\x02\x44\x44\x9a\xd0\x86\xfd\x01\x02\xc2\xb0\x12\x1e\n\x06RADIAN\x10=\x1a\x12\xd2\xb0\xd6\xc0\x01\x03\x43\x38\x31\x9a\xd0\x86\xfd\x01\x03rad\x12\x1c\n\x06NEWTON\x10\x46\x1a\x10\xd2\xb0\xd6\xc0\x01\x03NEW\x9a\xd0\x86\xfd\x01\x01N\x12\x32\n\x18\x43UBIC_CENTIMETER_PER_SEC\x10P\x1a\x14\xd2\xb0\xd6\xc0\x01\x02\x32J\x9a\xd0\x86\xfd\x01\x06\x63m\xc2\xb3/s\x12!\n\x08MILLIBAR\x10Q\x1a\x13\xd2\xb0\xd6\xc0\x01\x03MBR\x9a\xd0\x86\xfd\x01\x04mbar*\x85\x01\n\x0eInformationTag\x12\x07\n\x03JPG\x10\x02\x12\x07\n\x03PNG\x10\x03\x12\x07\n\x03WAV\x10\x04\x12\x08\n\x04TIFF\x10\x08\x12\x07\n\x03MP4\x10\t\x12\x07\n\x03\x41VI\x10\x0b\x12\n\n\x06\x42INARY\x10\x05\x12\x0e\n\nTIMESERIES\x10\x06\x12\r\n\tTEXT_UTF8\x10\x07\x12\x11\n\rMULTIDIM_JSON\x10\n*\xb3\x01\n\x06Status\x12\x08\n\x04PASS\x10\x01\x12\x08\n\x04\x46\x41IL\x10\x02\x12\t\n\x05\x45RROR\x10\x03\x12\x0b\n\x07RUNNING\x10\x04\x12\x0b\n\x07\x43REATED\x10\x05\x12\x0b\n\x07TIMEOUT\x10\x06\x12\x0b\n\x07\x41\x42ORTED\x10\x07\x12\x0b\n\x07WAITING\x10\x08\x12\x0b\n\x07\x43ONSUME\x10\n\x12\x07\n\x03RMA\x10\x0b\x12\n\n\x06REWORK\x10\x0c\x12\t\n\x05SCRAP\x10\r\x12\t\n\x05\x44\x45\x42UG\x10\x0e\x12\x11\n\rMARGINAL_PASS\x10\x0f:6\n\x08uom_code\x12!.google.protobuf.EnumValueOptions\x18\x8a\xe6\x8a\x18 \x01(\t:8\n\nuom_suffix\x12!.google.protobuf.EnumValueOptions\x18\x83\xea\xd0\x1f \x01(\t')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'openhtf.output.proto.test_runs_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["PERCENT"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["PERCENT"]._serialized_options = b'\322\260\326\300\001\002P1\232\320\206\375\001\001%'
+  _globals['_UNITS_UNITCODE'].values_by_name["NO_DIMENSION"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["NO_DIMENSION"]._serialized_options = b'\322\260\326\300\001\003NDL'
+  _globals['_UNITS_UNITCODE'].values_by_name["PIXEL"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["PIXEL"]._serialized_options = b'\322\260\326\300\001\002PX\232\320\206\375\001\002px'
+  _globals['_UNITS_UNITCODE'].values_by_name["PIXEL_LEVEL"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["PIXEL_LEVEL"]._serialized_options = b'\322\260\326\300\001\003PXL'
+  _globals['_UNITS_UNITCODE'].values_by_name["ROTATIONS_PER_MINUTE"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["ROTATIONS_PER_MINUTE"]._serialized_options = b'\322\260\326\300\001\003RPM\232\320\206\375\001\003rpm'
+  _globals['_UNITS_UNITCODE'].values_by_name["SECOND"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["SECOND"]._serialized_options = b'\322\260\326\300\001\003SEC\232\320\206\375\001\001s'
+  _globals['_UNITS_UNITCODE'].values_by_name["MHZ"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["MHZ"]._serialized_options = b'\322\260\326\300\001\003MHZ\232\320\206\375\001\003MHz'
+  _globals['_UNITS_UNITCODE'].values_by_name["HERTZ"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["HERTZ"]._serialized_options = b'\322\260\326\300\001\003HTZ\232\320\206\375\001\002Hz'
+  _globals['_UNITS_UNITCODE'].values_by_name["MICROSECOND"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["MICROSECOND"]._serialized_options = b'\322\260\326\300\001\003B98\232\320\206\375\001\003\302\265s'
+  _globals['_UNITS_UNITCODE'].values_by_name["MILLIMETER"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["MILLIMETER"]._serialized_options = b'\322\260\326\300\001\003MMT\232\320\206\375\001\002mm'
+  _globals['_UNITS_UNITCODE'].values_by_name["CENTIMETER"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["CENTIMETER"]._serialized_options = b'\322\260\326\300\001\002LC\232\320\206\375\001\002cm'
+  _globals['_UNITS_UNITCODE'].values_by_name["METER"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["METER"]._serialized_options = b'\322\260\326\300\001\003MTR\232\320\206\375\001\001m'
+  _globals['_UNITS_UNITCODE'].values_by_name["PER_METER"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["PER_METER"]._serialized_options = b'\322\260\326\300\001\003M0R\232\320\206\375\001\006m\342\201\273\302\271'
+  _globals['_UNITS_UNITCODE'].values_by_name["MILLILITER"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["MILLILITER"]._serialized_options = b'\322\260\326\300\001\003MLT\232\320\206\375\001\002mL'
+  _globals['_UNITS_UNITCODE'].values_by_name["CUBIC_FOOT"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["CUBIC_FOOT"]._serialized_options = b'\322\260\326\300\001\003MTQ\232\320\206\375\001\004Ft\302\263'
+  _globals['_UNITS_UNITCODE'].values_by_name["DECIBEL"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["DECIBEL"]._serialized_options = b'\322\260\326\300\001\0022N\232\320\206\375\001\002dB'
+  _globals['_UNITS_UNITCODE'].values_by_name["DECIBEL_MW"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["DECIBEL_MW"]._serialized_options = b'\322\260\326\300\001\0022N\232\320\206\375\001\004dBmW'
+  _globals['_UNITS_UNITCODE'].values_by_name["MICROAMP"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["MICROAMP"]._serialized_options = b'\322\260\326\300\001\003B84\232\320\206\375\001\003\302\265A'
+  _globals['_UNITS_UNITCODE'].values_by_name["MILLIAMP"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["MILLIAMP"]._serialized_options = b'\322\260\326\300\001\0024K\232\320\206\375\001\002mA'
+  _globals['_UNITS_UNITCODE'].values_by_name["MICROVOLT"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["MICROVOLT"]._serialized_options = b'\322\260\326\300\001\003D82\232\320\206\375\001\003\302\265V'
+  _globals['_UNITS_UNITCODE'].values_by_name["VOLT"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["VOLT"]._serialized_options = b'\322\260\326\300\001\003VLT\232\320\206\375\001\001V'
+  _globals['_UNITS_UNITCODE'].values_by_name["PICOFARAD"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["PICOFARAD"]._serialized_options = b'\322\260\326\300\001\0024T\232\320\206\375\001\002pF'
+  _globals['_UNITS_UNITCODE'].values_by_name["COULOMB"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["COULOMB"]._serialized_options = b'\322\260\326\300\001\003COU'
+  _globals['_UNITS_UNITCODE'].values_by_name["MILLIVOLT"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["MILLIVOLT"]._serialized_options = b'\322\260\326\300\001\0022Z\232\320\206\375\001\002mV'
+  _globals['_UNITS_UNITCODE'].values_by_name["WATT"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["WATT"]._serialized_options = b'\322\260\326\300\001\003WTT\232\320\206\375\001\001W'
+  _globals['_UNITS_UNITCODE'].values_by_name["AMPERE"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["AMPERE"]._serialized_options = b'\322\260\326\300\001\003AMP\232\320\206\375\001\001A'
+  _globals['_UNITS_UNITCODE'].values_by_name["DEGREE_CELSIUS"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["DEGREE_CELSIUS"]._serialized_options = b'\322\260\326\300\001\003CEL\232\320\206\375\001\003\302\260C'
+  _globals['_UNITS_UNITCODE'].values_by_name["KELVIN"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["KELVIN"]._serialized_options = b'\322\260\326\300\001\003KEL\232\320\206\375\001\001K'
+  _globals['_UNITS_UNITCODE'].values_by_name["BYTE"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["BYTE"]._serialized_options = b'\322\260\326\300\001\002AD'
+  _globals['_UNITS_UNITCODE'].values_by_name["MEGA_BYTES_PER_SECOND"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["MEGA_BYTES_PER_SECOND"]._serialized_options = b'\322\260\326\300\001\004MBPS\232\320\206\375\001\004MB/s'
+  _globals['_UNITS_UNITCODE'].values_by_name["DEGREE"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["DEGREE"]._serialized_options = b'\322\260\326\300\001\002DD\232\320\206\375\001\002\302\260'
+  _globals['_UNITS_UNITCODE'].values_by_name["RADIAN"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["RADIAN"]._serialized_options = b'\322\260\326\300\001\003C81\232\320\206\375\001\003rad'
+  _globals['_UNITS_UNITCODE'].values_by_name["NEWTON"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["NEWTON"]._serialized_options = b'\322\260\326\300\001\003NEW\232\320\206\375\001\001N'
+  _globals['_UNITS_UNITCODE'].values_by_name["CUBIC_CENTIMETER_PER_SEC"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["CUBIC_CENTIMETER_PER_SEC"]._serialized_options = b'\322\260\326\300\001\0022J\232\320\206\375\001\006cm\302\263/s'
+  _globals['_UNITS_UNITCODE'].values_by_name["MILLIBAR"]._loaded_options = None
+  _globals['_UNITS_UNITCODE'].values_by_name["MILLIBAR"]._serialized_options = b'\322\260\326\300\001\003MBR\232\320\206\375\001\004mbar'
+  _globals['_INFORMATIONTAG']._serialized_start=3106
+  _globals['_INFORMATIONTAG']._serialized_end=3239
+  _globals['_STATUS']._serialized_start=3242
+  _globals['_STATUS']._serialized_end=3421
+  _globals['_FAILURECODE']._serialized_start=83
+  _globals['_FAILURECODE']._serialized_end=127
+  _globals['_TIMEINFO']._serialized_start=129
+  _globals['_TIMEINFO']._serialized_end=191
+  _globals['_TIMING']._serialized_start=193
+  _globals['_TIMING']._serialized_end=274
+  _globals['_PHASE']._serialized_start=276
+  _globals['_PHASE']._serialized_end=375
+  _globals['_TESTPARAMETER']._serialized_start=378
+  _globals['_TESTPARAMETER']._serialized_end=822
+  _globals['_TESTRUNLOGMESSAGE']._serialized_start=825
+  _globals['_TESTRUNLOGMESSAGE']._serialized_end=1082
+  _globals['_TESTRUNLOGMESSAGE_LEVEL']._serialized_start=1016
+  _globals['_TESTRUNLOGMESSAGE_LEVEL']._serialized_end=1082
+  _globals['_TESTRUN']._serialized_start=1085
+  _globals['_TESTRUN']._serialized_end=1661
+  _globals['_TESTINFO']._serialized_start=1663
+  _globals['_TESTINFO']._serialized_end=1732
+  _globals['_INFORMATIONPARAMETER']._serialized_start=1735
+  _globals['_INFORMATIONPARAMETER']._serialized_end=1912
+  _globals['_UNITS']._serialized_start=1915
+  _globals['_UNITS']._serialized_end=3103
+  _globals['_UNITS_UNITCODE']._serialized_start=1925
+  _globals['_UNITS_UNITCODE']._serialized_end=3103
+# @@protoc_insertion_point(module_scope)
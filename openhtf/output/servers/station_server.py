@@ -37,6 +37,7 @@ from openhtf.output.servers import pub_sub
 from openhtf.output.servers import web_gui_server
 from openhtf.util import configuration
 from openhtf.util import data
+from openhtf.util import decimation
 from openhtf.util import functions
 from openhtf.util import multicast
 from openhtf.util import timeouts
@@ -56,12 +57,25 @@ _CHECK_FOR_FINISHED_TEST_POLL_S = 0.5
 _DEFAULT_FRONTEND_THROTTLE_S = 0.15
 _WAIT_FOR_ANY_EVENT_POLL_S = 0.05
 _WAIT_FOR_EXECUTING_TEST_POLL_S = 0.1
+_DEFAULT_MEASUREMENT_POINT_BUDGET = 1000
 
 CONF.declare(
     'frontend_throttle_s',
     default_value=_DEFAULT_FRONTEND_THROTTLE_S,
     description=('Min wait time between successive updates to the '
                  'frontend.'))
+CONF.declare(
+    'station_server_measurement_point_budget',
+    default_value=_DEFAULT_MEASUREMENT_POINT_BUDGET,
+    description=('Max number of points of each dimensioned measurement sent '
+                 'to the frontend with each update. The complete values are '
+                 'served by the measurements endpoint. Set to zero to send '
+                 'every point.'))
+CONF.declare(
+    'station_server_decimation',
+    default_value=decimation.LTTB,
+    description=('How points are picked when a dimensioned measurement is '
+                 'over the point budget: "lttb" or "min_max".'))
 CONF.declare(
     'station_server_port',
     default_value=0,
@@ -74,38 +88,48 @@ CONF.declare('station_discovery_port')
 CONF.declare('station_discovery_ttl')
 
 
-def _get_executing_test():
-  """Get the currently executing test and its state.
+def _get_executing_tests():
+  """Get the currently executing tests and their states.
+
+  Several tests execute at once when a station runs one test per DUT slot, see
+  openhtf.core.multi_slot.
 
-  When this function returns, it is not guaranteed that the returned test is
+  When this function returns, it is not guaranteed that the returned tests are
   still running. A consumer of this function that wants to access test.state is
   exposed to a race condition in which test.state may become None at any time
-  due to the test finishing. To address this, in addition to returning the test
-  itself, this function returns the last known test state.
+  due to the test finishing. To address this, in addition to returning each
+  test itself, this function returns its last known test state.
 
   Returns:
-    test: The test that was executing when this function was called, or None.
-    test_state: The state of the executing test, or None.
+    List of (test, test_state) tuples, in the order the tests started.
   """
-  tests = list(openhtf.Test.TEST_INSTANCES.values())
-
-  if not tests:
-    return None, None
-
-  if len(tests) > 1:
-    _LOG.warning('Station server does not support multiple executing tests.')
-
-  test = tests[0]
-  test_state = test.state
-
-  if test_state is None:
-    # This is the case if:
+  executing = []
+  for test in list(openhtf.Test.TEST_INSTANCES.values()):
+    test_state = test.state
+    # The state is None if:
     # 1. The test executor was created but has not started running.
     # 2. The test finished while this function was running, after we got the
     #        list of tests but before we accessed the test state.
-    return None, None
+    if test_state is not None:
+      executing.append((test, test_state))
+  return executing
 
-  return test, test_state
+
+def _get_executing_test(test_uid=None):
+  """Get an executing test and its state.
+
+  Args:
+    test_uid: UID of the test to get, or None for the first executing test.
+
+  Returns:
+    test: The matching test that was executing when this function was called,
+        or None.
+    test_state: The state of the executing test, or None.
+  """
+  for test, test_state in _get_executing_tests():
+    if test_uid is None or str(test.uid) == test_uid:
+      return test, test_state
+  return None, None
 
 
 def _test_state_from_record(test_record_dict, execution_uid=None):
@@ -131,6 +155,59 @@ def _test_state_from_record(test_record_dict, execution_uid=None):
   }
 
 
+def _decimate_phase(phase_dict, budget, method):
+  """Decimate the dimensioned measurements of a phase dict, see below."""
+  measurements = phase_dict.get('measurements')
+  if not measurements:
+    return phase_dict
+
+  decimated = {}
+  for name, measurement in measurements.items():
+    values = measurement.get('measured_value')
+    if ('dimensions' in measurement and isinstance(values, list) and
+        len(values) > budget):
+      measurement = dict(measurement)
+      measurement['measured_value'] = decimation.decimate(
+          values, budget, method)
+      measurement['measured_value_total_points'] = len(values)
+    decimated[name] = measurement
+  return dict(phase_dict, measurements=decimated)
+
+
+def _decimate_measurements(state_dict):
+  """Decimate the dimensioned measurements of a test state dict.
+
+  Dicts and lists on the way to a decimated measurement are shallow-copied, so
+  the caches of the test state are left untouched.  Decimated measurements get
+  a 'measured_value_total_points' field with the number of points they hold.
+
+  Args:
+    state_dict: Test state dict, as returned by TestState.asdict_with_event().
+
+  Returns:
+    The test state dict, with at most the configured point budget of points
+    per dimensioned measurement.
+  """
+  budget = CONF.station_server_measurement_point_budget
+  if not budget:
+    return state_dict
+  method = CONF.station_server_decimation
+
+  state_dict = dict(state_dict)
+  test_record = state_dict.get('test_record')
+  if test_record and test_record.get('phases'):
+    state_dict['test_record'] = dict(
+        test_record,
+        phases=[
+            _decimate_phase(phase, budget, method)
+            for phase in test_record['phases']
+        ])
+  if state_dict.get('running_phase_state'):
+    state_dict['running_phase_state'] = _decimate_phase(
+        state_dict['running_phase_state'], budget, method)
+  return state_dict
+
+
 def _wait_for_any_event(events, timeout_s):
   """Wait for any in a list of threading.Event's to be set.
 
@@ -171,56 +248,50 @@ class StationWatcher(threading.Thread):
     while True:
       try:
         self._poll_for_update()
-      except RuntimeError as error:
+      except Exception as error:  # pylint: disable=broad-except
         # Note that because logging triggers a call to notify_update(), by
         # logging a message, we automatically retry publishing the update
         # after an error occurs.
-        if error.args[0] == 'dictionary changed size during iteration':
-          # These errors occur occasionally and it is infeasible to get rid of
-          # them entirely unless data.convert_to_base_types() is made
-          # thread-safe. Ignore the error and retry quickly.
-          _LOG.debug('Ignoring (probably harmless) error in station watcher: '
-                     '`dictionary changed size during iteration`.')
-          time.sleep(0.1)
-        else:
-          _LOG.exception('Error in station watcher: %s', error)
-          time.sleep(1)
-      except Exception as error:  # pylint: disable=broad-except
         _LOG.exception('Error in station watcher: %s', error)
         time.sleep(1)
 
   @functions.call_at_most_every(float(CONF.frontend_throttle_s))
   def _poll_for_update(self):
-    """Call the callback with the current test state, then wait for a change."""
-    test, test_state = _get_executing_test()
+    """Call the callback with the current test states, then wait for a change.
 
-    if test is None:
+    Every executing test is published, so that each slot of a multi-slot
+    station shows up.
+    """
+    executing = _get_executing_tests()
+
+    if not executing:
       time.sleep(_WAIT_FOR_EXECUTING_TEST_POLL_S)
       return
 
-    state_dict, event = self._to_dict_with_event(test_state)
-    self._update_callback(state_dict)
+    events = []
+    for _, test_state in executing:
+      state_dict, event = self._to_dict_with_event(test_state)
+      self._update_callback(state_dict)
 
-    plug_manager = test_state.plug_manager
-    plug_events = [
-        plug_manager.get_plug_by_class_path(plug_name).asdict_with_event()[1]
-        for plug_name in plug_manager.get_frontend_aware_plug_names()
-    ]
-    events = [event] + plug_events
+      plug_manager = test_state.plug_manager
+      events.append(event)
+      events.extend(
+          plug_manager.get_plug_by_class_path(plug_name).asdict_with_event()[1]
+          for plug_name in plug_manager.get_frontend_aware_plug_names())
 
-    # Wait for the test state or a plug state to change, or for the previously
-    # executing test to finish.
+    # Wait for a test state or a plug state to change, or for the set of
+    # executing tests to change.
+    tests = [test for test, _ in executing]
     while not _wait_for_any_event(events, _CHECK_FOR_FINISHED_TEST_POLL_S):
-      new_test, _ = _get_executing_test()
-      if test != new_test:
+      if [test for test, _ in _get_executing_tests()] != tests:
         break
 
   @classmethod
   def _to_dict_with_event(cls, test_state):
     """Process a test state into the format we want to send to the frontend."""
+    # The dict is a snapshot, phases may keep running while it is converted.
     original_dict, event = test_state.asdict_with_event()
-
-    # This line may produce a 'dictionary changed size during iteration' error.
+    original_dict = _decimate_measurements(original_dict)
     test_state_dict = data.convert_to_base_types(original_dict)
 
     test_state_dict['execution_uid'] = test_state.execution_uid
@@ -267,20 +338,27 @@ class DashboardPubSub(sockjs.tornado.SockJSConnection):
 class StationPubSub(pub_sub.PubSub):
   """WebSocket endpoint for test updates.
 
-  The endpoint provides information about the test that is currently running
-  with this StationServer. Two types of message are sent: 'update' and 'record',
-  where 'record' indicates the final state of a test.
+  The endpoint provides information about the tests that are currently running
+  with this StationServer, each message being about a single test identified by
+  its 'test_uid'. Two types of message are sent: 'update' and 'record', where
+  'record' indicates the final state of a test.
   """
   _lock = threading.Lock()  # Required by pub_sub.PubSub.
   subscribers = set()  # Required by pub_sub.PubSub.
   _last_execution_uid = None
-  _last_message = None
+  _last_messages = {}  # Last message by execution UID.
 
   @classmethod
   def publish_test_record(cls, test_record):
+    # Find which of the executing tests the record belongs to, it is still
+    # registered while output callbacks run.
+    execution_uid = cls._last_execution_uid
+    for _, test_state in _get_executing_tests():
+      if test_state.test_record is test_record:
+        execution_uid = test_state.execution_uid
+        break
     test_record_dict = data.convert_to_base_types(test_record)
-    test_state_dict = _test_state_from_record(test_record_dict,
-                                              cls._last_execution_uid)
+    test_state_dict = _test_state_from_record(test_record_dict, execution_uid)
     cls._publish_test_state(test_state_dict, 'record')
 
   @classmethod
@@ -296,21 +374,28 @@ class StationPubSub(pub_sub.PubSub):
         'type': message_type,
     }
     super(StationPubSub, cls).publish(message)
-    cls._last_execution_uid = test_state_dict['execution_uid']
-    cls._last_message = message
+    with cls._lock:
+      cls._last_execution_uid = test_state_dict['execution_uid']
+      cls._last_messages[cls._last_execution_uid] = message
 
   def on_subscribe(self, info):
-    """Send the more recent test state to new subscribers when they connect.
+    """Send the most recent state of each test to new subscribers.
 
-    This is skipped if the test has already completed.
+    Tests that have already completed are skipped, and forgotten.
 
     Args:
       info: Subscription info.
     """
-    test, _ = _get_executing_test()
-
-    if self._last_message is not None and test is not None:
-      self.send(self._last_message)
+    executing_uids = {
+        test_state.execution_uid for _, test_state in _get_executing_tests()
+    }
+    with self._lock:
+      for execution_uid in list(self._last_messages):
+        if execution_uid not in executing_uids:
+          del self._last_messages[execution_uid]
+      messages = list(self._last_messages.values())
+    for message in messages:
+      self.send(message)
 
 
 class BaseTestHandler(web_gui_server.CorsRequestHandler):
@@ -318,9 +403,9 @@ class BaseTestHandler(web_gui_server.CorsRequestHandler):
 
   def get_test(self, test_uid):
     """Get the specified test. Write 404 and return None if it is not found."""
-    test, test_state = _get_executing_test()
+    test, test_state = _get_executing_test(test_uid)
 
-    if test is None or str(test.uid) != test_uid:
+    if test is None:
       self.write('Unknown test UID %s' % test_uid)
       self.set_status(404)
       return None, None
@@ -328,6 +413,27 @@ class BaseTestHandler(web_gui_server.CorsRequestHandler):
     return test, test_state
 
 
+class TestsHandler(web_gui_server.CorsRequestHandler):
+  """GET endpoint for the list of executing tests, one per DUT slot."""
+
+  def get(self):
+    tests = []
+    for test, test_state in _get_executing_tests():
+      test_record = test_state.test_record
+      running_phase = test_state.running_phase_state
+      tests.append({
+          'test_uid': str(test.uid),
+          'execution_uid': test_state.execution_uid,
+          'slot': test.descriptor.metadata.get('slot'),
+          'dut_id': test_record.dut_id,
+          'outcome': data.convert_to_base_types(test_record.outcome),
+          'running_phase': running_phase.name if running_phase else None,
+      })
+
+    # Wrap value in a dict because writing a list directly is prohibited.
+    self.write({'data': tests})
+
+
 class AttachmentsHandler(BaseTestHandler):
   """GET endpoint for a file attached to a test."""
 
@@ -366,6 +472,59 @@ class AttachmentsHandler(BaseTestHandler):
     self.write(attachment.data)
 
 
+class MeasurementsHandler(BaseTestHandler):
+  """GET endpoint for a measurement of a test, with all of its values.
+
+  Updates pushed to the frontend only hold a decimated subset of the values of
+  large dimensioned measurements; this endpoint serves the complete data.
+  """
+
+  def get(self, test_uid, phase_descriptor_id, measurement_name):
+    _, test_state = self.get_test(test_uid)
+
+    if test_state is None:
+      return
+
+    # Find the phase matching `phase_descriptor_id`.  Measurements of the
+    # running phase are only added to its record when it finishes.
+    running_phase = test_state.running_phase_state
+    phases = [(phase.descriptor_id, phase.measurements)
+              for phase in test_state.test_record.phases]
+    if running_phase is not None:
+      phases.append((running_phase.phase_record.descriptor_id,
+                     running_phase.measurements))
+
+    matched_measurements = None
+    for descriptor_id, measurements in phases:
+      if str(descriptor_id) == phase_descriptor_id:
+        matched_measurements = measurements
+        break
+
+    if matched_measurements is None:
+      self.write('Unknown phase descriptor %s' % phase_descriptor_id)
+      self.set_status(404)
+      return
+
+    if measurement_name not in matched_measurements:
+      self.write('Unknown measurement %s' % measurement_name)
+      self.set_status(404)
+      return
+
+    self.write(matched_measurements[measurement_name].as_base_types())
+
+
+class MemoryHandler(BaseTestHandler):
+  """GET endpoint for the estimated memory usage of a running test."""
+
+  def get(self, test_uid):
+    _, test_state = self.get_test(test_uid)
+
+    if test_state is None:
+      return
+
+    self.write(test_state.memory_usage())
+
+
 class PhasesHandler(BaseTestHandler):
   """GET endpoint for phase descriptors for a test, i.e. the full phase list."""
 
@@ -603,11 +762,15 @@ class StationServer(web_gui_server.WebGuiServer):
 
     # Set up the other endpoints.
     routes.extend((
+        (r'/tests', TestsHandler),
         (r'/tests/(?P<test_uid>[\w\d:]+)/phases', PhasesHandler),
+        (r'/tests/(?P<test_uid>[\w\d:]+)/memory', MemoryHandler),
         (r'/tests/(?P<test_uid>[\w\d:]+)/plugs/(?P<plug_name>.+)',
          PlugsHandler),
         (r'/tests/(?P<test_uid>[\w\d:]+)/phases/(?P<phase_descriptor_id>\d+)/'
          'attachments/(?P<attachment_name>.+)', AttachmentsHandler),
+        (r'/tests/(?P<test_uid>[\w\d:]+)/phases/(?P<phase_descriptor_id>\d+)/'
+         'measurements/(?P<measurement_name>.+)', MeasurementsHandler),
     ))
 
     # Optionally enable history from disk.
@@ -20,7 +20,11 @@ end of a test.  It's up to the Plug implementation to do any sort of
 is-ready check.
 """
 
+import collections
+from concurrent import futures
 import logging
+import threading
+import time
 from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Text, Tuple, Type, TypeVar, Union
 
 import attr
@@ -40,12 +44,23 @@ CONF.declare(
     'plug_teardown_timeout_s',
     default_value=0,
     description='Timeout (in seconds) for each plug tearDown function if > 0; '
-    'otherwise, will wait an unlimited time.')
+    'otherwise, will wait an unlimited time. Plugs are torn down concurrently, '
+    'so this is also the deadline for tearing down all the plugs, unless they '
+    'require one another.')
+CONF.declare(
+    'plug_init_max_workers',
+    default_value=1,
+    description='Maximum number of plugs instantiated concurrently, plugs '
+    'being instantiated after the plugs they require. 1 (the default) '
+    'instantiates them one after another in the calling thread; above 1, plug '
+    '__init__ methods run on worker threads, so only raise it when no plug is '
+    'bound to the thread that created it.')
 
 # TODO(arsharma): Remove this aliases when users have moved to using the core
 # library.
 BasePlug = base_plugs.BasePlug
 FrontendAwareBasePlug = base_plugs.FrontendAwareBasePlug
+PlugScope = base_plugs.PlugScope
 
 
 @attr.s(slots=True, frozen=True)
@@ -123,25 +138,143 @@ def plug(
 
 
 class _PlugTearDownThread(threads.KillableThread):
-  """Killable thread that runs a plug's tearDown function."""
+  """Killable thread that runs a plug's tearDown function.
+
+  The thread notifies the given condition when it finishes, and times the
+  tearDown call.
+  """
 
-  def __init__(self, a_plug: base_plugs.BasePlug, *args: Any, **kwargs: Any):
+  def __init__(self, a_plug: base_plugs.BasePlug,
+               finished_cond: threading.Condition, *args: Any, **kwargs: Any):
     super(_PlugTearDownThread, self).__init__(*args, **kwargs)
     self._plug = a_plug
+    self._finished_cond = finished_cond
+    self.start_time = None  # type: Optional[float]
+    self.finished = False
+
+  def start(self) -> None:
+    self.start_time = time.time()
+    super(_PlugTearDownThread, self).start()
 
   def _thread_proc(self) -> None:
     try:
       self._plug.tearDown()
-    except Exception:  # pylint: disable=broad-except
+    except (Exception, threads.ThreadTerminationError):  # pylint: disable=broad-except
       # Including the stack trace from ThreadTerminationErrors received when
       # killed.
       _LOG.warning(
           'Exception calling tearDown on %s:', self._plug, exc_info=True)
 
+  def _thread_finished(self) -> None:
+    with self._finished_cond:
+      self.finished = True
+      self._finished_cond.notify_all()
+
 
 PlugT = TypeVar('PlugT', bound=base_plugs.BasePlug)
 
 
+class _StationPlugPool(object):
+  """Instances of station-scoped plugs, kept across test executions.
+
+  An instance is shared by the plug managers using it at the same time, e.g.
+  the slots of a multi_slot.MultiSlotRunner.  When an idle instance is
+  acquired again, it is checked with is_healthy() then reset(), and replaced
+  by a new instance if either fails.
+  """
+
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._type_locks = collections.defaultdict(threading.Lock)
+    self._plugs = {}  # type: Dict[Type[base_plugs.BasePlug], base_plugs.BasePlug]
+    self._users = collections.Counter()
+
+  def _reuse(self, plug_instance: base_plugs.BasePlug) -> bool:
+    """Prepares an idle instance for reuse, returns whether it can be reused."""
+    try:
+      if not plug_instance.is_healthy():
+        _LOG.warning('Station plug %s is unhealthy, instantiating it again.',
+                     plug_instance)
+        return False
+      plug_instance.reset()
+      return True
+    except Exception:  # pylint: disable=broad-except
+      _LOG.warning(
+          'Error reusing station plug %s, instantiating it again:',
+          plug_instance,
+          exc_info=True)
+      return False
+
+  def acquire(
+      self, plug_type: Type[PlugT],
+      instantiate: Callable[[], PlugT]) -> Tuple[PlugT, bool]:
+    """Returns an instance of plug_type, and whether it was reused.
+
+    Args:
+      plug_type: Station-scoped plug type.
+      instantiate: Function returning a new instance of plug_type.
+    """
+    with self._lock:
+      type_lock = self._type_locks[plug_type]
+    # Only hold the lock of this plug type while instantiating, so that other
+    # plug types can be instantiated concurrently.
+    with type_lock:
+      with self._lock:
+        plug_instance = self._plugs.get(plug_type)
+        idle = not self._users[plug_type]
+      reused = plug_instance is not None
+      if reused and idle and not self._reuse(plug_instance):
+        with self._lock:
+          del self._plugs[plug_type]
+        try:
+          plug_instance.tearDown()
+        except Exception:  # pylint: disable=broad-except
+          _LOG.warning(
+              'Exception calling tearDown on %s:', plug_instance, exc_info=True)
+        plug_instance, reused = None, False
+      if plug_instance is None:
+        plug_instance = instantiate()
+      with self._lock:
+        self._plugs[plug_type] = plug_instance
+        self._users[plug_type] += 1
+    return plug_instance, reused
+
+  def release(self, plug_type: Type[base_plugs.BasePlug]) -> None:
+    with self._lock:
+      self._users[plug_type] -= 1
+
+  def tear_down(self) -> None:
+    """Tears down the instances that are not in use."""
+    with self._lock:
+      idle = {
+          plug_type: plug_instance
+          for plug_type, plug_instance in self._plugs.items()
+          if not self._users[plug_type]
+      }
+      for plug_type in idle:
+        del self._plugs[plug_type]
+      if self._plugs:
+        _LOG.warning('Not tearing down station plugs in use: %s',
+                     list(self._plugs.values()))
+    plug_manager = PlugManager()
+    for plug_type, plug_instance in idle.items():
+      plug_manager.update_plug(plug_type, plug_instance)
+    plug_manager.tear_down_plugs()
+
+
+_STATION_PLUGS = _StationPlugPool()
+
+
+def tear_down_station_plugs() -> None:
+  """Tears down the instances of station-scoped plugs.
+
+  Station-scoped plugs outlive test executions, so a station should call this
+  when it is done running tests.  Plugs still in use by a running test are left
+  alone.
+  """
+  _STATION_PLUGS.tear_down()
+
+
 class PlugManager(object):
   """Class to manage the lifetimes of plugs.
 
@@ -158,13 +291,24 @@ class PlugManager(object):
     _plugs_by_type: Dict mapping plug type to plug instance.
     _plugs_by_name: Dict mapping plug name to plug instance.
     _plug_descriptors: Dict mapping plug type to plug descriptor.
+    _shared_plugs: Dict mapping plug type to a plug instance owned by someone
+      else, which is used instead of creating one and is not torn down.
+    _station_plug_types: Set of the station-scoped plug types whose instance
+      was acquired from the station plug pool, to release when tearing down.
+    init_durations_s: Dict mapping plug name to the duration of its
+      instantiation, in seconds.
+    tear_down_durations_s: Dict mapping plug name to the duration of its last
+      tearDown() call, in seconds.
     logger: logging.Logger instance that can save logs to the running test
       record.
   """
 
-  def __init__(self,
-               plug_types: Optional[Set[Type[base_plugs.BasePlug]]] = None,
-               record_logger: Optional[logging.Logger] = None):
+  def __init__(
+      self,
+      plug_types: Optional[Set[Type[base_plugs.BasePlug]]] = None,
+      record_logger: Optional[logging.Logger] = None,
+      shared_plugs: Optional[Dict[Type[base_plugs.BasePlug],
+                                  base_plugs.BasePlug]] = None):
     self._plug_types = plug_types or set()
     for plug_type in self._plug_types:
       if isinstance(plug_type, base_plugs.PlugPlaceholder):
@@ -174,19 +318,24 @@ class PlugManager(object):
     self._plugs_by_type = {}
     self._plugs_by_name = {}
     self._plug_descriptors = {}
+    self._shared_plugs = dict(shared_plugs or {})
+    self._station_plug_types = set()
+    self.init_durations_s = {}  # type: Dict[Text, float]
+    self.tear_down_durations_s = {}  # type: Dict[Text, float]
     if not record_logger:
       record_logger = _LOG
     self.logger = record_logger.getChild('plug')
 
   def as_base_types(self) -> Dict[Text, Any]:
+    # Iterate over copies, plugs may be initialized by another thread.
     return {
         'plug_descriptors': {
             name: attr.asdict(descriptor)
-            for name, descriptor in self._plug_descriptors.items()
+            for name, descriptor in dict(self._plug_descriptors).items()
         },
         'plug_states': {
             name: data.convert_to_base_types(plug)
-            for name, plug in self._plugs_by_name.items()
+            for name, plug in dict(self._plugs_by_name).items()
         },
     }
 
@@ -226,56 +375,176 @@ class PlugManager(object):
     """
     return '%s.%s' % (plug_type.__module__, plug_type.__name__)
 
+  def _get_plug_requirements(
+      self, plug_types: Iterable[Type[base_plugs.BasePlug]]
+  ) -> Dict[Type[base_plugs.BasePlug], Set[Type[base_plugs.BasePlug]]]:
+    """Returns the plug types to instantiate, with the ones they wait for.
+
+    Required plug types are added to the result.  Plugs that are already
+    instantiated, or shared, are left out; shared plugs are registered.
+
+    Args:
+      plug_types: Plug types to initialize.
+    """
+    requirements = {}
+    pending = list(plug_types)
+    while pending:
+      plug_type = pending.pop()
+      if plug_type in requirements or plug_type in self._plugs_by_type:
+        continue
+      if plug_type in self._shared_plugs:
+        self.update_plug(plug_type, self._shared_plugs[plug_type])
+        continue
+      if not (isinstance(plug_type, type) and
+              issubclass(plug_type, base_plugs.BasePlug)):
+        # Raises InvalidPlugError when it is instantiated.
+        requirements[plug_type] = set()
+        continue
+      requirements[plug_type] = set(plug_type.requires)
+      pending.extend(plug_type.requires)
+
+    for required in requirements.values():
+      required.intersection_update(requirements)
+    return requirements
+
+  def _instantiate_plug(
+      self, plug_type: Type[base_plugs.BasePlug]) -> base_plugs.BasePlug:
+    """Returns an instance of plug_type, logging any error.
+
+    Station-scoped plugs are taken from the station plug pool, which only
+    instantiates them when there is no reusable instance.
+
+    Args:
+      plug_type: Plug type to instantiate.
+    """
+    # Create a logger for this plug. All plug loggers go under the 'plug'
+    # sub-logger in the logger hierarchy.
+    plug_logger = self.logger.getChild(plug_type.__name__)
+    start_time = time.time()
+    if (isinstance(plug_type, type) and
+        issubclass(plug_type, base_plugs.BasePlug) and
+        plug_type.scope == base_plugs.PlugScope.STATION):
+      plug_instance, reused = _STATION_PLUGS.acquire(
+          plug_type, lambda: self._create_plug(plug_type, plug_logger))
+      self._station_plug_types.add(plug_type)
+      # Log into the record of the test execution now using the plug.
+      plug_instance.logger = plug_logger
+    else:
+      plug_instance = self._create_plug(plug_type, plug_logger)
+      reused = False
+    duration_s = time.time() - start_time
+    self.init_durations_s[self.get_plug_name(plug_type)] = duration_s
+    plug_logger.debug('%s plug in %.3f s.',
+                      'Reused station' if reused else 'Instantiated',
+                      duration_s)
+    return plug_instance
+
+  def _create_plug(self, plug_type: Type[base_plugs.BasePlug],
+                   plug_logger: logging.Logger) -> base_plugs.BasePlug:
+    """Returns a new instance of plug_type, logging any error."""
+    try:
+      if not issubclass(plug_type, base_plugs.BasePlug):
+        raise base_plugs.InvalidPlugError(
+            'Plug type "{}" is not an instance of base_plugs.BasePlug'.format(
+                plug_type))
+      if plug_type.logger != _BASE_PLUGS_LOG:
+        # They put a logger attribute on the class itself, overriding ours.
+        raise base_plugs.InvalidPlugError(
+            'Do not override "logger" in your plugs.', plug_type)
+
+      # Have __init__'s logging go into the record.  The logger is only set for
+      # this thread, other tests may be instantiating the same plug type.
+      with base_plugs.instantiation_logger(plug_logger):
+        plug_instance = plug_type()
+      # Set the logger attribute directly (rather than in base_plugs.BasePlug)
+      # so we don't depend on subclasses' implementation of __init__ to have
+      # it set.
+      if plug_instance.logger != _BASE_PLUGS_LOG:
+        raise base_plugs.InvalidPlugError(
+            'Do not set "self.logger" in __init__ in your plugs', plug_type)
+      else:
+        # Now the instance has its own copy of the test logger.
+        plug_instance.logger = plug_logger
+    except Exception:  # pylint: disable=broad-except
+      plug_logger.exception('Exception instantiating plug type %s', plug_type)
+      raise
+    return plug_instance
+
   def initialize_plugs(
       self,
-      plug_types: Optional[Set[Type[base_plugs.BasePlug]]] = None) -> None:
+      plug_types: Optional[Iterable[Type[base_plugs.BasePlug]]] = None) -> None:
     """Instantiate required plugs.
 
     Instantiates plug types and saves the instances in self._plugs_by_type for
-    use in provide_plugs().
+    use in provide_plugs().  Plug types listed in the requires attribute of a
+    plug are instantiated too, before it.  Plugs are instantiated in the calling
+    thread, unless CONF.plug_init_max_workers allows plugs that do not require
+    each other to be instantiated concurrently on worker threads.
+
+    If a plug fails to instantiate, no further plug is instantiated, all the
+    plugs are torn down once the ones being instantiated are done, and the
+    first error is raised.
 
     Args:
       plug_types: Plug types may be specified here rather than passed into the
         constructor (this is used primarily for unit testing phases).
+
+    Raises:
+      base_plugs.InvalidPlugError: if a plug type is invalid, or plugs require
+        each other.
     """
     types = plug_types if plug_types is not None else self._plug_types
-    for plug_type in types:
-      # Create a logger for this plug. All plug loggers go under the 'plug'
-      # sub-logger in the logger hierarchy.
-      plug_logger = self.logger.getChild(plug_type.__name__)
-      if plug_type in self._plugs_by_type:
-        continue
-      try:
-        if not issubclass(plug_type, base_plugs.BasePlug):
-          raise base_plugs.InvalidPlugError(
-              'Plug type "{}" is not an instance of base_plugs.BasePlug'.format(
-                  plug_type))
-        if plug_type.logger != _BASE_PLUGS_LOG:
-          # They put a logger attribute on the class itself, overriding ours.
-          raise base_plugs.InvalidPlugError(
-              'Do not override "logger" in your plugs.', plug_type)
-
-        # Override the logger so that __init__'s logging goes into the record.
-        plug_type.logger = plug_logger
-        try:
-          plug_instance = plug_type()
-        finally:
-          # Now set it back since we'll give the instance a logger in a moment.
-          plug_type.logger = _BASE_PLUGS_LOG
-        # Set the logger attribute directly (rather than in base_plugs.BasePlug)
-        # so we don't depend on subclasses' implementation of __init__ to have
-        # it set.
-        if plug_instance.logger != _BASE_PLUGS_LOG:
-          raise base_plugs.InvalidPlugError(
-              'Do not set "self.logger" in __init__ in your plugs', plug_type)
-        else:
-          # Now the instance has its own copy of the test logger.
-          plug_instance.logger = plug_logger
-      except Exception:  # pylint: disable=broad-except
-        plug_logger.exception('Exception instantiating plug type %s', plug_type)
-        self.tear_down_plugs()
-        raise
-      self.update_plug(plug_type, plug_instance)
+    requirements = self._get_plug_requirements(types)
+    max_workers = min(CONF.plug_init_max_workers, len(requirements))
+
+    errors = []
+    running = {}  # Maps futures to the plug type they instantiate.
+    pool = None
+    if max_workers > 1:
+      pool = futures.ThreadPoolExecutor(
+          max_workers=max_workers, thread_name_prefix='PlugInit')
+    try:
+      while requirements or running:
+        ready = [
+            plug_type for plug_type, required in requirements.items()
+            if not required
+        ]
+        if not errors:
+          for plug_type in ready:
+            del requirements[plug_type]
+            if pool is None:
+              future = futures.Future()
+              try:
+                future.set_result(self._instantiate_plug(plug_type))
+              except Exception as e:  # pylint: disable=broad-except
+                future.set_exception(e)
+            else:
+              future = pool.submit(self._instantiate_plug, plug_type)
+            running[future] = plug_type
+        if not running:
+          if requirements and not errors:
+            errors.append(
+                base_plugs.InvalidPlugError(
+                    'Plugs %s require each other.' %
+                    sorted(self.get_plug_name(t) for t in requirements)))
+          break
+
+        done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+        for future in done:
+          plug_type = running.pop(future)
+          if future.exception() is not None:
+            errors.append(future.exception())
+            continue
+          self.update_plug(plug_type, future.result())
+          for required in requirements.values():
+            required.discard(plug_type)
+    finally:
+      if pool is not None:
+        pool.shutdown(wait=True)
+
+    if errors:
+      self.tear_down_plugs()
+      raise errors[0]
 
   def get_plug_by_class_path(self,
                              plug_name: Text) -> Optional[base_plugs.BasePlug]:
@@ -309,7 +578,12 @@ class PlugManager(object):
     """
     self._plug_types.add(plug_type)
     if plug_type in self._plugs_by_type:
-      self._plugs_by_type[plug_type].tearDown()
+      if plug_type in self._station_plug_types:
+        self._station_plug_types.remove(plug_type)
+        _STATION_PLUGS.release(plug_type)
+      elif (self._plugs_by_type[plug_type] is not
+            self._shared_plugs.get(plug_type)):
+        self._plugs_by_type[plug_type].tearDown()
     plug_name = self.get_plug_name(plug_type)
     self._plugs_by_type[plug_type] = plug_value
     self._plugs_by_name[plug_name] = plug_value
@@ -328,25 +602,79 @@ class PlugManager(object):
     this method, and initialize_plugs must be called again after calling
     this method if you want to access the plugs attribute again.
 
+    Plugs are torn down concurrently, except that a plug listed in the requires
+    attribute of another plug is torn down after it.  A tearDown() call still
+    running CONF.plug_teardown_timeout_s after it started is killed, so plugs
+    that do not require one another share a single deadline.
+
     Any exceptions in tearDown() methods are logged, but do not get raised
-    by this method.
+    by this method.  Shared plugs are left to their owner to tear down, and
+    station-scoped plugs are returned to the station plug pool.
     """
     _LOG.debug('Tearing down all plugs.')
-    for plug_type, plug_instance in self._plugs_by_type.items():
-      if plug_instance.uses_base_tear_down():
-        name = '<PlugTearDownThread: BasePlug No-Op for %s>' % plug_type
-      else:
-        name = '<PlugTearDownThread: %s>' % plug_type
-      thread = _PlugTearDownThread(plug_instance, name=name)
-      thread.start()
-      timeout_s = (
-          CONF.plug_teardown_timeout_s
-          if CONF.plug_teardown_timeout_s else None)
-      thread.join(timeout_s)
-      if thread.is_alive():
-        thread.kill()
-        _LOG.warning('Killed tearDown for plug %s after timeout.',
-                     plug_instance)
+    for plug_type in self._station_plug_types:
+      _STATION_PLUGS.release(plug_type)
+    plugs_by_type = {
+        plug_type: plug_instance
+        for plug_type, plug_instance in self._plugs_by_type.items()
+        if plug_instance is not self._shared_plugs.get(plug_type) and
+        plug_type not in self._station_plug_types
+    }
+    self._station_plug_types.clear()
+    # Maps each plug type to the plug types that must be torn down before it.
+    dependents = {plug_type: set() for plug_type in plugs_by_type}
+    for plug_type in plugs_by_type:
+      for required in getattr(plug_type, 'requires', ()):
+        if required in dependents and required is not plug_type:
+          dependents[required].add(plug_type)
+
+    timeout_s = (
+        CONF.plug_teardown_timeout_s if CONF.plug_teardown_timeout_s else None)
+    finished_cond = threading.Condition()
+    running = {}  # Maps plug types to their _PlugTearDownThread.
+    done = set()
+    while len(done) < len(plugs_by_type):
+      ready = [
+          plug_type for plug_type in plugs_by_type
+          if plug_type not in running and dependents[plug_type] <= done
+      ]
+      if not ready and len(running) == len(done):
+        # Plugs requiring one another, tear them down regardless of order.
+        ready = [t for t in plugs_by_type if t not in running]
+      for plug_type in ready:
+        plug_instance = plugs_by_type[plug_type]
+        if plug_instance.uses_base_tear_down():
+          name = '<PlugTearDownThread: BasePlug No-Op for %s>' % plug_type
+        else:
+          name = '<PlugTearDownThread: %s>' % plug_type
+        thread = _PlugTearDownThread(plug_instance, finished_cond, name=name)
+        thread.start()
+        running[plug_type] = thread
+
+      with finished_cond:
+        pending = {t: running[t] for t in running if t not in done}
+        wait_s = None
+        if timeout_s is not None:
+          wait_s = max(
+              0,
+              min(thread.start_time + timeout_s
+                  for thread in pending.values()) - time.time())
+        finished_cond.wait_for(
+            lambda: any(thread.finished for thread in pending.values()),  # pylint: disable=cell-var-from-loop
+            timeout=wait_s)
+
+      for plug_type, thread in pending.items():
+        elapsed_s = time.time() - thread.start_time
+        if not thread.finished:
+          if timeout_s is None or elapsed_s < timeout_s:
+            continue
+          thread.kill()
+          _LOG.warning('Killed tearDown for plug %s after timeout.',
+                       plugs_by_type[plug_type])
+        done.add(plug_type)
+        self.tear_down_durations_s[self.get_plug_name(plug_type)] = elapsed_s
+        self.logger.getChild(plug_type.__name__).debug(
+            'Tore down plug in %.3f s.', elapsed_s)
     self._plugs_by_type.clear()
     self._plugs_by_name.clear()
 
@@ -14,6 +14,7 @@
 """One-off utilities."""
 
 import logging
+import math
 import re
 import threading
 import time
@@ -184,24 +185,56 @@ class SubscribableStateMixin(object):
   asdict_with_event to get the current state and an event object. This object
   can then notify watchers holding those events that the state has changed by
   calling notify_update.
+
+  Notifications can be coalesced by setting a minimum notification interval.
+  Updates arriving within that interval of the last delivered notification only
+  mark the state as dirty, without taking the lock; a single trailing
+  notification is then delivered once the interval has elapsed, so watchers
+  wake at most once per interval and never miss the final state.
   """
 
-  def __init__(self):
+  def __init__(self, min_notify_interval_s: float = 0.0):
     super(SubscribableStateMixin, self).__init__()
     self._lock = threading.Lock()
     self._update_events = weakref.WeakSet()
+    self._min_notify_interval_s = min_notify_interval_s
+    # The monotonic clock may start near 0, the first update is never delayed.
+    self._last_notify_time = -math.inf
+    self._notify_pending = False
+    self._notifications_delivered = 0
+    self._notifications_suppressed = 0
 
   def _asdict(self) -> Dict[Text, Any]:
     raise NotImplementedError(
         'Subclasses of SubscribableStateMixin must implement _asdict.')
 
+  @property
+  def min_notify_interval_s(self) -> float:
+    """Minimum time between delivered notifications, 0 to deliver them all."""
+    return self._min_notify_interval_s
+
+  @min_notify_interval_s.setter
+  def min_notify_interval_s(self, value: float) -> None:
+    self._min_notify_interval_s = value
+
+  @property
+  def notifications_delivered(self) -> int:
+    """Number of notifications delivered to watchers."""
+    return self._notifications_delivered
+
+  @property
+  def notifications_suppressed(self) -> int:
+    """Number of notify_update calls coalesced into a later notification."""
+    return self._notifications_suppressed
+
   def asdict_with_event(self) -> Tuple[Dict[Text, Any], threading.Event]:
     """Get a dict representation of this object and an update event.
 
     Returns:
       state: Dict representation of this object.
-      update_event: An event that is guaranteed to be set if an update has been
-          triggered since the returned dict was generated.
+      update_event: An event that is guaranteed to be set, at most
+          min_notify_interval_s later, if an update has been triggered since
+          the returned dict was generated.
     """
     event = threading.Event()
     with self._lock:
@@ -210,7 +243,30 @@ class SubscribableStateMixin(object):
 
   def notify_update(self) -> None:
     """Notify any update events that there was an update."""
+    interval = self._min_notify_interval_s
+    if interval > 0:
+      elapsed = time.monotonic() - self._last_notify_time
+      if elapsed < interval:
+        self._notifications_suppressed += 1
+        if not self._notify_pending:
+          self._notify_pending = True
+          timer = threading.Timer(interval - elapsed,
+                                  self._deliver_pending_update)
+          timer.daemon = True
+          timer.start()
+        return
+    self._deliver_update()
+
+  def _deliver_pending_update(self) -> None:
+    if self._notify_pending:
+      self._deliver_update()
+
+  def _deliver_update(self) -> None:
+    self._notify_pending = False
+    self._last_notify_time = time.monotonic()
     with self._lock:
-      for event in self._update_events:
-        event.set()
+      events = list(self._update_events)
       self._update_events.clear()
+    for event in events:
+      event.set()
+    self._notifications_delivered += 1
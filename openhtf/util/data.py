@@ -17,7 +17,7 @@ We use a few special data formats internally, these utility functions make it a
 little easier to work with them.
 """
 
-from collections.abc import Iterable
+import collections
 import copy
 import difflib
 import enum
@@ -29,7 +29,8 @@ import numbers
 import pprint
 import struct
 import sys
-from typing import Any, TypeVar
+import types
+from typing import Any, Optional, TypeVar
 
 import attr
 from mutablerecords import records
@@ -37,6 +38,15 @@ from mutablerecords import records
 # Used by convert_to_base_types().
 PASSTHROUGH_TYPES = {bool, bytes, int, type(None), str}
 
+# Number of items of each container walked by total_size(); the size of larger
+# containers is extrapolated from that many of their items.
+TOTAL_SIZE_SAMPLES = 100
+
+# Objects shared by code rather than owned by data, sized as a reference.
+_SHARED_TYPES = (type, types.ModuleType, types.FunctionType,
+                 types.BuiltinFunctionType, types.MethodType, enum.Enum,
+                 logging.Logger)
+
 
 def pprint_diff(first, second, first_name='first', second_name='second'):
   """Compare the pprint representation of two objects and yield diff lines."""
@@ -216,35 +226,80 @@ def convert_to_base_types(obj,
     raise
 
 
-def total_size(obj):
-  """Returns the approximate total memory footprint an object."""
+def _attribute_values(obj):
+  """Returns the values of the instance attributes and slots of obj."""
+  values = []
+  if hasattr(obj, '__dict__'):
+    values.append(vars(obj))
+  for cls in type(obj).__mro__:
+    slots = cls.__dict__.get('__slots__', ())
+    for slot in (slots,) if isinstance(slots, str) else slots:
+      if slot not in ('__dict__', '__weakref__') and hasattr(obj, slot):
+        values.append(getattr(obj, slot))
+  return values
+
+
+def total_size(obj, max_samples: Optional[int] = TOTAL_SIZE_SAMPLES):
+  """Returns the approximate total memory footprint an object.
+
+  Dicts, lists, tuples, sets and deques with more than max_samples items are
+  estimated from max_samples of their items, spread evenly over lists and
+  tuples, so the cost stays bounded on huge objects.  Instance attributes and
+  slots are followed; classes, modules, functions, enums and loggers are
+  shared with code and only count as a reference.
+
+  Args:
+    obj: The object to size.
+    max_samples: Maximum number of items walked per container, or None to
+      walk all of them.
+
+  Returns:
+    The estimated size in bytes.
+  """
   seen = set()
+  reference_size = struct.calcsize('P')
 
   def sizeof(current_obj):
     try:
       return _sizeof(current_obj)
     except Exception:  # pylint: disable=broad-except
       # Not sure what just happened, but let's assume it's a reference.
-      return struct.calcsize('P')
+      return reference_size
+
+  def sample(items, count):
+    """Returns up to max_samples of count items."""
+    if max_samples is None or count <= max_samples:
+      return list(items)
+    if isinstance(items, (list, tuple)):
+      return [items[i * count // max_samples] for i in range(max_samples)]
+    return list(itertools.islice(items, max_samples))
 
   def _sizeof(current_obj):
-    """Do a depth-first acyclic traversal of all reachable objects."""
+    """Do a depth-first acyclic traversal of reachable objects."""
     if id(current_obj) in seen:
       # A rough approximation of the size cost of an additional reference.
-      return struct.calcsize('P')
+      return reference_size
     seen.add(id(current_obj))
+    if isinstance(current_obj, _SHARED_TYPES):
+      return reference_size
     size = sys.getsizeof(current_obj)
 
     if isinstance(current_obj, dict):
-      size += sum(
-          map(sizeof,
-              itertools.chain.from_iterable(current_obj.items())))
-    elif (isinstance(current_obj, Iterable) and
-          not isinstance(current_obj, str)):
-      size += sum(sizeof(item) for item in current_obj)
-    elif isinstance(current_obj, records.RecordClass):
-      size += sum(
-          sizeof(getattr(current_obj, a)) for a in current_obj.__slots__)
+      count = len(current_obj)
+      children = [
+          sizeof(key) + sizeof(value)
+          for key, value in sample(current_obj.items(), count)
+      ]
+    elif isinstance(current_obj,
+                    (list, tuple, set, frozenset, collections.deque)):
+      count = len(current_obj)
+      children = [sizeof(item) for item in sample(current_obj, count)]
+    elif isinstance(current_obj, (str, bytes, bytearray, memoryview)):
+      return size
+    else:
+      return size + sum(map(sizeof, _attribute_values(current_obj)))
+    if children:
+      size += sum(children) * count // len(children)
     return size
 
   return sizeof(obj)
@@ -259,8 +314,8 @@ def attr_copy(obj: _AttrCopyT, **overrides: Any) -> _AttrCopyT:
   for field in attr.fields(type(obj)):
     name = field.name
     init_name = name if name[0] != '_' else name[1:]
-    # Skip fields being set in the override.
-    if init_name in overrides:
+    # Skip fields being set in the override, or by the constructor.
+    if init_name in overrides or not field.init:
       continue
     value = getattr(obj, name)
     if attr.has(value):
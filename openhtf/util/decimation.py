@@ -0,0 +1,145 @@
+# Copyright 2024 Google Inc. All Rights Reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Decimation of dimensioned measurement values for display.
+
+The values of a dimensioned measurement are rows of coordinates followed by the
+measured value, as returned by DimensionedMeasuredValue.basetype_value().  The
+functions here pick a subset of at most a given number of rows that keeps the
+visual shape of the data, so that large sweeps can be plotted cheaply:
+
+  - lttb() implements Largest-Triangle-Three-Buckets, which suits a value
+    plotted against a single numeric dimension.
+  - min_max() keeps the rows holding the smallest and largest value of each
+    bucket of consecutive rows, and works for any number of dimensions.
+
+Rows are always returned in their original order, and are never modified.
+"""
+
+import math
+from typing import Any, List, Sequence, Text
+
+LTTB = 'lttb'
+MIN_MAX = 'min_max'
+
+
+def _is_number(value: Any) -> bool:
+  return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def lttb(rows: Sequence[Sequence[Any]], budget: int) -> List[Sequence[Any]]:
+  """Decimates (x, y) rows with Largest-Triangle-Three-Buckets.
+
+  Args:
+    rows: Rows whose first element is x and last element is y, both numbers.
+    budget: Maximum number of rows to return.
+
+  Returns:
+    At most budget rows, including the first and last ones.
+  """
+  num_rows = len(rows)
+  if num_rows <= budget:
+    return list(rows)
+  if budget < 3:
+    return [rows[0], rows[-1]][:budget]
+
+  sampled = [rows[0]]
+  bucket_size = (num_rows - 2) / (budget - 2)
+  previous = rows[0]
+  for bucket in range(budget - 2):
+    # Average of the next bucket, the third point of the triangles.
+    next_start = int((bucket + 1) * bucket_size) + 1
+    next_end = min(int((bucket + 2) * bucket_size) + 1, num_rows)
+    next_rows = rows[next_start:next_end]
+    avg_x = sum(row[0] for row in next_rows) / len(next_rows)
+    avg_y = sum(row[-1] for row in next_rows) / len(next_rows)
+
+    # Pick the row of this bucket forming the largest triangle.
+    start = int(bucket * bucket_size) + 1
+    end = int((bucket + 1) * bucket_size) + 1
+    prev_x, prev_y = previous[0], previous[-1]
+    max_area = -1.0
+    for row in rows[start:end]:
+      area = abs((prev_x - avg_x) * (row[-1] - prev_y) -
+                 (prev_x - row[0]) * (avg_y - prev_y))
+      if area > max_area:
+        max_area = area
+        previous = row
+    sampled.append(previous)
+  sampled.append(rows[-1])
+  return sampled
+
+
+def min_max(rows: Sequence[Sequence[Any]], budget: int) -> List[Sequence[Any]]:
+  """Decimates rows by keeping the extreme values of consecutive buckets.
+
+  Args:
+    rows: Rows whose last element is the value.  Buckets with no numeric value
+      keep their first row.
+    budget: Maximum number of rows to return.
+
+  Returns:
+    At most budget rows.
+  """
+  num_rows = len(rows)
+  if num_rows <= budget:
+    return list(rows)
+  if budget < 2:
+    return list(rows[:budget])
+
+  bucket_size = math.ceil(num_rows / (budget // 2))
+  sampled = []
+  for start in range(0, num_rows, bucket_size):
+    low = high = None
+    for index in range(start, min(start + bucket_size, num_rows)):
+      value = rows[index][-1]
+      if not _is_number(value) or value != value:  # Skip NaN as well.
+        continue
+      if low is None or value < rows[low][-1]:
+        low = index
+      if high is None or value > rows[high][-1]:
+        high = index
+    if low is None:
+      sampled.append(rows[start])
+    else:
+      sampled.extend(rows[index] for index in sorted({low, high}))
+  return sampled
+
+
+def decimate(rows: Sequence[Sequence[Any]],
+             budget: int,
+             method: Text = LTTB) -> List[Sequence[Any]]:
+  """Decimates rows to at most budget rows.
+
+  Args:
+    rows: Rows of coordinates followed by the value.
+    budget: Maximum number of rows to return.
+    method: LTTB or MIN_MAX.  LTTB falls back to MIN_MAX unless the rows have
+      a single numeric dimension and numeric values.
+
+  Raises:
+    ValueError: if method is unknown.
+
+  Returns:
+    The rows themselves if there are at most budget rows, else the decimated
+    rows in their original order.
+  """
+  if method not in (LTTB, MIN_MAX):
+    raise ValueError('Unknown decimation method %r' % method)
+  if len(rows) <= budget:
+    return list(rows)
+  if method == LTTB and all(
+      len(row) == 2 and _is_number(row[0]) and _is_number(row[1])
+      for row in rows):
+    return lttb(rows, budget)
+  return min_max(rows, budget)
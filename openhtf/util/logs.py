@@ -275,10 +275,11 @@ class RecordHandler(logging.Handler):
     """
     try:
       message = self.format(record)
+      # Logger and file names repeat for every line, share their strings.
       log_record = LogRecord(
           record.levelno,
-          record.name,
-          os.path.basename(record.pathname),
+          sys.intern(record.name),
+          sys.intern(os.path.basename(record.pathname)),
           record.lineno,
           int(record.created * 1000),
           message,
@@ -387,7 +387,7 @@ class PhaseOrTestIterator(Iterator):
     # Cobble together a fake TestState to pass to the test phase.
     test_options = test_descriptor.TestOptions()
     with mock.patch.object(
-        plugs, 'PlugManager', new=lambda _, __: self.plug_manager):
+        plugs, 'PlugManager', new=lambda *_, **__: self.plug_manager):
       test_state_ = test_state.TestState(
           test_descriptor.TestDescriptor(
               phase_collections.PhaseSequence((phase_desc,)),
@@ -412,13 +412,16 @@ class PhaseOrTestIterator(Iterator):
         '_log_exception',
         side_effect=logging.exception):
       # Use _execute_phase_once because we want to expose all possible outcomes.
-      phase_result, profile_stats = executor._execute_phase_once(
-          phase_desc,
-          is_last_repeat=False,
-          run_with_profiling=profile_filepath,
-          subtest_rec=None)
-
-    if profile_filepath is not None:
+      try:
+        phase_result, profile_stats = executor._execute_phase_once(
+            phase_desc,
+            is_last_repeat=False,
+            run_with_profiling=profile_filepath,
+            subtest_rec=None)
+      finally:
+        executor.close()
+
+    if profile_filepath is not None and profile_stats is not None:
       _merge_stats(profile_stats, profile_filepath)
 
     if phase_result.raised_exception:
@@ -442,7 +445,7 @@ class PhaseOrTestIterator(Iterator):
       profile_tempfile = tempfile.NamedTemporaryFile()
     # Mock the PlugManager to use ours instead, and execute the test.
     with mock.patch.object(
-        plugs, 'PlugManager', new=lambda _, __: self.plug_manager):
+        plugs, 'PlugManager', new=lambda *_, **__: self.plug_manager):
       test.execute(
           test_start=self.test_case.test_start_function,
           profile_filename=(None if profile_tempfile is None else
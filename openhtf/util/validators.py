@@ -64,10 +64,22 @@ meaningful description of what it does, you should implement a __str__ method.
 
 Validators must also be deepcopy()'able, and may need to implement __deepcopy__
 if they are implemented by a class that has internal state that is not copyable
-by the default copy.deepcopy().
+by the default copy.deepcopy().  Each parametrization and run of a phase gets
+its own deep copy of the validators of its measurements, see copy_validator();
+only the built-in validators, which never change once created, are shared.
+
+Validators deriving from ValidatorBase may also implement validate_array() and
+is_marginal_array() to check a whole numpy array of measured values in one
+operation.  Measurement.validate() prefers these for array-backed values, such
+as columnar dimensioned measurements, and falls back to calling the validator
+with the measured value when they return NotImplemented.  The built-in
+collection validators (all_in_range, all_equals, dimension_pivot_validate and
+consistent_end_dimension_pivot_validate) do so whenever their limits or
+sub-validators are numeric.
 """
 
 import abc
+import copy
 import math
 import numbers
 import re
@@ -75,6 +87,13 @@ from typing import Callable, Dict, Optional, Type, TypeVar, Union
 
 from openhtf import util
 
+try:
+  # pylint: disable=g-import-not-at-top
+  import numpy  # pytype: disable=import-error
+  # pylint: enable=g-import-not-at-top
+except ImportError:
+  numpy = None
+
 
 class ValidatorBase(abc.ABC):
 
@@ -82,6 +101,49 @@ class ValidatorBase(abc.ABC):
   def __call__(self, value) -> bool:
     """Should validate value, returning a boolean result."""
 
+  def validate_array(self, values):
+    """Optionally validates a numpy array of measured values at once.
+
+    Args:
+      values: 1-D numpy array of the measured values; for a dimensioned
+        measurement these are the last element of each row.
+
+    Returns:
+      The same boolean result as calling this validator with the measured
+      value, or NotImplemented if values cannot be validated as an array.
+    """
+    del values  # Unused.
+    return NotImplemented
+
+  def is_marginal_array(self, values):
+    """Optionally checks marginality of a numpy array of measured values.
+
+    Args:
+      values: 1-D numpy array of the measured values, see validate_array.
+
+    Returns:
+      The same boolean result as is_marginal() for the measured value, or
+      NotImplemented if values cannot be checked as an array.
+    """
+    del values  # Unused.
+    return NotImplemented
+
+
+def _is_numeric_array(values) -> bool:
+  return (numpy is not None and isinstance(values, numpy.ndarray) and
+          values.ndim == 1 and values.dtype.kind in 'iuf')
+
+
+def _is_number(value) -> bool:
+  return isinstance(value, numbers.Number) and not isinstance(value, bool)
+
+
+def _pass_mask(validator, values):
+  """Returns the elementwise result of a scalar validator, or None."""
+  if not _is_numeric_array(values) or not hasattr(validator, '_pass_mask'):
+    return None
+  return validator._pass_mask(values)  # pylint: disable=protected-access
+
 
 _ValidatorFactoryT = Union[Callable[..., ValidatorBase]]
 _VALIDATORS: Dict[str, _ValidatorFactoryT] = {}
@@ -200,6 +262,30 @@ class AllInRangeValidator(RangeValidatorBase):
         [self._minimum <= value <= self._marginal_minimum for value in values])
     return is_maximally_marginal or is_minimally_marginal
 
+  def _has_numeric_limits(self) -> bool:
+    return all(
+        limit is None or _is_number(limit)
+        for limit in (self._minimum, self._maximum, self._marginal_minimum,
+                      self._marginal_maximum))
+
+  def validate_array(self, values):
+    if not _is_numeric_array(values) or not self._has_numeric_limits():
+      return NotImplemented
+    within_maximum = self._maximum is None or bool(
+        (values <= self._maximum).all())
+    within_minimum = self._minimum is None or bool(
+        (values >= self._minimum).all())
+    return within_minimum and within_maximum
+
+  def is_marginal_array(self, values):
+    if not _is_numeric_array(values) or not self._has_numeric_limits():
+      return NotImplemented
+    is_maximally_marginal = self._marginal_maximum is not None and bool(
+        ((values >= self._marginal_maximum) & (values <= self._maximum)).any())
+    is_minimally_marginal = self._marginal_minimum is not None and bool(
+        ((values >= self._minimum) & (values <= self._marginal_minimum)).any())
+    return is_maximally_marginal or is_minimally_marginal
+
   def __str__(self):
     assert self._minimum is not None or self._maximum is not None
     if (self._minimum is not None and self._maximum is not None and
@@ -233,6 +319,11 @@ class AllEqualsValidator(ValidatorBase):
   def __call__(self, values) -> bool:
     return all([value == self.spec for value in values])
 
+  def validate_array(self, values):
+    if not _is_numeric_array(values) or not _is_number(self._spec):
+      return NotImplemented
+    return bool((values == self._spec).all())
+
   def __str__(self) -> str:
     return "'x' is equal to '%s'" % self._spec
 
@@ -315,13 +406,19 @@ class InRange(RangeValidatorBase):
     return converter(self._marginal_maximum)
 
   def with_args(self, **kwargs):
-    return type(self)(
+    limits = dict(
         minimum=util.format_string(self._minimum, kwargs),
         maximum=util.format_string(self._maximum, kwargs),
         marginal_minimum=util.format_string(self._marginal_minimum, kwargs),
         marginal_maximum=util.format_string(self._marginal_maximum, kwargs),
-        type=self._type,
     )
+    if (limits['minimum'] is self._minimum and
+        limits['maximum'] is self._maximum and
+        limits['marginal_minimum'] is self._marginal_minimum and
+        limits['marginal_maximum'] is self._marginal_maximum):
+      # Nothing to format, validators are immutable so share this one.
+      return self
+    return type(self)(type=self._type, **limits)
 
   def __call__(self, value) -> bool:
     if value is None:
@@ -347,6 +444,20 @@ class InRange(RangeValidatorBase):
       return True
     return False
 
+  def _pass_mask(self, values):
+    """Returns a numpy array of __call__ results for each value."""
+    limits = (self.minimum if self._minimum is not None else None,
+              self.maximum if self._maximum is not None else None)
+    if not all(limit is None or _is_number(limit) for limit in limits):
+      return None
+    mask = ~numpy.isnan(values) if values.dtype.kind == 'f' else numpy.ones(
+        values.shape, dtype=bool)
+    if self._minimum is not None:
+      mask &= values >= self.minimum
+    if self._maximum is not None:
+      mask &= values <= self.maximum
+    return mask
+
   def __str__(self) -> str:
     assert self._minimum is not None or self._maximum is not None
     if (self._minimum is not None and self._maximum is not None and
@@ -406,6 +517,13 @@ class Equals(ValidatorBase):
   def __call__(self, value):
     return value == self.expected
 
+  def _pass_mask(self, values):
+    """Returns a numpy array of __call__ results for each value."""
+    expected = self.expected
+    if not _is_number(expected):
+      return None
+    return values == expected
+
   def __str__(self) -> str:
     return f"'x' is equal to '{self._expected}'"
 
@@ -486,6 +604,12 @@ class WithinPercent(RangeValidatorBase):
   def __call__(self, value) -> bool:
     return self.minimum <= value <= self.maximum
 
+  def _pass_mask(self, values):
+    """Returns a numpy array of __call__ results for each value."""
+    if not (_is_number(self.expected) and _is_number(self.percent)):
+      return None
+    return (values >= self.minimum) & (values <= self.maximum)
+
   def is_marginal(self, value) -> bool:
     if self.marginal_percent is None:
       return False
@@ -522,6 +646,12 @@ class DimensionPivot(ValidatorBase):
   def __call__(self, dimensioned_value) -> bool:
     return all(self._sub_validator(row[-1]) for row in dimensioned_value)
 
+  def validate_array(self, values):
+    mask = _pass_mask(self._sub_validator, values)
+    if mask is None:
+      return NotImplemented
+    return bool(mask.all())
+
   def __str__(self) -> str:
     return 'All values pass: {}'.format(str(self._sub_validator))
 
@@ -547,6 +677,14 @@ class ConsistentEndDimensionPivot(ValidatorBase):
       return False
     return all(self._sub_validator(rest[-1]) for rest in dimensioned_value[i:])
 
+  def validate_array(self, values):
+    mask = _pass_mask(self._sub_validator, values)
+    if mask is None:
+      return NotImplemented
+    if not mask.any():
+      return False
+    return bool(mask[numpy.argmax(mask):].all())
+
   def __str__(self) -> str:
     return 'Once pass, rest must also pass: {}'.format(str(self._sub_validator))
 
@@ -554,3 +692,27 @@ class ConsistentEndDimensionPivot(ValidatorBase):
 @register
 def consistent_end_dimension_pivot_validate(sub_validator):
   return ConsistentEndDimensionPivot(sub_validator)
+
+
+# Built-in validators that are never modified once created.
+_IMMUTABLE_VALIDATOR_TYPES = (AllInRangeValidator, AllEqualsValidator, InRange,
+                              Equals, RegexMatcher, WithinPercent)
+
+
+def _is_immutable(validator) -> bool:
+  if type(validator) in (DimensionPivot, ConsistentEndDimensionPivot):  # pylint: disable=unidiomatic-typecheck
+    return _is_immutable(validator._sub_validator)  # pylint: disable=protected-access
+  return type(validator) in _IMMUTABLE_VALIDATOR_TYPES  # pylint: disable=unidiomatic-typecheck
+
+
+def copy_validator(validator):
+  """Returns a deep copy of validator, or validator itself if it is immutable.
+
+  Subclasses of the built-in validators are copied too, as they may add state.
+
+  Args:
+    validator: The validator to copy.
+  """
+  if _is_immutable(validator):
+    return validator
+  return copy.deepcopy(validator)
@@ -117,6 +117,12 @@ def phase_two(test, test_plug):
   print('phase_two completed')
 
 
+@openhtf.PhaseOptions()
+def phase_record_thread(idents, sleep_s=0):
+  idents.append(threading.get_ident())
+  time.sleep(sleep_s)
+
+
 @openhtf.PhaseOptions(repeat_limit=4)
 @plugs.plug(test_plug=UnittestPlug.placeholder)
 def phase_repeat(test, test_plug):
@@ -643,6 +649,73 @@ class TestExecutorTest(unittest.TestCase):
     executor.close()
 
 
+@openhtf.measures(
+    openhtf.Measurement('sweep').with_dimensions('x').dimension_pivot_validate(
+        util.validators.InRange(minimum=0, maximum=5)))
+def phase_sweep(test, maximum):
+  for x in range(10):
+    test.measurements.sweep[x] = min(x, maximum)
+
+
+def _raise_validation_error(value):
+  raise ValueError('Cannot validate %s' % value)
+
+
+@openhtf.measures(
+    openhtf.Measurement('sweep').with_dimensions('x').with_validator(
+        _raise_validation_error))
+def phase_sweep_validator_raises(test):
+  test.measurements.sweep[0] = 1
+
+
+class DeferredMeasurementValidationTest(unittest.TestCase):
+
+  def _execute(self, *nodes):
+    test = openhtf.Test(*nodes)
+    test.configure(default_dut_id='dut')
+    executor = test_executor.TestExecutor(
+        test.descriptor,
+        'uid',
+        None,
+        test._test_options,
+        run_with_profiling=False)
+    executor.start()
+    executor.wait()
+    executor.close()
+    return executor.test_state.test_record
+
+  @CONF.save_and_restore(measurement_validation_workers=2)
+  def test_outcomes_settled_at_finalization(self):
+    record = self._execute(
+        phase_sweep.with_args(maximum=5), phase_sweep.with_args(maximum=9))
+    self.assertEqual([test_record.PhaseOutcome.PASS,
+                      test_record.PhaseOutcome.FAIL],
+                     [phase.outcome for phase in record.phases])
+    self.assertEqual(['PASS', 'FAIL'], [
+        phase['outcome'] for phase in record.as_base_types()['phases']
+    ])
+    self.assertEqual(test_record.Outcome.FAIL, record.outcome)
+
+  @CONF.save_and_restore(measurement_validation_workers=2)
+  def test_checkpoint_sees_deferred_failure(self):
+    record = self._execute(
+        phase_sweep.with_args(maximum=9),
+        phase_branches.PhaseFailureCheckpoint.all_previous(
+            'check', action=phase_descriptor.PhaseResult.STOP),
+        phase_sweep.with_args(maximum=5))
+    self.assertEqual(test_record.Outcome.FAIL, record.outcome)
+    self.assertEqual(1, len(record.phases))
+    self.assertEqual(test_record.PhaseOutcome.FAIL, record.phases[0].outcome)
+
+  @CONF.save_and_restore(measurement_validation_workers=2)
+  def test_validator_exception_errors_test(self):
+    record = self._execute(phase_sweep_validator_raises,
+                           phase_sweep.with_args(maximum=5))
+    self.assertEqual(test_record.PhaseOutcome.ERROR, record.phases[0].outcome)
+    self.assertEqual(test_record.Outcome.ERROR, record.outcome)
+    self.assertEqual('ValueError', record.outcome_details[0].code)
+
+
 class TestExecutorExecutePhaseTest(unittest.TestCase):
 
   def setUp(self):
@@ -1178,6 +1251,10 @@ class PhaseExecutorTest(parameterized.TestCase):
         [UnittestPlug, MoreRepeatsUnittestPlug])
     self.phase_executor = phase_executor.PhaseExecutor(self.test_state)
 
+  def tearDown(self):
+    self.phase_executor.close()
+    super(PhaseExecutorTest, self).tearDown()
+
   def test_execute_continue_phase(self):
     result, _ = self.phase_executor.execute_phase(phase_two)
     self.assertEqual(openhtf.PhaseResult.CONTINUE, result.phase_result)
@@ -1225,6 +1302,7 @@ class PhaseExecutorTest(parameterized.TestCase):
     my_phase_record.outcome = outcome
     mock_test_state.test_record.add_phase_record(my_phase_record)
     my_phase_executor = phase_executor.PhaseExecutor(mock_test_state)
+    self.addCleanup(my_phase_executor.close)
     tracker = RepeatTracker()
     result, _ = my_phase_executor.execute_phase(
         phase.with_args(tracker=tracker, meas_value=meas_value)
@@ -1250,3 +1328,111 @@ class PhaseExecutorTest(parameterized.TestCase):
     self.assertEqual(
         phase_executor.ExceptionInfo(phase_executor.InvalidPhaseResultError,
                                      mock.ANY, mock.ANY), result.phase_result)
+
+  def test_execute_phases_on_reused_thread(self):
+    idents = []
+    for _ in range(3):
+      result, _ = self.phase_executor.execute_phase(
+          phase_record_thread.with_args(idents=idents))
+      self.assertEqual(openhtf.PhaseResult.CONTINUE, result.phase_result)
+    self.assertEqual(1, len(set(idents)))
+    self.assertNotEqual(threading.get_ident(), idents[0])
+
+  def test_execute_phase_after_timeout_uses_new_thread(self):
+    idents = []
+    phase = openhtf.PhaseOptions(timeout_s=0.1)(
+        phase_record_thread.with_args(idents=idents, sleep_s=1))
+    result, _ = self.phase_executor.execute_phase(phase)
+    self.assertTrue(result.is_timeout)
+    result, _ = self.phase_executor.execute_phase(
+        phase_record_thread.with_args(idents=idents))
+    self.assertEqual(openhtf.PhaseResult.CONTINUE, result.phase_result)
+    self.assertEqual(2, len(set(idents)))
+
+  def test_execute_phases_with_profiling_on_reused_thread(self):
+    stats = []
+    for phase in (phase_two, phase_record_thread.with_args(idents=[])):
+      _, profile_stats = self.phase_executor.execute_phase(
+          phase, run_with_profiling=True)
+      stats.append({key[2] for key in profile_stats.stats})
+    self.assertIn('phase_two', stats[0])
+    self.assertNotIn('phase_record_thread', stats[0])
+    self.assertIn('phase_record_thread', stats[1])
+    self.assertNotIn('phase_two', stats[1])
+
+  def test_profile_collected_before_phase_done(self):
+    calls = []
+    stats_type = phase_executor.pstats.Stats
+
+    def collect_stats(*args):
+      phase_thread = threading.current_thread()
+      calls.append((phase_thread, phase_thread._phase_done.is_set()))
+      return stats_type(*args)
+
+    with mock.patch.object(
+        phase_executor.pstats, 'Stats', side_effect=collect_stats):
+      _, profile_stats = self.phase_executor.execute_phase(
+          phase_two, run_with_profiling=True)
+    # Phase threads left behind by other tests may collect their profile too.
+    self.assertEqual(
+        [False], [phase_done for phase_thread, phase_done in calls
+                  if phase_thread is self.phase_executor._phase_worker])
+    self.assertIn('phase_two', {key[2] for key in profile_stats.stats})
+
+  def test_no_profile_for_timed_out_phase(self):
+    phase = openhtf.PhaseOptions(timeout_s=0.1)(
+        phase_record_thread.with_args(idents=[], sleep_s=1))
+    result, profile_stats = self.phase_executor.execute_phase(
+        phase, run_with_profiling=True)
+    self.assertTrue(result.is_timeout)
+    self.assertIsNone(profile_stats)
+
+  def test_close_ends_phase_thread(self):
+    self.phase_executor.execute_phase(phase_two)
+    phase_thread = self.phase_executor._phase_worker
+    self.assertTrue(phase_thread.is_alive())
+    self.phase_executor.close()
+    phase_thread.join(1)
+    self.assertFalse(phase_thread.is_alive())
+
+  def test_phase_thread_is_not_daemon(self):
+    self.phase_executor.execute_phase(phase_two)
+    phase_thread = self.phase_executor._phase_worker
+    self.phase_executor.close()
+    self.assertFalse(phase_thread.daemon)
+
+  def test_phase_thread_created_by_daemon_thread_is_not_daemon(self):
+    phase_threads = []
+
+    def run_phase():
+      self.phase_executor.execute_phase(phase_two)
+      phase_threads.append(self.phase_executor._phase_worker)
+      self.phase_executor.close()
+
+    daemon_thread = threading.Thread(target=run_phase, daemon=True)
+    daemon_thread.start()
+    daemon_thread.join(5)
+    self.assertEqual(1, len(phase_threads))
+    self.assertFalse(phase_threads[0].daemon)
+
+  def test_stop_wakes_up_waiting_phase(self):
+    started = threading.Event()
+
+    @openhtf.PhaseOptions()
+    def busy_phase():
+      started.set()
+      end_time = time.monotonic() + 5
+      while time.monotonic() < end_time:
+        time.sleep(0.01)
+
+    def stop():
+      started.wait(1)
+      self.phase_executor.stop(timeout_s=1)
+
+    stop_thread = threading.Thread(target=stop)
+    stop_thread.start()
+    start_time = time.monotonic()
+    result, _ = self.phase_executor.execute_phase(busy_phase)
+    stop_thread.join()
+    self.assertTrue(result.is_aborted)
+    self.assertLess(time.monotonic() - start_time, 2)
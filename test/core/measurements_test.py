@@ -19,13 +19,20 @@ actually care about.
 """
 
 import collections
+import copy
+import pickle
+import threading
 import unittest
 from unittest import mock
 
 import openhtf as htf
 from openhtf.core import measurements
 from examples import all_the_things
+from openhtf.util import configuration
 from openhtf.util import test as htf_test
+from openhtf.util import validators
+
+CONF = configuration.CONF
 
 # Fields that are considered 'volatile' for record comparison.
 _VOLATILE_FIELDS = {
@@ -261,6 +268,52 @@ class TestMeasurement(htf_test.TestCase):
   def test_to_dataframe__no_units(self):
     self.test_to_dataframe(units=False)
 
+  def test_copy_declaration(self):
+    measurement = htf.Measurement('sweep_{band}').with_dimensions(
+        'hz').with_units('V').in_range(0, '{limit}').in_range(0, 5)
+    measurement.measured_value[1] = 2
+    copied = measurement.copy_declaration()
+    self.assertEqual('sweep_{band}', copied.name)
+    self.assertIs(measurement.units, copied.units)
+    self.assertIs(measurement.dimensions, copied.dimensions)
+    self.assertEqual(measurement.validators, copied.validators)
+    self.assertFalse(copied.measured_value.is_value_set)
+    self.assertEqual(measurements.Outcome.UNSET, copied.outcome)
+
+    copied.with_validator(bad_validator)
+    self.assertEqual(2, len(measurement.validators))
+
+  def test_copy_declaration_copies_stateful_validators(self):
+
+    class CountingValidator(validators.ValidatorBase):
+
+      def __init__(self):
+        self.calls = 0
+
+      def __call__(self, value):
+        self.calls += 1
+        return True
+
+    counting = CountingValidator()
+    pivot = validators.DimensionPivot(validators.in_range(0, 5))
+    measurement = htf.Measurement('current').with_dimensions(
+        'hz').with_validator(counting).with_validator(pivot)
+    copied = measurement.copy_declaration()
+    copied.measured_value[1] = 1
+    copied.validate()
+    self.assertEqual(1, copied.validators[0].calls)
+    self.assertEqual(0, counting.calls)
+    self.assertIs(pivot, copied.validators[1])
+
+  def test_with_args_shares_unformatted_validators(self):
+    measurement = htf.Measurement('sweep_{band}').in_range(
+        0, '{limit}').in_range(0, 5)
+    formatted = measurement.with_args(band='b1', limit=10)
+    self.assertEqual('sweep_b1', formatted.name)
+    self.assertIsNot(measurement.validators[0], formatted.validators[0])
+    self.assertEqual('10', formatted.validators[0].maximum)
+    self.assertIs(measurement.validators[1], formatted.validators[1])
+
   def test_bad_validator(self):
     measurement = htf.Measurement('bad_measure')
     measurement.with_dimensions('a')
@@ -362,3 +415,455 @@ class TestMeasurementDimensions(htf_test.TestCase):
     dimension_vals = ('dim val 1', 2, 3, 4)
     with self.assertRaises(measurements.InvalidDimensionsError):
       measurement.measured_value[dimension_vals] = 42
+
+
+class TestColumnarMeasuredValue(htf_test.TestCase):
+
+  def _make_measurement(self, *dimensions):
+    return htf.Measurement('columnar').with_dimensions(
+        *dimensions).with_columnar_storage()
+
+  def test_numeric_values_use_typed_columns(self):
+    measurement = self._make_measurement('freq')
+    for freq in range(10):
+      measurement.measured_value[freq] = freq * 0.5
+    value_dict = measurement.measured_value.value_dict
+    self.assertEqual('q', value_dict.coordinate_columns[0].typecode)
+    self.assertEqual('d', value_dict.value_column.typecode)
+    self.assertEqual([(f, f * 0.5) for f in range(10)],
+                     measurement.measured_value.value)
+
+  def test_increasing_coordinates_do_not_build_index(self):
+    measurement = self._make_measurement('t', 'channel')
+    for t in range(3):
+      for channel in range(2):
+        measurement.measured_value[t, channel] = t + channel
+    self.assertIsNone(measurement.measured_value.value_dict._index)
+    self.assertEqual(3, measurement.measured_value[2, 1])
+    self.assertIsNotNone(measurement.measured_value.value_dict._index)
+
+  def test_override_keeps_position(self):
+    measurement = self._make_measurement('freq')
+    for freq in (1, 2, 3):
+      measurement.measured_value[freq] = freq
+    measurement.measured_value[2] = 20
+    self.assertEqual([(1, 1), (2, 20), (3, 3)],
+                     measurement.measured_value.value)
+    self.assertEqual([(1, 1), (2, 20), (3, 3)],
+                     measurement.measured_value.basetype_value())
+
+  def test_mixed_types_are_preserved(self):
+    measurement = self._make_measurement('name')
+    measurement.measured_value['b'] = 1.5
+    measurement.measured_value['a'] = 'text'
+    measurement.measured_value['c'] = float('nan')
+    self.assertEqual([('b', 1.5), ('a', 'text'), ('c', 'nan')],
+                     measurement.measured_value.basetype_value())
+    self.assertIsNone(
+        measurement.measured_value.value_dict.value_column.typecode)
+
+  def test_int_and_float_values_share_float_column(self):
+    measurement = self._make_measurement('x')
+    measurement.measured_value[0] = 1
+    measurement.measured_value[1] = 2.5
+    value_column = measurement.measured_value.value_dict.value_column
+    self.assertEqual('d', value_column.typecode)
+    self.assertEqual([(0, 1.0), (1, 2.5)], measurement.measured_value.value)
+
+  def test_mutable_coordinates_error(self):
+    measurement = self._make_measurement('x')
+    with self.assertRaises(measurements.InvalidDimensionsError):
+      measurement.measured_value[['x']] = 1
+
+  def test_to_dataframe(self):
+    measurement = self._make_measurement('ms', 'zone').with_units('V')
+    for t in range(3):
+      for zone in range(2):
+        measurement.measured_value[t, zone] = t * zone
+    df = measurement.to_dataframe()
+    self.assertEqual(['ms', 'zone', 'volt'], list(df.columns))
+    self.assertEqual(2, df.query('(ms == 2) & (zone == 1)')['volt'].values[0])
+
+  def test_copy_and_immutable_view(self):
+    measurement = self._make_measurement('x')
+    measurement.measured_value[1] = 10
+    measurement_copy = copy.deepcopy(measurement)
+    measurement.measured_value[2] = 20
+    self.assertEqual([(1, 10)], measurement_copy.measured_value.value)
+    self.assertEqual({(1,): 10, (2,): 20}, dict(measurement.measured_value))
+
+  @htf_test.yields_phases
+  def test_columnar_measurement_in_phase(self):
+
+    @htf.measures(
+        htf.Measurement('sweep').with_dimensions('hz').with_columnar_storage()
+        .with_validator(lambda rows: all(row[-1] < 10 for row in rows)))
+    def sweep_phase(test):
+      for hz in range(5):
+        test.measurements.sweep[hz] = hz
+
+    record = yield sweep_phase
+    self.assertMeasured(record, 'sweep', [(hz, hz) for hz in range(5)])
+    self.assertMeasurementPass(record, 'sweep')
+
+
+class TestDimensionedMeasuredValueExtend(htf_test.TestCase):
+
+  def test_extend_sequences(self):
+    measurement = htf.Measurement('sweep').with_dimensions('hz', 'dbm')
+    measurement.measured_value.extend([(1, -10), (2, -20)], [0.5, 0.25])
+    self.assertEqual([(1, -10, 0.5), (2, -20, 0.25)],
+                     measurement.measured_value.value)
+    self.assertEqual([(1, -10, 0.5), (2, -20, 0.25)],
+                     measurement.measured_value.basetype_value())
+
+  def test_extend_single_dimension(self):
+    measurement = htf.Measurement('sweep').with_dimensions('hz')
+    measurement.measured_value.extend(range(3), ['a', 'b', 'c'])
+    self.assertEqual('b', measurement.measured_value[1])
+
+  def test_extend_numpy_arrays(self):
+    numpy = measurements.numpy
+    if numpy is None:
+      self.skipTest('numpy is not installed.')
+    for columnar in (False, True):
+      measurement = htf.Measurement('sweep').with_dimensions('hz', 'ch')
+      if columnar:
+        measurement.with_columnar_storage()
+      coordinates = numpy.array([[1, 0], [1, 1], [2, 0]])
+      measurement.measured_value.extend(coordinates, numpy.array([.5, 1, 2]))
+      self.assertEqual([(1, 0, .5), (1, 1, 1.), (2, 0, 2.)],
+                       measurement.measured_value.basetype_value())
+      self.assertIsInstance(measurement.measured_value.value[0][0], int)
+
+  def test_extend_columnar_copies_in_bulk(self):
+    numpy = measurements.numpy
+    if numpy is None:
+      self.skipTest('numpy is not installed.')
+    measurement = htf.Measurement('sweep').with_dimensions(
+        'hz').with_columnar_storage()
+    measurement.measured_value.extend(numpy.arange(1000), numpy.zeros(1000))
+    measurement.measured_value.extend(
+        numpy.arange(1000, 2000), numpy.ones(1000))
+    value_dict = measurement.measured_value.value_dict
+    self.assertIsNone(value_dict._index)
+    self.assertEqual('q', value_dict.coordinate_columns[0].typecode)
+    self.assertEqual(2000, len(value_dict))
+    self.assertEqual(1., measurement.measured_value[1500])
+
+  def test_extend_notifies_once(self):
+    notification_cb = mock.Mock()
+    measurement = htf.Measurement('sweep').with_dimensions('hz')
+    measurement.set_notification_callback(notification_cb)
+    measured_value = measurement.measured_value.with_notify(
+        measurement.notify_value_set)
+    measured_value.extend(range(100), range(100))
+    notification_cb.assert_called_once_with()
+    self.assertEqual(measurements.Outcome.PARTIALLY_SET, measurement.outcome)
+
+  def test_extend_overrides(self):
+    for columnar in (False, True):
+      measurement = htf.Measurement('sweep').with_dimensions('hz')
+      if columnar:
+        measurement.with_columnar_storage()
+      measurement.measured_value.extend([1, 2, 3], [1, 2, 3])
+      measurement.measured_value.basetype_value()
+      measurement.measured_value.extend([2, 4], [20, 40])
+      self.assertEqual([(1, 1), (2, 20), (3, 3), (4, 40)],
+                       measurement.measured_value.basetype_value())
+
+  def test_extend_applies_transform(self):
+    measurement = htf.Measurement('sweep').with_dimensions('hz').with_precision(
+        1)
+    measurement.measured_value.extend([1, 2], [1.26, 2.44])
+    self.assertEqual([(1, 1.3), (2, 2.4)], measurement.measured_value.value)
+
+  def test_extend_applies_vectorized_transform_once(self):
+    numpy = measurements.numpy
+    if numpy is None:
+      self.skipTest('numpy is not installed.')
+    transform = mock.Mock(side_effect=lambda values: values * 2)
+    measurement = htf.Measurement('sweep').with_dimensions('hz').with_transform(
+        transform, vectorized=True)
+    measurement.measured_value.extend(numpy.arange(3), numpy.arange(3))
+    transform.assert_called_once()
+    self.assertEqual([(0, 0), (1, 2), (2, 4)], measurement.measured_value.value)
+
+  def test_extend_bad_dimensions(self):
+    measurement = htf.Measurement('sweep').with_dimensions('hz', 'ch')
+    with self.assertRaises(measurements.InvalidDimensionsError):
+      measurement.measured_value.extend([(1, 2), (3,)], [1, 2])
+    with self.assertRaises(measurements.InvalidDimensionsError):
+      measurement.measured_value.extend([(1, 2)], [1, 2])
+    with self.assertRaises(measurements.InvalidDimensionsError):
+      measurement.measured_value.extend([([1], 2)], [1])
+    self.assertFalse(measurement.measured_value.is_value_set)
+
+
+class TestDimensionedMeasuredValueCache(htf_test.TestCase):
+
+  def _fill(self, columnar, num_points):
+    measurement = htf.Measurement('grid').with_dimensions('x', 'y')
+    if columnar:
+      measurement.with_columnar_storage()
+    measured_value = measurement.measured_value
+    for x in range(num_points):
+      measured_value[x, x % 3] = float(x)
+    measured_value.basetype_value()
+    return measured_value
+
+  def test_override_patches_cache(self):
+    for columnar in (False, True):
+      measured_value = self._fill(columnar, 10)
+      cache = measured_value.basetype_value()
+      measured_value[4, 1] = 40.
+      measured_value[10, 1] = 100.
+      self.assertIs(cache, measured_value.basetype_value())
+      expected = [(x, x % 3, float(x)) for x in range(10)] + [(10, 1, 100.)]
+      expected[4] = (4, 1, 40.)
+      self.assertEqual(expected,
+                       [tuple(row) for row in measured_value.basetype_value()])
+
+  def test_override_converts_constant_entries(self):
+    """Cost of an override does not grow with the number of points."""
+    for columnar in (False, True):
+      conversions = []
+      for num_points in (10, 1000):
+        measured_value = self._fill(columnar, num_points)
+        measured_value[5, 2] = 1.  # Builds the position index.
+        with mock.patch.object(
+            measurements.data, 'convert_to_base_types',
+            wraps=measurements.data.convert_to_base_types) as convert:
+          for _ in range(10):
+            measured_value[5, 2] = 2.
+        conversions.append(convert.call_count)
+      self.assertEqual(conversions[0], conversions[1])
+
+  def test_cache_holds_transformed_values(self):
+    measurement = htf.Measurement('sweep').with_dimensions('hz').with_precision(
+        1)
+    measured_value = measurement.measured_value
+    measured_value[1] = 1.26
+    measured_value[1] = 2.44
+    measured_value[2] = 3.33
+    self.assertEqual([(1, 2.4), (2, 3.3)], measured_value.basetype_value())
+
+  def test_column_type_change_invalidates_cache(self):
+    measurement = htf.Measurement('sweep').with_dimensions(
+        'hz').with_columnar_storage()
+    measured_value = measurement.measured_value
+    measured_value[1] = 1
+    measured_value[2] = 2
+    measured_value.basetype_value()
+    measured_value[1] = 'one'
+    self.assertEqual([(1, 'one'), (2, 2)], measured_value.basetype_value())
+
+  def test_set_while_building_cache(self):
+    measurement = htf.Measurement('sweep').with_dimensions(
+        'hz').with_columnar_storage()
+    measured_value = measurement.measured_value
+    measured_value[1] = 1.
+    basetype_rows = measurements._ColumnarValueDict.basetype_rows
+    writer = threading.Thread(target=measured_value.__setitem__, args=(2, 2.))
+
+    def build_rows(value_dict, *args, **kwargs):
+      rows = basetype_rows(value_dict, *args, **kwargs)
+      # Set a value while the cache is built from the rows read so far.
+      writer.start()
+      writer.join(0.1)
+      return rows
+
+    with mock.patch.object(measurements._ColumnarValueDict, 'basetype_rows',
+                           build_rows):
+      measured_value.basetype_value()
+    writer.join()
+    self.assertEqual([(1, 1.), (2, 2.)],
+                     [tuple(row) for row in measured_value.basetype_value()])
+
+  def test_update_takes_over_cache_built_by_reader(self):
+    measurement = htf.Measurement('sweep').with_dimensions(
+        'hz').with_columnar_storage()
+    measured_value = measurement.measured_value
+    measured_value[1] = 1.
+    cache = measured_value.basetype_value()
+    self.assertIs(cache, measured_value.basetype_value())
+    measured_value[2] = 2.
+    self.assertIs(cache, measured_value.basetype_value())
+    self.assertEqual([(1, 1.), (2, 2.)], [tuple(row) for row in cache])
+
+  def test_pickle(self):
+    measured_value = self._fill(False, 3)
+    unpickled = pickle.loads(pickle.dumps(measured_value))
+    self.assertEqual(measured_value, unpickled)
+    unpickled[3, 0] = 3.
+    self.assertEqual(4, len(unpickled.basetype_value()))
+
+
+class TestSpilledMeasuredValue(htf_test.TestCase):
+
+  def test_spills_above_point_threshold(self):
+    measured_value = measurements.DimensionedMeasuredValue(
+        'sweep', 2, spill_threshold=10)
+    for x in range(10):
+      measured_value[x, -x] = x / 2
+    self.assertFalse(measured_value.is_spilled)
+    measured_value[10, -10] = 5
+    self.assertTrue(measured_value.is_spilled)
+    measured_value.extend([(11, -11), (12, -12)], [5.5, 6.])
+    measured_value[3, -3] = 30.
+    expected = [(x, -x, x / 2) for x in range(13)]
+    expected[3] = (3, -3, 30.)
+    self.assertEqual(expected, measured_value.value)
+    self.assertEqual(
+        expected,
+        [coordinates + (value,) for coordinates, value in measured_value])
+    self.assertEqual(expected, measured_value.basetype_value())
+    self.assertEqual(30., measured_value[3, -3])
+
+  def test_spilled_column_changes_type(self):
+    measured_value = measurements.DimensionedMeasuredValue(
+        'sweep', 1, spill_threshold=2)
+    measured_value.extend(range(5), range(5))
+    self.assertTrue(measured_value.is_spilled)
+    measured_value[5] = 5.5
+    measured_value[6] = 'six'
+    self.assertEqual([(0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5.5),
+                      (6, 'six')], measured_value.value)
+
+  def test_spill_keeps_value_types(self):
+    measured_value = measurements.DimensionedMeasuredValue(
+        'sweep', 1, spill_threshold=5)
+    for x in range(5):
+      measured_value[x] = x
+    measured_value[2] = 2.5
+    measured_value[5] = 5
+    self.assertTrue(measured_value.is_spilled)
+    expected = [(0, 0), (1, 1), (2, 2.5), (3, 3), (4, 4), (5, 5)]
+    for values in (measured_value.value, measured_value.basetype_value()):
+      self.assertEqual(expected, [tuple(row) for row in values])
+      self.assertEqual([type(value) for _, value in expected],
+                       [type(row[-1]) for row in values])
+
+  def test_spilled_values_not_cached_as_base_types(self):
+    measurement = htf.Measurement('sweep').with_dimensions('hz')
+    measurement.measured_value.spill_threshold = 2
+    measurement.measured_value.extend(range(2), [0., 1.])
+    self.assertIn('measured_value', measurement.as_base_types())
+    measurement.measured_value[2] = 2.
+    self.assertTrue(measurement.measured_value.is_spilled)
+    self.assertEqual([[0, 0.], [1, 1.], [2, 2.]],
+                     [list(row) for row in
+                      measurement.as_base_types()['measured_value']])
+    self.assertNotIn('measured_value', measurement._cached)
+
+  def test_spilled_copy_is_in_memory(self):
+    measured_value = measurements.DimensionedMeasuredValue(
+        'sweep', 1, spill_threshold=2)
+    measured_value.extend(range(5), range(5))
+    value_dict = copy.deepcopy(measured_value.value_dict)
+    self.assertFalse(value_dict.is_spilled)
+    self.assertEqual(measured_value.value, value_dict.rows())
+
+  def test_spilled_to_dataframe(self):
+    if measurements.pandas is None:
+      self.skipTest('pandas is not installed.')
+    measured_value = measurements.DimensionedMeasuredValue(
+        'sweep', 1, spill_threshold=2)
+    measured_value.extend(range(5), [x * 1.5 for x in range(5)])
+    dataframe = measured_value.to_dataframe(columns=['x', 'y'])
+    self.assertEqual([0., 1.5, 3., 4.5, 6.], list(dataframe['y']))
+
+  @CONF.save_and_restore(measurement_spill_threshold_bytes=8 * 3 * 100)
+  @htf_test.yields_phases
+  def test_spills_from_phase(self):
+
+    @htf.measures(htf.Measurement('sweep').with_dimensions('hz', 'ch'))
+    def phase(test):
+      for point in range(150):
+        test.measurements.sweep[point, point % 4] = point * 0.5
+      self.assertTrue(test.measurements.sweep.is_spilled)
+
+    record = yield phase
+    self.assertPhaseContinue(record)
+    self.assertMeasurementPass(record, 'sweep')
+    self.assertEqual(
+        [(point, point % 4, point * 0.5) for point in range(150)],
+        record.measurements['sweep'].measured_value.value)
+
+
+class TestDimensionedMeasuredValueSummary(htf_test.TestCase):
+
+  def assertSummaryMatches(self, values, summary):
+    numbers = [v for v in values if not isinstance(v, str)]
+    mean = sum(numbers) / len(numbers)
+    self.assertAlmostEqual(mean, summary['mean'])
+    self.assertAlmostEqual(
+        sum((v - mean)**2 for v in numbers) / len(numbers),
+        summary['variance'])
+    self.assertEqual(min(numbers), summary['min'])
+    self.assertEqual(max(numbers), summary['max'])
+
+  def test_summary(self):
+    for columnar in (False, True):
+      measurement = htf.Measurement('sweep').with_dimensions('hz', 'ch')
+      if columnar:
+        measurement.with_columnar_storage()
+      measured_value = measurement.measured_value
+      measured_value[10, 'b'] = 3
+      measured_value[20, 'a'] = 1.5
+      measured_value[15, 'c'] = 'n/a'
+      measured_value[5, 'b'] = 7
+      summary = measured_value.summary
+      self.assertEqual(4, summary['count'])
+      self.assertEqual(7, summary['last'])
+      self.assertEqual([[5, 20], ['a', 'c']], summary['dimension_extents'])
+      self.assertSummaryMatches([3, 1.5, 7], summary)
+
+  def test_summary_after_override(self):
+    for columnar in (False, True):
+      measurement = htf.Measurement('sweep').with_dimensions('hz')
+      if columnar:
+        measurement.with_columnar_storage()
+      measured_value = measurement.measured_value
+      for hz in range(10):
+        measured_value[hz] = hz
+      measured_value[9] = 4.5
+      measured_value[0] = 2.5
+      summary = measured_value.summary
+      self.assertEqual(10, summary['count'])
+      self.assertSummaryMatches([2.5] + list(range(1, 9)) + [4.5], summary)
+
+  def test_summary_after_extend(self):
+    numpy = measurements.numpy
+    for columnar in (False, True):
+      measurement = htf.Measurement('sweep').with_dimensions('hz')
+      if columnar:
+        measurement.with_columnar_storage()
+      measured_value = measurement.measured_value
+      measured_value.extend([1, 2, 3], [1., 2., 3.])
+      if numpy is not None:
+        measured_value.extend(
+            numpy.array([4, 5, 2]), numpy.array([4., numpy.nan, 20.]))
+      else:
+        measured_value.extend([4, 5, 2], [4., float('nan'), 20.])
+      summary = measured_value.summary
+      self.assertEqual(5, summary['count'])
+      self.assertEqual([[1, 5]], summary['dimension_extents'])
+      self.assertSummaryMatches([1., 20., 3., 4.], summary)
+
+  def test_summary_of_copy(self):
+    measured_value = measurements.DimensionedMeasuredValue(
+        'sweep', 1, value_dict=collections.OrderedDict([((1,), 2), ((2,), 4)]))
+    self.assertEqual(2, measured_value.summary['count'])
+    self.assertEqual(3, measured_value.summary['mean'])
+
+  def test_as_base_types_summary_only(self):
+    measurement = htf.Measurement('sweep').with_dimensions('hz')
+    for hz in range(100):
+      measurement.measured_value[hz] = hz
+    self.assertIn('measured_value', measurement.as_base_types())
+    summary = measurement.as_base_types(summary_only=True)
+    self.assertNotIn('measured_value', summary)
+    self.assertEqual(100, summary['measured_value_summary']['count'])
+    self.assertEqual('sweep', summary['name'])
+    self.assertEqual(100, len(measurement.as_base_types()['measured_value']))
@@ -17,6 +17,7 @@ import time
 import unittest
 from unittest import mock
 
+import openhtf
 from openhtf import plugs
 from openhtf.core import base_plugs
 from openhtf.core import monitors
@@ -96,3 +97,24 @@ class TestMonitors(unittest.TestCase):
         first_meas[0], 100, msg='At time 0, there should be a call made.')
     self.assertEqual(
         2, first_meas[1], msg="And it should be the monitor func's return val")
+
+  def test_with_args(self):
+    q = queue.Queue()
+
+    def monitor(test, level=0):
+      del test  # Unused.
+      q.put(level)
+      return level
+
+    @openhtf.PhaseOptions()
+    def phase(test, level=0, unused=None):
+      del test, level, unused  # Unused.
+      while q.qsize() < 2:
+        time.sleep(0.1)
+
+    # The monitor gets the arguments of the phase that it takes.
+    monitored = monitors.monitors('meas', monitor, poll_interval_ms=100)(
+        phase.with_args(level=3, unused=1))
+    monitored(self.test_state)
+    _, first_meas, _ = self.test_state.mock_calls[0]
+    self.assertEqual(3, first_meas[1])
@@ -0,0 +1,167 @@
+# Copyright 2024 Google Inc. All Rights Reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the multi_slot module."""
+
+import threading
+import unittest
+
+import openhtf
+from openhtf import plugs
+from openhtf.core import base_plugs
+from openhtf.core import multi_slot
+from openhtf.core import test_record
+from openhtf.util import console_output
+
+
+class SlotPlug(base_plugs.BasePlug):
+
+  INSTANCES = []
+
+  def __init__(self):
+    super(SlotPlug, self).__init__()
+    type(self).INSTANCES.append(self)
+    self.torn_down = False
+
+  def tearDown(self):
+    self.torn_down = True
+
+
+class SharedPlug(SlotPlug):
+
+  INSTANCES = []
+
+
+class BlockingInitPlug(base_plugs.BasePlug):
+
+  BARRIER = None  # type: threading.Barrier
+
+  def __init__(self):
+    super(BlockingInitPlug, self).__init__()
+    # Every slot is instantiating this plug type at once past the barrier.
+    self.init_logger = self.logger
+    type(self).BARRIER.wait()
+
+
+_NUM_SLOTS = 3
+
+
+class MultiSlotRunnerTest(unittest.TestCase):
+
+  def setUp(self):
+    super(MultiSlotRunnerTest, self).setUp()
+    console_output.CLI_QUIET = True
+    SlotPlug.INSTANCES = []
+    SharedPlug.INSTANCES = []
+    # Every slot has to be running at once to get past the barrier.
+    self.barrier = threading.Barrier(_NUM_SLOTS, timeout=10)
+    self.records = []
+
+  def tearDown(self):
+    console_output.CLI_QUIET = False
+    super(MultiSlotRunnerTest, self).tearDown()
+
+  def _make_test(self, slot):
+
+    @plugs.plug(slot_plug=SlotPlug, shared_plug=SharedPlug)
+    @openhtf.measures('slot_plug_id', 'shared_plug_id')
+    def phase(test, slot_plug, shared_plug):
+      self.barrier.wait()
+      test.measurements.slot_plug_id = id(slot_plug)
+      test.measurements.shared_plug_id = id(shared_plug)
+      if test.test_record.metadata['slot'] == 2:
+        return openhtf.PhaseResult.STOP
+
+    test = openhtf.Test(phase)
+    test.configure(name='slot_%s' % slot)
+    test.add_output_callbacks(self.records.append)
+    return test
+
+  def test_execute(self):
+    with multi_slot.MultiSlotRunner(
+        self._make_test, _NUM_SLOTS, shared_plug_types=[SharedPlug]) as runner:
+      results = runner.execute(
+          test_start=[lambda slot=slot: 'dut_%s' % slot
+                      for slot in range(_NUM_SLOTS)])
+      self.assertEqual([True, True, False], results)
+      # Shared plugs outlive a round of tests.
+      self.assertEqual(1, len(SharedPlug.INSTANCES))
+      self.assertFalse(SharedPlug.INSTANCES[0].torn_down)
+    self.assertTrue(SharedPlug.INSTANCES[0].torn_down)
+
+    self.assertEqual(_NUM_SLOTS, len(SlotPlug.INSTANCES))
+    self.assertTrue(all(plug.torn_down for plug in SlotPlug.INSTANCES))
+
+    records = sorted(self.records, key=lambda record: record.metadata['slot'])
+    self.assertEqual(['dut_0', 'dut_1', 'dut_2'],
+                     [record.dut_id for record in records])
+    self.assertEqual(
+        [test_record.Outcome.PASS, test_record.Outcome.PASS,
+         test_record.Outcome.FAIL], [record.outcome for record in records])
+    shared_ids = {
+        record.phases[-1].measurements['shared_plug_id'].measured_value.value
+        for record in records
+    }
+    slot_ids = {
+        record.phases[-1].measurements['slot_plug_id'].measured_value.value
+        for record in records
+    }
+    self.assertEqual({id(SharedPlug.INSTANCES[0])}, shared_ids)
+    self.assertEqual({id(plug) for plug in SlotPlug.INSTANCES}, slot_ids)
+
+  def test_execute_again(self):
+    runner = multi_slot.MultiSlotRunner(
+        self._make_test, _NUM_SLOTS, shared_plug_types=[SharedPlug])
+    try:
+      runner.execute()
+      runner.execute()
+    finally:
+      runner.close()
+    self.assertEqual(1, len(SharedPlug.INSTANCES))
+    self.assertEqual(2 * _NUM_SLOTS, len(SlotPlug.INSTANCES))
+
+  def test_execute_same_plug_type_concurrently(self):
+    loggers = []
+
+    def make_test(slot):
+
+      @plugs.plug(blocking=BlockingInitPlug)
+      def phase(test, blocking):
+        del test  # Unused.
+        loggers.append((blocking.init_logger, blocking.logger))
+
+      test = openhtf.Test(phase)
+      test.configure(name='slot_%s' % slot)
+      return test
+
+    BlockingInitPlug.BARRIER = self.barrier
+    with multi_slot.MultiSlotRunner(make_test, _NUM_SLOTS) as runner:
+      self.assertEqual([True] * _NUM_SLOTS, runner.execute())
+    # Each slot logged from __init__ into the record of its own test.
+    self.assertEqual(_NUM_SLOTS, len({init for init, _ in loggers}))
+    for init_logger, logger in loggers:
+      self.assertIs(init_logger, logger)
+
+  def test_invalid_arguments(self):
+    with self.assertRaises(ValueError):
+      multi_slot.MultiSlotRunner(self._make_test, 0)
+    test = openhtf.Test()
+    with self.assertRaises(ValueError):
+      multi_slot.MultiSlotRunner(lambda slot: test, 2)
+    runner = multi_slot.MultiSlotRunner(self._make_test, _NUM_SLOTS)
+    with self.assertRaises(ValueError):
+      runner.execute(test_start=[None])
+
+
+if __name__ == '__main__':
+  unittest.main()
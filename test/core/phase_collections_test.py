@@ -14,6 +14,8 @@
 
 """Unit tests for the phase collections library."""
 
+import threading
+import time
 import unittest
 from unittest import mock
 
@@ -251,6 +253,158 @@ class PhaseSequenceIntegrationTest(htf_test.TestCase):
                                    'phase', 'empty_phase')
 
 
+class ActivePlug(base_plugs.BasePlug):
+  """Tracks how many phases use the plug type at the same time."""
+
+  active = 0
+  max_active = 0
+
+  def use(self):
+    cls = type(self)
+    cls.active += 1
+    cls.max_active = max(cls.max_active, cls.active)
+    time.sleep(0.05)
+    cls.active -= 1
+
+
+class OtherActivePlug(ActivePlug):
+  pass
+
+
+@plugs.plug(active=ActivePlug)
+def active_phase(active):
+  active.use()
+
+
+@plugs.plug(active=OtherActivePlug)
+def other_active_phase(active):
+  active.use()
+
+
+def _barrier_phases(*names, **kwargs):
+  """Returns phases that each wait until all of them are running."""
+  barrier = threading.Barrier(len(names), timeout=5)
+  result = kwargs.pop('result', None)
+
+  def barrier_phase():
+    barrier.wait()
+    return result
+
+  return [
+      phase_descriptor.PhaseOptions(name=name)(barrier_phase) for name in names
+  ]
+
+
+class ParallelSequenceTest(unittest.TestCase):
+
+  def test_has_disjoint_plugs(self):
+    seq = phase_collections.ParallelSequence(active_phase, other_active_phase,
+                                             phase)
+    self.assertTrue(seq.has_disjoint_plugs())
+
+  def test_has_disjoint_plugs__shared(self):
+    seq = phase_collections.ParallelSequence(
+        active_phase, phase_collections.PhaseSequence(phase, active_phase))
+    self.assertFalse(seq.has_disjoint_plugs())
+
+  def test_with_args(self):
+    seq = phase_collections.ParallelSequence(phase_with_args, name='{arg1}')
+    updated = seq.with_args(arg1=1)
+    self.assertIsInstance(updated, phase_collections.ParallelSequence)
+    self.assertEqual('1', updated.name)
+
+
+class ParallelSequenceIntegrationTest(htf_test.TestCase):
+
+  @htf_test.yields_phases
+  def test_runs_concurrently(self):
+    first, second = _barrier_phases('first', 'second')
+    seq = phase_collections.ParallelSequence(
+        phase_collections.PhaseSequence(first, phase), second)
+
+    test_rec = yield htf.Test(seq, empty_phase)
+
+    self.assertTestPass(test_rec)
+    # Records are in the order of the nodes, not in the order they finished.
+    self.assertEqual(['first', 'phase', 'second', 'empty_phase'],
+                     [phase_rec.name for phase_rec in test_rec.phases[1:]])
+
+  @htf_test.yields_phases
+  def test_shared_plugs_run_one_after_another(self):
+    ActivePlug.max_active = 0
+    seq = phase_collections.ParallelSequence(active_phase, active_phase)
+
+    test_rec = yield htf.Test(seq)
+
+    self.assertTestPass(test_rec)
+    self.assertEqual(2, len(test_rec.phases[1:]))
+    self.assertEqual(1, ActivePlug.max_active)
+
+  @htf_test.yields_phases
+  def test_stop(self):
+    stop, wait = _barrier_phases(
+        'stop', 'wait', result=phase_descriptor.PhaseResult.STOP)
+    seq = phase_collections.ParallelSequence(
+        stop, phase_collections.PhaseSequence(wait, phase))
+
+    test_rec = yield htf.Test(seq, empty_phase)
+
+    self.assertTestFail(test_rec)
+    self.assertEqual(['stop', 'wait'],
+                     [phase_rec.name for phase_rec in test_rec.phases[1:]])
+    self.assertPhasesNotRun(test_rec, 'phase', 'empty_phase')
+
+  @htf_test.yields_phases
+  def test_fail_subtest(self):
+    phase_started = threading.Event()
+
+    @phase_descriptor.PhaseOptions(name='fail_subtest_phase')
+    def wait_then_fail_subtest_phase():
+      # Fail the subtest only once the other node is past its skip check.
+      phase_started.wait(5)
+      return phase_descriptor.PhaseResult.FAIL_SUBTEST
+
+    @phase_descriptor.PhaseOptions(name='phase')
+    def started_phase():
+      phase_started.set()
+
+    subtest = phase_collections.Subtest(
+        'subtest',
+        phase_collections.ParallelSequence(wait_then_fail_subtest_phase,
+                                           started_phase), skip_phase)
+
+    test_rec = yield htf.Test(subtest, empty_phase)
+
+    self.assertTestFail(test_rec)
+    self.assertPhasesOutcomeByName(test_record.PhaseOutcome.FAIL, test_rec,
+                                   'fail_subtest_phase')
+    self.assertPhasesOutcomeByName(test_record.PhaseOutcome.PASS, test_rec,
+                                   'phase', 'empty_phase')
+    self.assertPhasesOutcomeByName(test_record.PhaseOutcome.SKIP, test_rec,
+                                   'skip_phase')
+    self.assertEqual(test_record.SubtestOutcome.FAIL,
+                     test_rec.subtests[0].outcome)
+
+  @htf_test.yields_phases
+  def test_repeat(self):
+    calls = []
+
+    @phase_descriptor.PhaseOptions(repeat_limit=3)
+    def repeat_phase():
+      calls.append(None)
+      if len(calls) < 2:
+        return phase_descriptor.PhaseResult.REPEAT
+
+    seq = phase_collections.ParallelSequence(repeat_phase, phase)
+
+    test_rec = yield htf.Test(seq)
+
+    self.assertTestPass(test_rec)
+    self.assertEqual(2, len(calls))
+    self.assertEqual(['repeat_phase', 'repeat_phase', 'phase'],
+                     [phase_rec.name for phase_rec in test_rec.phases[1:]])
+
+
 class SubtestTest(unittest.TestCase):
 
   def test_init__name(self):
@@ -14,10 +14,20 @@
 
 """Unit tests for test_record module."""
 
+import copy
+import logging
+import os
+import pickle
 import sys
+import tempfile
 import unittest
+from unittest import mock
 
 from openhtf.core import test_record
+from openhtf.util import configuration
+from openhtf.util import logs
+
+CONF = configuration.CONF
 
 
 def _get_obj_size(obj):
@@ -50,3 +60,162 @@ class TestRecordTest(unittest.TestCase):
     attachment = test_record.Attachment(large_data, 'text')
     obj_size = _get_obj_size(attachment)
     self.assertEqual(obj_size, expected_obj_size)
+
+  def test_attachment_view(self):
+    data = bytes(range(256)) * 10
+    attachment = test_record.Attachment(data, 'application/octet-stream')
+    view = test_record.AttachmentView(attachment)
+    self.assertEqual(attachment.sha1, view.sha1)
+    self.assertEqual(len(data), view.size)
+    self.assertEqual('application/octet-stream', view.mimetype)
+    with view.open() as f:
+      self.assertEqual(data, f.read())
+    with view.as_memoryview() as mapped:
+      self.assertTrue(mapped.readonly)
+      self.assertEqual(data[100:200], mapped[100:200].tobytes())
+    chunks = list(view.iter_chunks(1000))
+    self.assertEqual([1000, 1000, 560], [len(chunk) for chunk in chunks])
+    self.assertEqual(data, b''.join(chunks))
+
+  def test_attachment_view_empty(self):
+    view = test_record.AttachmentView(test_record.Attachment(b'', 'text'))
+    with view.as_memoryview() as mapped:
+      self.assertEqual(b'', mapped.tobytes())
+    self.assertEqual([], list(view.iter_chunks()))
+
+  def test_attachment_view_copy(self):
+    attachment = test_record.Attachment(b'test attachment data', 'text')
+    copied = test_record.AttachmentView(attachment).copy()
+    self.assertIsInstance(copied, test_record.Attachment)
+    attachment.close()
+    self.assertEqual(b'test attachment data', copied.data)
+
+  def test_identical_attachments_share_file(self):
+    first = test_record.Attachment(b'firmware image', 'application/octet-stream')
+    second = test_record.Attachment(b'firmware image', 'text')
+    other = test_record.Attachment(b'calibration table', 'text')
+    filename = first._filename
+    self.assertEqual(filename, second._filename)
+    self.assertNotEqual(filename, other._filename)
+    self.assertEqual(2, test_record._ATTACHMENT_STORE.refcount(filename))
+
+    first.close()
+    self.assertEqual(b'firmware image', second.data)
+    second.close()
+    self.assertFalse(os.path.exists(filename))
+    # New attachments with the same data get a new file.
+    third = test_record.Attachment(b'firmware image', 'text')
+    self.assertEqual(b'firmware image', third.data)
+
+  def test_attachment_copy_shares_file(self):
+    attachment = test_record.Attachment(b'test attachment data', 'text')
+    copied = copy.copy(attachment)
+    self.assertEqual(attachment._filename, copied._filename)
+    self.assertEqual(attachment._asdict(), copied._asdict())
+    attachment.close()
+    self.assertEqual(b'test attachment data', copied.data)
+
+  def test_attachment_from_file(self):
+    data = b'logic analyzer dump' * 1000
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+      f.write(data)
+    self.addCleanup(os.remove, f.name)
+    attachment = test_record.Attachment.from_file(f.name, 'text')
+    self.assertEqual(data, attachment.data)
+    self.assertEqual(len(data), attachment.size)
+    self.assertEqual(test_record.Attachment(data, 'text').sha1, attachment.sha1)
+    self.assertNotEqual(f.name, attachment._filename)
+    # The attachment does not change with the source file.
+    with open(f.name, 'ab') as source:
+      source.write(b'more')
+    self.assertEqual(data, attachment.data)
+
+  def test_attachment_from_file_move(self):
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+      f.write(b'moved data')
+    attachment = test_record.Attachment.from_file(f.name, 'text', move=True)
+    self.assertFalse(os.path.exists(f.name))
+    self.assertEqual(b'moved data', attachment.data)
+
+  def test_attachment_from_file_shares_identical_data(self):
+    attachment = test_record.Attachment(b'calibration table', 'text')
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+      f.write(b'calibration table')
+    from_file = test_record.Attachment.from_file(f.name, 'text', move=True)
+    self.assertEqual(attachment._filename, from_file._filename)
+
+  @CONF.save_and_restore
+  def test_attachment_from_missing_file(self):
+    directory = tempfile.mkdtemp()
+    self.addCleanup(os.rmdir, directory)
+    CONF.load(attachments_directory=directory)
+    with self.assertRaises(IOError):
+      test_record.Attachment.from_file(
+          os.path.join(directory, 'missing'), 'text')
+    self.assertEqual([], os.listdir(directory))
+
+
+  def test_snapshot_converts_mutable_metadata_only(self):
+    record = test_record.TestRecord(
+        'dut', 'station', metadata={'test_name': 'name', 'config': {}})
+    record.snapshot()
+    record.metadata['events'] = ['boot']
+    with mock.patch.object(
+        test_record.data, 'convert_to_base_types',
+        wraps=test_record.data.convert_to_base_types) as convert:
+      record.snapshot()
+      record.metadata['events'].append('flash')
+      snapshot = record.snapshot()
+    self.assertNotIn('name', [args[0] for args, _ in convert.call_args_list])
+    self.assertEqual({'test_name': 'name', 'events': ['boot', 'flash'],
+                      'config': {}}, snapshot['metadata'])
+
+
+def _log_record(index):
+  return logs.LogRecord(logging.INFO, 'openhtf.test', 'test.py', index,
+                        1000 + index, 'message %d' % index)
+
+
+class LogRecordStoreTest(unittest.TestCase):
+
+  def test_unlimited(self):
+    store = test_record.LogRecordStore(memory_limit=0)
+    records = [_log_record(i) for i in range(100)]
+    for record in records:
+      store.append(record)
+    self.assertFalse(store.is_spilled)
+    self.assertEqual(records, list(store))
+    self.assertEqual(100, store.num_recent)
+
+  def test_spills_oldest_records(self):
+    store = test_record.LogRecordStore(memory_limit=10)
+    records = [_log_record(i) for i in range(95)]
+    for record in records:
+      store.append(record)
+    self.assertTrue(store.is_spilled)
+    self.assertEqual(95, len(store))
+    self.assertEqual(15, store.num_recent)
+    self.assertEqual(records[80:], store.recent())
+    self.assertEqual(records, list(store))
+    # Names read back from the spill file are interned.
+    first = next(iter(store))
+    self.assertIs(sys.intern('openhtf.test'), first.logger_name)
+
+    filename = store._spill_filename
+    store.close()
+    self.assertFalse(os.path.exists(filename))
+
+  def test_pickle(self):
+    store = test_record.LogRecordStore(
+        [_log_record(i) for i in range(30)], memory_limit=10)
+    self.assertEqual(list(store), list(pickle.loads(pickle.dumps(store))))
+
+  def test_test_record_caches_recent_log_records(self):
+    record = test_record.TestRecord('dut', 'station')
+    record.log_records.memory_limit = 10
+    for i in range(25):
+      record.add_log_record(_log_record(i))
+    self.assertEqual([_log_record(i)._asdict() for i in range(10, 25)],
+                     record.as_base_types()['log_records'])
+    self.assertEqual([_log_record(i)._asdict() for i in range(25)],
+                     record.all_log_records_as_base_types())
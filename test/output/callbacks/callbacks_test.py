@@ -18,14 +18,17 @@ is sane. It might be worth expanding the tests to also check for things we
 actually care for.
 """
 
+import base64
 import io
 import json
 import unittest
+from unittest import mock
 
 import openhtf as htf
 from openhtf import util
 from examples import all_the_things
 from openhtf.core import phase_branches, phase_descriptor, phase_collections, phase_group
+from openhtf.core import test_record
 from openhtf.output.callbacks import console_summary
 from openhtf.output.callbacks import json_factory
 from openhtf.output.proto import mfg_event_converter
@@ -62,6 +65,35 @@ class TestOutput(test.TestCase):
     json_output.seek(0)
     json.loads(json_output.read())
 
+  def test_json_streams_attachment_data(self):
+    data = bytes(range(256)) * 10
+    attachment = test_record.Attachment(data, 'application/octet-stream')
+    try:
+      with mock.patch.object(json_factory, '_BASE64_CHUNK_SIZE', 300):
+        chunks = list(
+            json_factory.stream_json({'attachments': {'blob': attachment}}))
+    finally:
+      attachment.close()
+    encoded = base64.standard_b64encode(data).decode('utf-8')
+    self.assertLess(max(len(chunk) for chunk in chunks), len(encoded))
+    decoded = json.loads(''.join(chunks))['attachments']['blob']
+    self.assertEqual(encoded, decoded['data'])
+    self.assertEqual('application/octet-stream', decoded['mimetype'])
+
+  @htf.conf.save_and_restore(log_records_memory_limit=2)
+  @test.patch_plugs(user_mock='openhtf.plugs.user_input.UserInput')
+  def test_json_includes_spilled_log_records(self, user_mock):
+    user_mock.prompt.return_value = 'SomeWidget'
+    record = yield self._test
+    self.assertTrue(record.log_records.is_spilled)
+    json_output = io.BytesIO()
+    json_factory.OutputToJSON(json_output)(record)
+    json_output.seek(0)
+    self.assertEqual(
+        [log_record.message for log_record in record.log_records],
+        [log_record['message']
+         for log_record in json.loads(json_output.read())['log_records']])
+
   @test.patch_plugs(user_mock='openhtf.plugs.user_input.UserInput')
   def test_test_run_from_test_record(self, user_mock):
     user_mock.prompt.return_value = 'SomeWidget'
@@ -201,3 +233,28 @@ class TestConsoleSummary(test.TestCase):
     test_instance.execute()
     assert not any('Traceback' in record.message
                    for record in result_store.result.log_records)
+
+  def _failed_sweep_output(self, **kwargs):
+    @htf.measures(
+        htf.Measurement('sweep').with_dimensions('x').in_range(maximum=0))
+    def sweep_phase(test):
+      for x in range(3):
+        test.measurements.sweep[x] = x + 1
+
+    output = io.StringIO()
+    test_instance = htf.Test(sweep_phase)
+    test_instance.add_output_callbacks(
+        console_summary.ConsoleSummary(output_stream=output, **kwargs))
+    test_instance.execute()
+    return output.getvalue()
+
+  def test_small_dimensioned_measurement_prints_values(self):
+    output = self._failed_sweep_output()
+    self.assertIn('measured_value: [(0, 1), (1, 2), (2, 3)]', output)
+    self.assertNotIn('measured_value_summary', output)
+
+  def test_large_dimensioned_measurement_prints_summary(self):
+    output = self._failed_sweep_output(summary_threshold_points=2)
+    self.assertIn('measured_value_summary:', output)
+    self.assertIn("'count': 3", output)
+    self.assertNotIn('measured_value: ', output)
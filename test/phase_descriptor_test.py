@@ -181,6 +181,36 @@ class TestPhaseDescriptor(htf_test.TestCase):
     updated = phase.with_args(arg_does_not_exist=1)
     self.assertEqual({'arg_does_not_exist': 1}, updated.extra_kwargs)
 
+  def test_call_plan(self):
+
+    def phase(test_api, arg_one, arg_two=2, **kwargs):
+      del test_api, arg_one, arg_two, kwargs  # Unused.
+
+    call_plan = phase_descriptor.CallPlan.for_function(phase)
+    self.assertEqual(('test_api', 'arg_one', 'arg_two'), call_plan.arg_names)
+    self.assertEqual({'arg_two': 2}, call_plan.defaults)
+    self.assertTrue(call_plan.always_pass_test)
+    self.assertTrue(call_plan.accepts('anything'))
+    # Built once per function.
+    self.assertIs(call_plan, phase_descriptor.CallPlan.for_function(phase))
+
+    plain_plan = phase_descriptor.CallPlan.for_function(extra_arg_func.func)
+    self.assertFalse(plain_plan.always_pass_test)
+    self.assertTrue(plain_plan.accepts('input_value'))
+    self.assertFalse(plain_plan.accepts('anything'))
+
+  def test_call_plan_uncacheable_callable(self):
+
+    class Phase(object):
+      __slots__ = ()
+      __hash__ = None
+
+      def __call__(self, state):
+        return state
+
+    phase = openhtf.PhaseDescriptor.wrap_or_copy(Phase(), requires_state=True)
+    self.assertIs(self._test_state, phase(self._test_state))
+
   def test_call_test_api_with_default_args(self):
     expected_arg_two = 3
 
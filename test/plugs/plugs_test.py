@@ -18,6 +18,7 @@ import unittest
 
 from openhtf import plugs
 from openhtf.core import base_plugs
+from openhtf.util import configuration
 from openhtf.util import test
 
 
@@ -69,6 +70,75 @@ class TearDownRaisesPlug2(base_plugs.BasePlug):
     raise Exception()
 
 
+class SlowPlug(base_plugs.BasePlug):
+  """Records the order in which its subclasses are set up and torn down."""
+
+  EVENTS = []
+  INIT_S = 0.3
+  TEAR_DOWN_S = 0.3
+
+  def __init__(self):
+    super(SlowPlug, self).__init__()
+    time.sleep(self.INIT_S)
+    SlowPlug.EVENTS.append(type(self).__name__)
+
+  def tearDown(self):
+    time.sleep(self.TEAR_DOWN_S)
+    SlowPlug.EVENTS.append('~' + type(self).__name__)
+
+
+class SlowBusPlug(SlowPlug):
+  pass
+
+
+class SlowDmmPlug(SlowPlug):
+  requires = (SlowBusPlug,)
+
+
+class SlowScopePlug(SlowPlug):
+  pass
+
+
+class FailingPlug(base_plugs.BasePlug):
+
+  def __init__(self):
+    super(FailingPlug, self).__init__()
+    raise ValueError('Cannot connect')
+
+
+class StationPlug(base_plugs.BasePlug):
+
+  scope = base_plugs.PlugScope.STATION
+  INSTANCES = []
+
+  def __init__(self):
+    super(StationPlug, self).__init__()
+    type(self).INSTANCES.append(self)
+    self.healthy = True
+    self.resets = 0
+    self.torn_down = False
+
+  def is_healthy(self):
+    return self.healthy
+
+  def reset(self):
+    self.resets += 1
+
+  def tearDown(self):  # pylint: disable=g-missing-super-call
+    self.torn_down = True
+
+
+class CyclicPlug1(base_plugs.BasePlug):
+  pass
+
+
+class CyclicPlug2(base_plugs.BasePlug):
+  requires = (CyclicPlug1,)
+
+
+CyclicPlug1.requires = (CyclicPlug2,)
+
+
 class PlugsTest(test.TestCase):
 
   def setUp(self):
@@ -156,6 +226,160 @@ class PlugsTest(test.TestCase):
     self.assertTrue(TearDownRaisesPlug1.TORN_DOWN)
     self.assertTrue(TearDownRaisesPlug2.TORN_DOWN)
 
+  @configuration.CONF.save_and_restore(plug_init_max_workers=8)
+  def test_initialize_concurrently(self):
+    SlowPlug.EVENTS = []
+    start_time = time.time()
+    self.plug_manager.initialize_plugs({SlowBusPlug, SlowScopePlug})
+    self.assertLess(time.time() - start_time, 2 * SlowPlug.INIT_S)
+    self.assertCountEqual(['SlowBusPlug', 'SlowScopePlug'], SlowPlug.EVENTS)
+    for plug_type in (SlowBusPlug, SlowScopePlug):
+      self.assertGreaterEqual(
+          self.plug_manager.init_durations_s[self.plug_manager.get_plug_name(
+              plug_type)], SlowPlug.INIT_S)
+
+  def test_initialize_sequentially(self):
+    SlowPlug.EVENTS = []
+    start_time = time.time()
+    self.plug_manager.initialize_plugs({SlowBusPlug, SlowScopePlug})
+    self.assertGreaterEqual(time.time() - start_time, 2 * SlowPlug.INIT_S)
+    self.assertCountEqual(['SlowBusPlug', 'SlowScopePlug'], SlowPlug.EVENTS)
+
+  def test_initialize_in_calling_thread_by_default(self):
+
+    class ThreadPlug(base_plugs.BasePlug):
+
+      def __init__(self):
+        self.init_thread = threading.current_thread()
+
+    self.plug_manager.initialize_plugs({ThreadPlug, AdderPlug})
+    plug = self.plug_manager.provide_plugs((('plug', ThreadPlug),))['plug']
+    self.assertIs(threading.current_thread(), plug.init_thread)
+
+  def test_initialize_required_plugs_first(self):
+    SlowPlug.EVENTS = []
+    self.plug_manager.initialize_plugs({SlowDmmPlug, SlowScopePlug})
+    self.assertLess(
+        SlowPlug.EVENTS.index('SlowBusPlug'),
+        SlowPlug.EVENTS.index('SlowDmmPlug'))
+    self.assertIsInstance(
+        self.plug_manager.provide_plugs((('bus', SlowBusPlug),))['bus'],
+        SlowBusPlug)
+
+  def test_initialize_fails(self):
+    with self.assertRaises(ValueError):
+      self.plug_manager.initialize_plugs({AdderPlug, FailingPlug})
+    # Plugs that were instantiated are torn down.
+    if AdderPlug.INSTANCE_COUNT:
+      self.assertEqual('TORN DOWN', AdderPlug.LAST_INSTANCE.state)
+    self.assertIsNone(
+        self.plug_manager.get_plug_by_class_path(
+            self.plug_manager.get_plug_name(AdderPlug)))
+
+  def test_initialize_cyclic_requirements(self):
+    with self.assertRaises(base_plugs.InvalidPlugError):
+      self.plug_manager.initialize_plugs({CyclicPlug1, AdderPlug})
+    self.assertEqual('TORN DOWN', AdderPlug.LAST_INSTANCE.state)
+
+  def test_tear_down_concurrently(self):
+    self.plug_manager.initialize_plugs({SlowBusPlug, SlowScopePlug})
+    SlowPlug.EVENTS = []
+    start_time = time.time()
+    self.plug_manager.tear_down_plugs()
+    self.assertLess(time.time() - start_time, 2 * SlowPlug.TEAR_DOWN_S)
+    self.assertCountEqual(['~SlowBusPlug', '~SlowScopePlug'], SlowPlug.EVENTS)
+    for plug_type in (SlowBusPlug, SlowScopePlug):
+      self.assertGreaterEqual(
+          self.plug_manager.tear_down_durations_s[
+              self.plug_manager.get_plug_name(plug_type)], SlowPlug.TEAR_DOWN_S)
+
+  def test_tear_down_required_plugs_last(self):
+    self.plug_manager.initialize_plugs({SlowDmmPlug})
+    SlowPlug.EVENTS = []
+    self.plug_manager.tear_down_plugs()
+    self.assertEqual(['~SlowDmmPlug', '~SlowBusPlug'], SlowPlug.EVENTS)
+
+  @configuration.CONF.save_and_restore(plug_teardown_timeout_s=0.5)
+  def test_tear_down_shared_deadline(self):
+    hanging = threading.Event()
+    self.addCleanup(hanging.set)
+
+    class HangingPlug1(base_plugs.BasePlug):
+
+      def tearDown(self):
+        hanging.wait()
+
+    class HangingPlug2(HangingPlug1):
+      pass
+
+    class HangingPlug3(HangingPlug1):
+      pass
+
+    self.plug_manager.initialize_plugs(
+        {HangingPlug1, HangingPlug2, HangingPlug3})
+    start_time = time.time()
+    self.plug_manager.tear_down_plugs()
+    # Joining each plug in turn would take 1.5 s.
+    self.assertLess(time.time() - start_time, 1.0)
+
+  def test_station_plugs(self):
+    StationPlug.INSTANCES = []
+    self.addCleanup(plugs.tear_down_station_plugs)
+    for _ in range(3):
+      plug_manager = plugs.PlugManager({StationPlug, AdderPlug})
+      plug_manager.initialize_plugs()
+      plug_manager.tear_down_plugs()
+    self.assertEqual(3, AdderPlug.INSTANCE_COUNT)
+    self.assertEqual(1, len(StationPlug.INSTANCES))
+    station_plug = StationPlug.INSTANCES[0]
+    self.assertEqual(2, station_plug.resets)
+    self.assertFalse(station_plug.torn_down)
+
+    plugs.tear_down_station_plugs()
+    self.assertTrue(station_plug.torn_down)
+    self.plug_manager.initialize_plugs({StationPlug})
+    self.assertEqual(2, len(StationPlug.INSTANCES))
+
+  def test_station_plugs_unhealthy(self):
+    StationPlug.INSTANCES = []
+    self.addCleanup(plugs.tear_down_station_plugs)
+    self.plug_manager.initialize_plugs({StationPlug})
+    self.plug_manager.tear_down_plugs()
+    StationPlug.INSTANCES[0].healthy = False
+    self.plug_manager.initialize_plugs({StationPlug})
+    self.assertEqual(2, len(StationPlug.INSTANCES))
+    self.assertTrue(StationPlug.INSTANCES[0].torn_down)
+    self.assertEqual(0, StationPlug.INSTANCES[0].resets)
+    self.assertIs(
+        StationPlug.INSTANCES[1],
+        self.plug_manager.provide_plugs((('station', StationPlug),))['station'])
+
+  def test_station_plugs_in_use(self):
+    StationPlug.INSTANCES = []
+    self.addCleanup(plugs.tear_down_station_plugs)
+    other_plug_manager = plugs.PlugManager({StationPlug})
+    other_plug_manager.initialize_plugs()
+    self.plug_manager.initialize_plugs({StationPlug})
+    # Shared while in use, without a reset.
+    self.assertEqual(1, len(StationPlug.INSTANCES))
+    self.assertEqual(0, StationPlug.INSTANCES[0].resets)
+    plugs.tear_down_station_plugs()
+    self.assertFalse(StationPlug.INSTANCES[0].torn_down)
+    other_plug_manager.tear_down_plugs()
+
+  def test_shared_plugs(self):
+    shared = AdderPlug()
+    plug_manager = plugs.PlugManager({AdderPlug, DummyPlug},
+                                     shared_plugs={AdderPlug: shared})
+    plug_manager.initialize_plugs()
+    self.assertEqual(1, AdderPlug.INSTANCE_COUNT)
+    self.assertIs(
+        shared,
+        plug_manager.provide_plugs((('adder_plug', AdderPlug),))['adder_plug'])
+    plug_manager.tear_down_plugs()
+    # Shared plugs are torn down by their owner.
+    self.assertEqual('CREATED', shared.state)
+
   def test_plug_updates(self):
     self.plug_manager.initialize_plugs({AdderPlug})
     adder_plug_name = AdderPlug.__module__ + '.AdderPlug'
@@ -13,9 +13,13 @@
 # limitations under the License.
 
 import copy
+import functools
+import json
 import logging
+import os
 import sys
 import tempfile
+import threading
 import unittest
 from unittest import mock
 
@@ -28,6 +32,7 @@ from openhtf.core import test_descriptor
 from openhtf.core import test_record
 from openhtf.core import test_state
 from openhtf.util import configuration
+from openhtf.util import data
 from openhtf.util import threads
 
 CONF = configuration.CONF
@@ -138,6 +143,10 @@ class TestTestApi(parameterized.TestCase):
 
     self.assertEqual(input_contents, output_attachment.data)
     self.assertEqual(mimetype, output_attachment.mimetype)
+    self.assertIsInstance(output_attachment, test_record.AttachmentView)
+    self.assertEqual(
+        self.running_phase_state.attachments[attachment_name].sha1,
+        output_attachment.sha1)
 
   def test_get_attachment_strict(self):
     attachment_name = 'attachment.txt'
@@ -173,6 +182,27 @@ class TestTestApi(parameterized.TestCase):
     measurement.value.append(4)
     self.assertNotEqual(measurement_val, measurement.value)
 
+  def _run_phase(self, value, result=openhtf.PhaseResult.CONTINUE):
+    with self.test_state.running_phase_context(test_phase) as phase_state:
+      phase_state.measurements['test_measurement'].measured_value.set(value)
+      phase_state.result = phase_executor.PhaseExecutionOutcome(result)
+
+  def test_get_measurement_from_previous_phases(self):
+    self.test_state.running_phase_state = None
+    self._run_phase(1)
+    self._run_phase(2)
+    measurement = self.test_state.get_measurement('test_measurement')
+    self.assertEqual(2, measurement.value)
+    self.assertEqual(2, len(self.test_record.phases))
+
+  def test_get_measurement_ignores_skipped_phases(self):
+    self.test_state.running_phase_state = None
+    self._run_phase(1)
+    self._run_phase(2, openhtf.PhaseResult.SKIP)
+    self._run_phase(3, openhtf.PhaseResult.REPEAT)
+    self.assertEqual(
+        1, self.test_state.get_measurement('test_measurement').value)
+
   def test_infer_mime_type_from_file_name(self):
     with tempfile.NamedTemporaryFile(suffix='.txt') as f:
       f.write(b'Mock text contents.')
@@ -197,6 +227,15 @@ class TestTestApi(parameterized.TestCase):
       self.fail('attachment not found.')
     self.assertEqual(attachment.mimetype, 'image/png')
 
+  def test_attach_from_file_move(self):
+    with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
+      f.write(b'Mock text contents.')
+    self.test_api.attach_from_file(f.name, 'attachment', move=True)
+    self.assertFalse(os.path.exists(f.name))
+    attachment = self.test_api.get_attachment('attachment')
+    self.assertEqual(b'Mock text contents.', attachment.data)
+    self.assertEqual('text/plain', attachment.mimetype)
+
   def test_phase_state_cache(self):
     basetypes = self.running_phase_state.as_base_types()
     expected_initial_basetypes = copy.deepcopy(PHASE_STATE_BASE_TYPE_INITIAL)
@@ -215,6 +254,73 @@ class TestTestApi(parameterized.TestCase):
     self.assertEqual(expected_after_basetypes, basetypes)
     self.assertFalse(self.running_phase_state._update_measurements)
 
+  def test_phase_state_snapshot(self):
+    snapshot = self.running_phase_state.snapshot()
+    self.assertEqual(self.running_phase_state.as_base_types(), snapshot)
+    self.test_api.measurements.test_measurement = 5
+    self.test_api.attach('attachment.txt', b'data')
+    # Earlier snapshots are not modified by updates.
+    self.assertNotIn('measured_value',
+                     snapshot['measurements']['test_measurement'])
+    self.assertEqual({}, snapshot['attachments'])
+
+    snapshot2 = self.running_phase_state.snapshot()
+    self.assertEqual(5, snapshot2['measurements']['test_measurement'][
+        'measured_value'])
+    self.assertIn('attachment.txt', snapshot2['attachments'])
+    # Unchanged measurements are shared between snapshots.
+    self.assertIs(snapshot2['measurements']['test_measurement'],
+                  self.running_phase_state.snapshot()['measurements'][
+                      'test_measurement'])
+
+  def test_test_state_snapshot_while_updating(self):
+    dimensioned = openhtf.Measurement('sweep').with_dimensions('x')
+    self.running_phase_state.measurements['sweep'] = dimensioned
+    dimensioned.set_notification_callback(
+        functools.partial(self.running_phase_state._notify, 'sweep'))
+    measured_value = dimensioned.measured_value.with_notify(
+        dimensioned.notify_value_set)
+    done = threading.Event()
+
+    def update():
+      for x in range(2000):
+        measured_value[x] = x
+        self.test_state.state_logger.debug('Set %d', x)
+      done.set()
+
+    thread = threading.Thread(target=update)
+    thread.start()
+    while not done.is_set():
+      snapshot, _ = self.test_state.asdict_with_event()
+      json.dumps(data.convert_to_base_types(snapshot))
+    thread.join()
+    snapshot = self.test_state.snapshot()
+    self.assertEqual(
+        2000,
+        len(snapshot['running_phase_state']['measurements']['sweep'][
+            'measured_value']))
+
+  def test_memory_usage(self):
+    self.test_api.measurements.test_measurement = list(range(1000))
+    self.test_api.attach('first.txt', b'x' * 1000)
+    self.test_api.attach('second.txt', b'x' * 1000)
+    usage = self.test_state.memory_usage()
+    self.assertEqual(['test_phase'],
+                     [phase['name'] for phase in usage['phases']])
+    self.assertGreater(usage['phases'][0]['measurement_bytes'], 8000)
+    self.assertEqual(2, usage['attachments']['count'])
+    # Identical attachments share their file.
+    self.assertEqual(1000, usage['attachments']['bytes_on_disk'])
+    self.assertEqual(0, usage['log_records']['spilled'])
+    self.assertGreaterEqual(usage['total_bytes_in_memory'],
+                            usage['phases'][0]['measurement_bytes'])
+
+  @CONF.save_and_restore(record_memory_usage=True)
+  def test_memory_usage_saved_in_metadata(self):
+    self.test_state.finalize_normally()
+    self.assertIn('memory_usage', self.test_record.metadata)
+    self.assertIn('log_records', self.test_record.metadata['memory_usage'])
+
   def test_test_state_cache(self):
     basetypes = self.test_state.as_base_types()
     # The descriptor id is not static, so grab it.
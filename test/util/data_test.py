@@ -93,3 +93,22 @@ class TestData(unittest.TestCase):
 
     self.assertEqual(converted['frozen1'], {'value': 42})
     self.assertEqual(converted['another_attr'], {'frozen': {'value': 19}})
+
+  def test_total_size(self):
+    self.assertGreater(data.total_size([b'x' * 1000]), 1000)
+    self.assertEqual(
+        data.total_size({'a': [1, 2]}, None), data.total_size({'a': [1, 2]}))
+
+    @attr.s(slots=True)
+    class Holder(object):
+      payload = attr.ib()
+
+    self.assertGreater(data.total_size(Holder(b'x' * 1000)), 1000)
+    # Classes and functions are shared with code, not owned by the object.
+    self.assertLess(data.total_size([Holder, data.total_size]), 200)
+
+  def test_total_size_samples_large_containers(self):
+    values = [str(i) * 10 for i in range(100000)]
+    exact = data.total_size(values, max_samples=None)
+    estimate = data.total_size(values)
+    self.assertAlmostEqual(1.0, estimate / exact, delta=0.05)
@@ -0,0 +1,68 @@
+# Copyright 2024 Google Inc. All Rights Reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import unittest
+
+from openhtf.util import decimation
+
+
+class DecimationTest(unittest.TestCase):
+
+  def setUp(self):
+    super(DecimationTest, self).setUp()
+    self.sine = [(x, math.sin(x / 100)) for x in range(10000)]
+
+  def test_small_input_unchanged(self):
+    rows = self.sine[:10]
+    for method in (decimation.LTTB, decimation.MIN_MAX):
+      self.assertEqual(rows, decimation.decimate(rows, 10, method))
+
+  def test_lttb(self):
+    sampled = decimation.lttb(self.sine, 100)
+    self.assertEqual(100, len(sampled))
+    self.assertEqual(self.sine[0], sampled[0])
+    self.assertEqual(self.sine[-1], sampled[-1])
+    self.assertEqual(sorted(sampled), sampled)
+    # Peaks of the sine wave are kept.
+    self.assertGreater(max(row[1] for row in sampled), 0.999)
+    self.assertLess(min(row[1] for row in sampled), -0.999)
+
+  def test_lttb_keeps_spike(self):
+    rows = [(x, 0) for x in range(1000)]
+    rows[567] = (567, 100)
+    self.assertIn((567, 100), decimation.lttb(rows, 20))
+
+  def test_min_max(self):
+    rows = [(x, x % 7, x % 10) for x in range(1000)]
+    rows[123] = (123, 4, -50)
+    sampled = decimation.min_max(rows, 50)
+    self.assertLessEqual(len(sampled), 50)
+    self.assertIn((123, 4, -50), sampled)
+    self.assertEqual(sorted(sampled), sampled)
+
+  def test_min_max_non_numeric(self):
+    rows = [(x, 'n/a') for x in range(100)]
+    sampled = decimation.min_max(rows, 10)
+    self.assertLessEqual(len(sampled), 10)
+    self.assertEqual((0, 'n/a'), sampled[0])
+
+  def test_decimate_falls_back_to_min_max(self):
+    rows = [(x, x % 3, float(x)) for x in range(1000)]
+    self.assertEqual(
+        decimation.min_max(rows, 10), decimation.decimate(rows, 10))
+
+  def test_decimate_unknown_method(self):
+    with self.assertRaises(ValueError):
+      decimation.decimate(self.sine, 10, 'every_other')
@@ -79,3 +79,54 @@ class TestUtil(unittest.TestCase):
     empty_string = ''
     self.assertEqual('', util.partial_format(empty_string))
     self.assertEqual('', util.partial_format(empty_string, foo='bar'))
+
+
+class _State(util.SubscribableStateMixin):
+
+  def _asdict(self):
+    return {}
+
+
+class TestSubscribableStateMixin(unittest.TestCase):
+
+  def test_notifies_every_update_by_default(self):
+    state = _State()
+    for _ in range(3):
+      _, event = state.asdict_with_event()
+      state.notify_update()
+      self.assertTrue(event.is_set())
+    self.assertEqual(3, state.notifications_delivered)
+    self.assertEqual(0, state.notifications_suppressed)
+
+  def test_coalesces_updates_within_interval(self):
+    state = _State(min_notify_interval_s=0.2)
+    _, first_event = state.asdict_with_event()
+    state.notify_update()
+    self.assertTrue(first_event.is_set())
+
+    _, event = state.asdict_with_event()
+    for _ in range(100):
+      state.notify_update()
+    self.assertFalse(event.is_set())
+    self.assertEqual(100, state.notifications_suppressed)
+
+    # The coalesced updates are delivered once the interval has elapsed.
+    self.assertTrue(event.wait(5))
+    self.assertEqual(2, state.notifications_delivered)
+
+  def test_first_update_delivered_early_in_clock(self):
+    state = _State(min_notify_interval_s=60)
+    _, event = state.asdict_with_event()
+    with mock.patch.object(util.time, 'monotonic', return_value=1.0):
+      state.notify_update()
+    self.assertTrue(event.is_set())
+    self.assertEqual(0, state.notifications_suppressed)
+
+  def test_interval_can_be_changed(self):
+    state = _State(min_notify_interval_s=60)
+    state.notify_update()
+    state.min_notify_interval_s = 0
+    _, event = state.asdict_with_event()
+    state.notify_update()
+    self.assertTrue(event.is_set())
+    self.assertEqual(2, state.notifications_delivered)
@@ -16,8 +16,10 @@
 import copy
 import decimal
 import unittest
+from unittest import mock
 
 import openhtf as htf
+from openhtf.core import measurements
 from openhtf.util import test as htf_test
 from openhtf.util import validators
 
@@ -395,3 +397,123 @@ class ConsistentEndDimensionPivotTest(htf_test.TestCase):
 
     phase_record = yield phase
     self.assertMeasurementFail(phase_record, 'pivot')
+
+
+@unittest.skipIf(validators.numpy is None, 'numpy is not installed.')
+class ValidateArrayTest(unittest.TestCase):
+  """Tests that the array protocol matches calling the validators."""
+
+  def setUp(self):
+    super(ValidateArrayTest, self).setUp()
+    numpy = validators.numpy
+    self.arrays = [
+        numpy.array([], dtype=float),
+        numpy.array([1., 2., 3.]),
+        numpy.array([0, 5, 10]),
+        numpy.array([-1., 5.]),
+        numpy.array([5., float('nan')]),
+        numpy.array([2., 9.5, 11.]),
+        numpy.array([11, 1, 2, 3]),
+    ]
+
+  def _rows(self, values):
+    return [(index, value) for index, value in enumerate(values.tolist())]
+
+  def test_all_in_range(self):
+    validator = validators.AllInRangeValidator(
+        0, 10, marginal_minimum=1, marginal_maximum=9)
+    for values in self.arrays:
+      self.assertEqual(
+          validator(values.tolist()), validator.validate_array(values), values)
+      self.assertEqual(
+          validator.is_marginal(values.tolist()),
+          validator.is_marginal_array(values), values)
+
+  def test_all_equals(self):
+    validator = validators.AllEqualsValidator(5)
+    for values in self.arrays + [validators.numpy.array([5, 5])]:
+      self.assertEqual(
+          validator(values.tolist()), validator.validate_array(values), values)
+
+  def test_dimension_pivot(self):
+    sub_validators = [
+        validators.in_range(0, 10),
+        validators.in_range(minimum=2),
+        validators.Equals(5),
+        validators.WithinPercent(5, 50),
+    ]
+    for sub_validator in sub_validators:
+      for pivot_type in (validators.DimensionPivot,
+                         validators.ConsistentEndDimensionPivot):
+        validator = pivot_type(sub_validator)
+        for values in self.arrays:
+          self.assertEqual(
+              validator(self._rows(values)), validator.validate_array(values),
+              (pivot_type, str(sub_validator), values))
+
+  def test_not_implemented_for_non_numeric(self):
+    numpy = validators.numpy
+    validator = validators.DimensionPivot(validators.matches_regex('a.*'))
+    self.assertIs(NotImplemented,
+                  validator.validate_array(numpy.array([1., 2.])))
+    validator = validators.DimensionPivot(validators.in_range(0, 10))
+    self.assertIs(NotImplemented,
+                  validator.validate_array(numpy.array(['a'], dtype=object)))
+    self.assertIs(NotImplemented,
+                  validators.in_range(0, 10).validate_array(
+                      numpy.array([1., 2.])))
+
+
+@unittest.skipIf(validators.numpy is None, 'numpy is not installed.')
+class MeasurementValidateArrayTest(unittest.TestCase):
+
+  def _columnar_measurement(self, validator):
+    measurement = htf.Measurement('sweep').with_dimensions(
+        'hz').with_columnar_storage().with_validator(validator)
+    measurement.measured_value.extend(range(4), [1., 2., 3., 4.])
+    return measurement
+
+  def test_prefers_array_protocol(self):
+    validator = validators.DimensionPivot(validators.in_range(0, 10))
+    with mock.patch.object(
+        validators.DimensionPivot, '__call__',
+        side_effect=AssertionError('should use validate_array')):
+      measurement = self._columnar_measurement(validator)
+      measurement.validate()
+    self.assertEqual(measurements.Outcome.PASS, measurement.outcome)
+
+  def test_falls_back_to_call(self):
+    measurement = self._columnar_measurement(
+        validators.DimensionPivot(validators.matches_regex(r'\d\.0')))
+    measurement.validate()
+    self.assertEqual(measurements.Outcome.PASS, measurement.outcome)
+    measurement = self._columnar_measurement(
+        lambda rows: all(value < 4 for _, value in rows))
+    measurement.validate()
+    self.assertEqual(measurements.Outcome.FAIL, measurement.outcome)
+
+  def test_array_built_only_for_array_validators(self):
+    measurement = self._columnar_measurement(
+        lambda rows: all(value < 5 for _, value in rows))
+    with mock.patch.object(
+        measurements._Column, 'to_array',
+        wraps=measurements._Column.to_array,
+        autospec=True) as to_array:
+      measurement.validate()
+      self.assertEqual(0, to_array.call_count)
+      measurement.with_validator(
+          validators.DimensionPivot(validators.in_range(0, 10)))
+      measurement.with_validator(
+          validators.DimensionPivot(validators.in_range(minimum=1)))
+      measurement.validate()
+      self.assertEqual(1, to_array.call_count)
+    self.assertEqual(measurements.Outcome.PASS, measurement.outcome)
+
+  def test_marginal_array(self):
+    measurement = htf.Measurement('values').with_validator(
+        validators.AllInRangeValidator(
+            0, 10, marginal_minimum=1, marginal_maximum=9))
+    measurement.measured_value.set(validators.numpy.array([5., 9.5]))
+    measurement.validate()
+    self.assertEqual(measurements.Outcome.PASS, measurement.outcome)
+    self.assertTrue(measurement.marginal)